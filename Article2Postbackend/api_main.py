@@ -1,116 +1,75 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTasks, Depends, status
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, BackgroundTasks, Depends, status, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, MutableMapping
 import os
 import uuid
 import shutil
 import tempfile
 import json
+import base64
+import hashlib
+import itertools
 from datetime import datetime
 import logging
 import re
 import time
+import asyncio
 from PIL import Image
 from io import BytesIO
 
 # Import our existing modules
-from services.web_scraper import scrape_text_from_url
+from services.web_scraper import (
+    scrape_text_from_url, close_scraper_session, extract_text_from_html,
+    create_async_scraper_session, fetch_html_async, store_scraped_text
+)
+from services.scrape_cache import get_scrape_cache
+from services.summary_cache import get_summary_cache
 from core.text_processor import clean_encoding_issues
-from utils.json_utils import save_and_clean_json
-from core.image_generator import generate_image_for_text, generate_images_for_bullet_points
-from core.social_post_generator import create_social_media_posts, PLATFORM_CONFIGS
+from core.image_generator import generate_stored_image
+from core.social_post_generator import create_social_media_posts, PLATFORM_CONFIGS, shutdown_social_post_executor
 from core.logo_overlay import add_logo_to_image, save_logo, load_logo
 from core.frame_overlay import apply_frame_with_text, save_frame, load_frame
-from services.openai_client import summarize_with_openai, regenerate_bullet_point_with_openai
+from core.font_registry import font_registry, preload_fonts
+from core.frame_cache import frame_cache
+from services.openai_client import (
+    summarize_with_openai, regenerate_bullet_point_with_openai, close_openai_clients,
+    run_llm_call, shutdown_llm_executor
+)
 from config.config import config
+from utils.image_store import image_store, bullet_point_role, post_role
+from utils.http_caching import CompressionMiddleware, make_etag, not_modified
+from services.article_store import get_article_store, close_article_store, HEAVY_ARTICLE_FIELDS
 
 # Simple cache management functions
 def clear_cache():
     """Clear all cache files"""
     import shutil
-    cache_dirs = ["cache/img", "cache/social_posts", "cache/custom"]
+    cache_dirs = ["cache/img", "cache/social_posts", "cache/custom", "cache/manifests", "cache/tmp"]
     for cache_dir in cache_dirs:
         if os.path.exists(cache_dir):
             try:
                 for file in os.listdir(cache_dir):
-                    if file.endswith(('.jpg', '.png', '.mp3', '.mp4')):
+                    if file.endswith(('.jpg', '.png', '.mp3', '.mp4', '.json')):
                         os.remove(os.path.join(cache_dir, file))
                 logger.info(f"Cleared cache directory: {cache_dir}")
             except Exception as e:
                 logger.error(f"Error clearing cache {cache_dir}: {e}")
 
-def save_article_to_json(article_id, article_data):
-    """Save article data to JSON file for image generation"""
-    try:
-        # Create the data structure for image generation
-        image_data = {
-            "article_id": article_id,
-            "title": article_data["title"],
-            "bullet_point": article_data["bullet_points"][0]["text"] if article_data["bullet_points"] else "",
-            "full_summary": article_data.get("full_summary", ""),
-            "full_text": article_data.get("full_text", ""),
-            "tone": article_data.get("tone", "Neutral"),
-            "created_at": article_data.get("created_at", datetime.now().isoformat()),
-            "word_count": len(article_data["bullet_points"][0]["text"].split()) if article_data["bullet_points"] else 0
-        }
-        
-        # Save to JSON file
-        json_file_path = f"cache/articles_data.json"
-        
-        # Load existing data if file exists
-        existing_data = {}
-        if os.path.exists(json_file_path):
-            try:
-                with open(json_file_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-            except Exception as e:
-                logger.warning(f"Could not load existing JSON data: {e}")
-        
-        # Add new article data
-        existing_data[str(article_id)] = image_data
-        
-        # Save updated data
-        with open(json_file_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=2, ensure_ascii=False)
-        
-        logger.info(f"Article {article_id} data saved to {json_file_path}")
-        
-    except Exception as e:
-        logger.error(f"Error saving article to JSON: {e}")
-
-def load_article_from_json(article_id):
-    """Load article data from JSON file for image generation"""
-    try:
-        json_file_path = f"cache/articles_data.json"
-        if not os.path.exists(json_file_path):
-            return None
-            
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        return data.get(str(article_id))
-        
-    except Exception as e:
-        logger.error(f"Error loading article from JSON: {e}")
-        return None
-
 def clear_cache_selective(article_id=None, bullet_point_ids=None):
     """Clear selective cache files for specific article or bullet points"""
     try:
         if article_id:
-            # Clear files related to specific article
-            cache_patterns = [
-                f"cache/img/point_{article_id}_*.jpg",
-                f"cache/social_posts/*_{article_id}_*.jpg"
-            ]
-            import glob
-            for pattern in cache_patterns:
-                for file in glob.glob(pattern):
-                    os.remove(file)
-                    logger.info(f"Removed cache file: {file}")
+            # Detach the images from the article's manifest; the blobs themselves
+            # are content-addressed and may be shared with other articles
+            if bullet_point_ids:
+                for bullet_point_id in bullet_point_ids:
+                    image_store.forget(article_id, bullet_point_role(bullet_point_id))
+            else:
+                image_store.forget(article_id)
+            logger.info(f"Cleared image manifest entries of article {article_id}")
     except Exception as e:
         logger.error(f"Error in selective cache clear: {e}")
 
@@ -127,6 +86,14 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# Compress JSON response bodies (brotli or gzip); streamed responses pass through
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MIN_SIZE,
+    gzip_level=config.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=config.COMPRESSION_BROTLI_QUALITY
+)
+
 # Add CORS middleware for React frontend
 app.add_middleware(
     CORSMiddleware,
@@ -134,6 +101,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Serve static files (for generated videos, images, etc.)
@@ -148,9 +116,16 @@ class ArticleProcessRequest(BaseModel):
     words_per_point: int = 20
     language: str = "fr"
 
+class ArticleBatchProcessRequest(BaseModel):
+    urls: List[str]
+    slide_count: int = 1
+    words_per_point: int = 20
+    language: str = "fr"
+
 class ImageGenerationRequest(BaseModel):
     text: str
     bullet_point_id: Optional[str] = None
+    article_id: Optional[int] = None  # Limits the database update to this article
 
 class BulletPoint(BaseModel):
     id: int
@@ -191,6 +166,9 @@ class ArticleResponse(BaseModel):
     full_text: Optional[str] = None
     full_summary: Optional[str] = None
 
+# Fields listed by GET /api/articles/ when none are requested (no heavy text)
+DEFAULT_ARTICLE_FIELDS = ["id", "title", "summary", "bullet_points"]
+
 # Video response model removed - focusing on social posts only
 
 class ErrorResponse(BaseModel):
@@ -213,6 +191,7 @@ class BulletPointsRegenerateAllRequest(BaseModel):
     slide_count: int = 1
     words_per_point: int = 20
     language: str = "fr"
+    bypass_cache: bool = True  # Regenerating asks for a new summary: skip the cached one (it is refreshed)
 
 class LogoUploadRequest(BaseModel):
     article_id: int
@@ -244,25 +223,26 @@ class FrameResponse(BaseModel):
     text_lines: Optional[int] = None
     font_size: Optional[int] = None
 
-# In-memory storage for development (replace with database in production)
-articles_db: Dict[str, Dict[str, Any]] = {}  # Changed to string keys to match JSON
+# Articles live in the article store (services.article_store), opened at startup.
+# Keys are normalized, so int and string ids both work; reads return copies,
+# changes are written back with articles_db[id] = article or articles_db.mutate().
+articles_db: MutableMapping = {}
 social_posts_db: Dict[int, Dict[str, Any]] = {}
-next_article_id = 1
+# Social posts only live in this process: their versions (for ETags) are tagged with a per-process epoch
+social_post_versions: Dict[int, int] = {}
+social_post_version_seq = itertools.count(1)
+social_post_epoch = uuid.uuid4().hex[:8]
 next_social_post_id = 1
 
 def load_articles_from_json():
-    """Load articles from JSON file into memory"""
+    """Open the article store (importing articles_db.json on first start)"""
     global articles_db
     try:
-        if os.path.exists("articles_db.json"):
-            with open("articles_db.json", "r", encoding="utf-8") as f:
-                articles_db = json.load(f)
-            logger.info(f"Loaded {len(articles_db)} articles from articles_db.json")
-        else:
-            logger.info("No articles_db.json found, starting with empty database")
+        articles_db = get_article_store()
+        logger.info(f"Loaded {len(articles_db)} articles from the {config.ARTICLE_STORE_BACKEND} article store")
     except Exception as e:
-        logger.error(f"Error loading articles from JSON: {e}")
-        articles_db = {}
+        logger.error(f"Error opening the article store: {e}")
+        raise
 
 # Set up environment and validate configuration
 @app.on_event("startup")
@@ -276,6 +256,9 @@ async def startup_event():
     # Load existing articles from JSON
     load_articles_from_json()
     
+    # Read the fonts once, the frame renderers then reuse cached font objects
+    preload_fonts()
+    
     # Set API keys as environment variables if they exist
     if config.OPENAI_API_KEY:
         os.environ["OPENAI_API_KEY"] = config.OPENAI_API_KEY
@@ -292,6 +275,13 @@ async def startup_event():
 async def shutdown_event():
     """Clean up resources"""
     logger.info("Shutting down Article2SocialPost API...")
+    
+    # Release pooled scraper and OpenAI connections
+    close_scraper_session()
+    shutdown_llm_executor()
+    shutdown_social_post_executor()
+    await close_openai_clients()
+    close_article_store()
 
 # Health check endpoints
 @app.get("/")
@@ -310,6 +300,126 @@ async def health_check():
         "api_keys_configured": config.validate_api_keys()
     }
 
+def structure_bullet_points(article: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Convert the string bullet points of an article to the dictionary format, in place.
+    
+    Args:
+        article (dict): Article record
+        
+    Returns:
+        list: The article's bullet points, all dictionaries
+    """
+    bullet_points = article.get("bullet_points", [])
+    for i, bp in enumerate(bullet_points):
+        if isinstance(bp, str):
+            bullet_points[i] = {
+                'id': i + 1,
+                'text': bp,
+                'order': i + 1,
+                'image_path': None,
+                'audio_path': None
+            }
+    return bullet_points
+
+def touch_social_post(social_post_id: int) -> None:
+    """Give a social post a new version after changing it, so that its ETag changes"""
+    social_post_versions[social_post_id] = next(social_post_version_seq)
+
+def article_list_item(article: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """
+    Project an article on ArticleResponse fields, with bullet points in the dictionary format.
+    
+    Args:
+        article (dict): Article record
+        fields (list): ArticleResponse fields to include
+        
+    Returns:
+        dict: JSON-ready article
+    """
+    item = {}
+    for field in fields:
+        if field == "bullet_points":
+            item[field] = [
+                {
+                    'id': i + 1, 'text': bp, 'order': i + 1, 'image_path': None, 'audio_path': None
+                } if isinstance(bp, str) else {
+                    'id': bp.get('id', i + 1),
+                    'text': bp.get('text', ''),
+                    'order': bp.get('order', i + 1),
+                    'image_path': bp.get('image_path'),
+                    'audio_path': bp.get('audio_path')
+                }
+                for i, bp in enumerate(article.get("bullet_points", []))
+            ]
+        elif field == "full_summary":
+            item[field] = article.get("full_summary", "")
+        else:
+            item[field] = article.get(field)
+    return item
+
+def encode_article_cursor(sort_key) -> str:
+    """Encode the (created_at, id) sort key of the last listed article as an opaque cursor"""
+    return base64.urlsafe_b64encode(json.dumps(list(sort_key)).encode("utf-8")).decode("ascii")
+
+def decode_article_cursor(cursor: str):
+    """Decode a cursor of encode_article_cursor, raising a 400 error if it is invalid"""
+    try:
+        created_at, article_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if isinstance(created_at, str) and isinstance(article_id, int) and not isinstance(article_id, bool):
+            return (created_at, article_id)
+    except (ValueError, TypeError):
+        pass
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def create_article_record(title: str, article_text: str, summary_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create, store and persist a new article from its text and generated summary.
+    
+    Args:
+        title (str): Article title
+        article_text (str): Cleaned article text
+        summary_data (dict): Result of summarize_with_openai
+        
+    Returns:
+        dict: The stored article record
+    """
+    # Create bullet point from the single bullet_point returned
+    bullet_points_data = [{
+        "id": 1,
+        "text": summary_data.get("bullet_point", "No summary available"),
+        "order": 1,
+        "image_path": None,
+        "audio_path": None
+    }]
+    
+    def build_article(article_id):
+        return {
+            "id": article_id,
+            "title": title,
+            "summary": summary_data.get("bullet_point", "No summary available"),
+            "bullet_points": bullet_points_data, # Store the structured data
+            "full_text": article_text,
+            "full_summary": summary_data.get("full_summary", ""),  # Store the complete article summary
+            "tone": summary_data.get("tone", "Neutral"),
+            "created_at": datetime.now().isoformat()
+        }
+    
+    # Store article: the id is allocated by the store, under its write lock, so that
+    # workers and scripts sharing the store never hand out the same id
+    return articles_db.insert(build_article)
+
+def article_to_response(article: Dict[str, Any]) -> ArticleResponse:
+    """Build the ArticleResponse for a freshly created article"""
+    return ArticleResponse(
+        id=article["id"],
+        title=article["title"],
+        summary=article["summary"],
+        bullet_points=[BulletPoint(**bp) for bp in article["bullet_points"]],
+        full_text=article.get("full_text"),
+        full_summary=article.get("full_summary", "")
+    )
+
 # Article processing endpoints
 @app.post("/api/articles/process/", response_model=ArticleResponse)
 def process_article_sync(request: ArticleProcessRequest):
@@ -317,8 +427,6 @@ def process_article_sync(request: ArticleProcessRequest):
     Process an article from URL or text and generate bullet points.
     NOTE: This is a synchronous endpoint to avoid blocking the event loop.
     """
-    global next_article_id
-    
     try:
         logger.info(f"Processing article request: URL={bool(request.url)}, Text={bool(request.text)}")
         
@@ -344,54 +452,18 @@ def process_article_sync(request: ArticleProcessRequest):
         logger.info(f"Generating summary: {request.slide_count} slides, {request.words_per_point} words per slide, language: {request.language}")
         summary_data = summarize_with_openai(
             article_text, 
-            request.language
+            request.language,
+            clean_input=False  # Already cleaned
         )
         
         if not summary_data or "bullet_point" not in summary_data:
             raise HTTPException(status_code=500, detail="Failed to generate article summary")
         
-        # Create article record
-        article_id = next_article_id
-        next_article_id += 1
-        
-        # Create bullet point from the single bullet_point returned
-        bullet_points_data = [{
-            "id": 1,
-            "text": summary_data.get("bullet_point", "No summary available"),
-            "order": 1,
-                "image_path": None,
-                "audio_path": None
-        }]
-
-        # Create Pydantic models for the response
-        bullet_point_models = [BulletPoint(**bp) for bp in bullet_points_data]
-
-        # Store article
-        article = {
-            "id": article_id,
-            "title": title,
-            "summary": summary_data.get("bullet_point", "No summary available"),
-            "bullet_points": bullet_points_data, # Store the structured data
-            "full_text": article_text,
-            "full_summary": summary_data.get("full_summary", ""),  # Store the complete article summary
-            "tone": summary_data.get("tone", "Neutral"),
-            "created_at": datetime.now().isoformat()
-        }
-        articles_db[str(article_id)] = article
-        
-        # Save article data to JSON file for image generation
-        save_article_to_json(article_id, article)
+        article = create_article_record(title, article_text, summary_data)
         
-        logger.info(f"Article processed successfully with ID: {article_id}")
+        logger.info(f"Article processed successfully with ID: {article['id']}")
         
-        return ArticleResponse(
-            id=article_id,
-            title=article["title"],
-            summary=article["summary"],
-            bullet_points=bullet_point_models,
-            full_text=article_text,
-            full_summary=article.get("full_summary", "")
-        )
+        return article_to_response(article)
         
     except HTTPException:
         raise
@@ -399,14 +471,127 @@ def process_article_sync(request: ArticleProcessRequest):
         logger.error(f"Error processing article: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing article: {str(e)}")
 
+async def process_batch_url(index: int, url: str, request: ArticleBatchProcessRequest, session,
+                            parse_semaphore: asyncio.Semaphore,
+                            summarize_semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """
+    Run one URL of a batch through the fetch -> parse -> summarize -> store pipeline.
+    
+    Each stage is bounded independently (per-host connection limits for fetch,
+    semaphores for parse and summarize), so while one article is being
+    summarized the next ones are already being fetched and parsed.
+    
+    Returns:
+        dict: One NDJSON result line (status "success" with the article, or "error")
+    """
+    try:
+        # Stage 1: fetch (asyncio, per-host limits from the connector, conditional GET)
+        page = await fetch_html_async(session, url)
+        
+        # Stage 2: parse + clean (CPU bound, off the event loop). Skipped on a 304.
+        async with parse_semaphore:
+            raw_text = page["cached_text"]
+            if raw_text is None:
+                raw_text = await asyncio.to_thread(extract_text_from_html, page["content"])
+                await asyncio.to_thread(store_scraped_text, url, page["headers"], raw_text, page["had_entry"])
+            article_text = await asyncio.to_thread(clean_encoding_issues, raw_text)
+        
+        if not article_text.strip():
+            raise ValueError("No content could be extracted from the article")
+        
+        # Stage 3: summarize (blocking LLM call, on the LLM thread pool)
+        async with summarize_semaphore:
+            summary_data = await run_llm_call(
+                summarize_with_openai, article_text, request.language, clean_input=False
+            )
+        
+        if not summary_data or "bullet_point" not in summary_data:
+            raise ValueError("Failed to generate article summary")
+        
+        # Stage 4: store (blocking: SQLite write lock or journal fsync, off the event loop)
+        article = await asyncio.to_thread(create_article_record, f"Article from {url}", article_text, summary_data)
+        logger.info(f"Batch item {index} processed successfully with ID: {article['id']}")
+        
+        return {
+            "index": index,
+            "url": url,
+            "status": "success",
+            "article": article_to_response(article).dict()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error processing batch item {index} ({url}): {str(e)}")
+        return {
+            "index": index,
+            "url": url,
+            "status": "error",
+            "error": str(e)
+        }
+
+async def stream_batch_results(request: ArticleBatchProcessRequest):
+    """
+    Process all URLs of a batch concurrently and yield one JSON line per article
+    as soon as it finishes (completion order, not request order).
+    """
+    parse_semaphore = asyncio.Semaphore(config.BATCH_PARSE_CONCURRENCY)
+    summarize_semaphore = asyncio.Semaphore(config.BATCH_SUMMARIZE_CONCURRENCY)
+    
+    async with create_async_scraper_session() as session:
+        tasks = [
+            asyncio.create_task(
+                process_batch_url(index, url, request, session, parse_semaphore, summarize_semaphore)
+            )
+            for index, url in enumerate(request.urls)
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                result = await finished
+                yield json.dumps(result, ensure_ascii=False) + "\n"
+        finally:
+            # Client went away: don't leave orphaned fetches/summaries running
+            for task in tasks:
+                task.cancel()
+    
+    logger.info(f"Batch of {len(request.urls)} URLs completed")
+
+@app.post("/api/articles/process-batch/")
+async def process_articles_batch(request: ArticleBatchProcessRequest):
+    """
+    Process several article URLs concurrently.
+    
+    Results are streamed back as newline-delimited JSON (one object per article)
+    in the order they complete.
+    """
+    urls = [url.strip() for url in request.urls if url and url.strip()]
+    if not urls:
+        raise HTTPException(status_code=400, detail="At least one URL must be provided")
+    if len(urls) > config.BATCH_MAX_URLS:
+        raise HTTPException(status_code=400, detail=f"Too many URLs. Maximum per batch: {config.BATCH_MAX_URLS}")
+    
+    request.urls = urls
+    logger.info(f"Processing batch of {len(urls)} URLs")
+    
+    return StreamingResponse(stream_batch_results(request), media_type="application/x-ndjson")
+
 @app.get("/api/articles/{article_id}/")
-async def get_article(article_id: int):
+async def get_article(article_id: int, request: Request, response: Response):
     """Get a specific article by ID"""
-    article_key = str(article_id)
-    if article_key not in articles_db:
+    # Version first: a write landing before the read below only makes the next poll a 200 again
+    version = articles_db.version(article_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    article = articles_db[article_key]
+    etag = make_etag("article", article_id, version)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    
+    try:
+        article = articles_db[article_id]
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Article not found")
     bullet_points = []
     
     # Handle both string and dictionary formats
@@ -440,42 +625,49 @@ async def get_article(article_id: int):
     )
 
 @app.get("/api/articles/")
-async def get_articles():
-    """Get all articles"""
-    articles = []
-    for article in articles_db.values():
-        bullet_points = []
-        
-        # Handle both string and dictionary formats
-        for i, bp in enumerate(article["bullet_points"]):
-            if isinstance(bp, str):
-                # Convert string to BulletPoint model
-                bullet_points.append(BulletPoint(
-                    id=i+1, 
-                    text=bp, 
-                    order=i+1,
-                    image_path=None,
-                    audio_path=None
-                ))
-            else:
-                # Convert dictionary to BulletPoint model
-                bullet_points.append(BulletPoint(
-                    id=bp.get('id', i+1),
-                    text=bp.get('text', ''),
-                    order=bp.get('order', i+1),
-                    image_path=bp.get('image_path'),
-                    audio_path=bp.get('audio_path')
-                ))
-                
-        articles.append(ArticleResponse(
-            id=article["id"],
-            title=article["title"],
-            summary=article["summary"],
-            bullet_points=bullet_points,
-            full_text=article.get("full_text"),
-            full_summary=article.get("full_summary", "")
-        ))
-    return articles
+async def get_articles(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = config.ARTICLES_PAGE_SIZE,
+    fields: Optional[str] = None,
+    order: str = "asc"
+):
+    """
+    List articles by creation date, one page at a time.
+    
+    The cursor of the next page is returned in the X-Next-Cursor header (absent on
+    the last page). full_text and full_summary are only included when requested
+    with fields, e.g. fields=id,title,full_text.
+    """
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="Invalid order. Must be 'asc' or 'desc'")
+    if not 1 <= limit <= config.ARTICLES_PAGE_MAX:
+        raise HTTPException(status_code=400, detail=f"Invalid limit. Must be between 1 and {config.ARTICLES_PAGE_MAX}")
+    selected = DEFAULT_ARTICLE_FIELDS
+    if fields:
+        selected = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in selected if field not in ArticleResponse.__annotations__]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    after = decode_article_cursor(cursor) if cursor else None
+    
+    # Any article write changes the store version, and with it the ETag of every page
+    page_id = json.dumps([articles_db.version(), cursor, limit, selected, order])
+    etag = make_etag("articles", hashlib.sha1(page_id.encode("utf-8")).hexdigest()[:20])
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    page = articles_db.page(
+        after=after,
+        limit=limit,
+        descending=order == "desc",
+        heavy=any(field in HEAVY_ARTICLE_FIELDS for field in selected)
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if len(page) == limit:
+        headers["X-Next-Cursor"] = encode_article_cursor(page[-1][0])
+    return JSONResponse(content=[article_list_item(article, selected) for _, article in page], headers=headers)
 
 # Video generation removed - focusing on social media posts only
 
@@ -517,6 +709,7 @@ async def generate_social_posts_endpoint(request: SocialPostGenerationRequest, b
             "posts": {},
             "download_urls": {}
         }
+        touch_social_post(social_post_id)
         
         # Start background task for social post generation
         background_tasks.add_task(
@@ -555,13 +748,16 @@ async def generate_social_posts_task(social_post_id: int, article_id: int,
         
         # Prepare article data for social post generation
         article_data = {
+            "id": article_id,
             "summary": [bp['text'] for bp in bullet_points],
+            "bullet_points": article.get("bullet_points", []),
             "full_text": article.get("full_text", ""),
             "title": article.get("title", "")
         }
         
-        # Generate social media posts
-        posts_result = create_social_media_posts(
+        # Generate social media posts (blocking LLM/image calls, on the LLM thread pool)
+        posts_result = await run_llm_call(
+            create_social_media_posts,
             article_data=article_data,
             platforms=platforms,
             language=language,
@@ -572,6 +768,7 @@ async def generate_social_posts_task(social_post_id: int, article_id: int,
         if "error" in posts_result:
             social_posts_db[social_post_id]["status"] = "failed"
             social_posts_db[social_post_id]["error"] = posts_result["error"]
+            touch_social_post(social_post_id)
             return
         
         # Convert to SocialPost models and update database
@@ -605,6 +802,7 @@ async def generate_social_posts_task(social_post_id: int, article_id: int,
             "posts": {platform: post.dict() for platform, post in formatted_posts.items()},
             "download_urls": download_urls
         })
+        touch_social_post(social_post_id)
         
         logger.info(f"Social post generation completed for social_post_id: {social_post_id}")
             
@@ -614,13 +812,21 @@ async def generate_social_posts_task(social_post_id: int, article_id: int,
         logger.error(f"Traceback: {traceback.format_exc()}")
         social_posts_db[social_post_id]["status"] = "failed"
         social_posts_db[social_post_id]["error"] = str(e)
+        touch_social_post(social_post_id)
 
 @app.get("/api/social-posts/{social_post_id}/")
-async def get_social_post(social_post_id: int):
+async def get_social_post(social_post_id: int, request: Request, response: Response):
     """Get social post status and details"""
     if social_post_id not in social_posts_db:
         raise HTTPException(status_code=404, detail="Social post not found")
     
+    etag = make_etag("social-post", social_post_id, social_post_epoch, social_post_versions.get(social_post_id, 0))
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    
     social_post = social_posts_db[social_post_id]
     
     # Convert posts data back to SocialPost models for response
@@ -654,10 +860,14 @@ async def download_social_post_image(social_post_id: int, platform: str):
     if not image_path:
         raise HTTPException(status_code=404, detail=f"No image available for platform {platform}")
     
-    abs_image_path = os.path.abspath(image_path)
-    if not os.path.exists(abs_image_path):
+    # Content-addressed blobs are immutable, so the path stored with the post is still its image
+    image_path = (image_store.resolve(image_path)
+                  or image_store.lookup(social_post["article_id"], post_role(platform)))
+    if not image_path:
         raise HTTPException(status_code=404, detail="Image file not found")
     
+    abs_image_path = os.path.abspath(image_path)
+    
     return FileResponse(
         path=abs_image_path,
         media_type='image/jpeg',
@@ -676,7 +886,7 @@ async def get_available_platforms():
 @app.post("/api/images/generate/")
 def generate_image(request: ImageGenerationRequest):
     """
-    Generate an image for a given text, ensuring the correct naming convention.
+    Generate an image for a given text and store it in the content-addressed image store.
     """
     try:
         logger.info(f"Received request to generate image for text: '{request.text[:50]}...' with bullet_point_id: {request.bullet_point_id}")
@@ -686,67 +896,39 @@ def generate_image(request: ImageGenerationRequest):
             logger.error("Empty or whitespace-only text provided for image generation")
             raise HTTPException(status_code=422, detail="Text field cannot be empty or contain only whitespace")
         
-        output_filename = None
         bp_id_int = None
 
         if request.bullet_point_id:
             try:
                 # The ID from the frontend is the correct index for the bullet point
                 bp_id_int = int(request.bullet_point_id)
-                # Use the standardized naming convention: point_XX.jpg
-                output_filename = f"cache/img/point_{bp_id_int:02d}.jpg"
-                logger.info(f"Using standardized filename for regenerated image: {output_filename}")
             except (ValueError, TypeError) as e:
-                logger.warning(f"Could not parse bullet_point_id '{request.bullet_point_id}': {e}. A hash-based filename will be used instead.")
-        
-        # Call the image generator, forcing regeneration with the correct filename
-        result_path = generate_image_for_text(
-            text=request.text,
-            output_file=output_filename,  # Pass the specific, correct filename
-            index=bp_id_int,             # Pass the index as a fallback
-            force_regenerate=True
-        )
+                logger.warning(f"Could not parse bullet_point_id '{request.bullet_point_id}': {e}. The image will not be attached to a bullet point.")
         
-        # Double-check that the result path uses the correct naming convention
-        if bp_id_int:
-            # Fix the path if it doesn't match our convention
-            correct_path = os.path.join("cache/img", f"point_{bp_id_int:02d}.jpg")
-            if os.path.exists(result_path) and result_path != correct_path:
-                try:
-                    # Rename the file to follow our convention
-                    shutil.copy(result_path, correct_path)
-                    os.remove(result_path)
-                    result_path = correct_path
-                    logger.info(f"Renamed image file to follow naming convention: {result_path}")
-                except Exception as rename_error:
-                    logger.error(f"Error renaming image file: {rename_error}")
+        # Generate into the content-addressed image store: each result gets its own
+        # hash-named blob, so concurrent requests never overwrite each other's images
+        result_path = generate_stored_image(request.text)
         
         # CRITICAL FIX: Update the database with the image path
         if bp_id_int and result_path and os.path.exists(result_path):
-            # Find the article that contains this bullet point
-            for article_id, article_data in articles_db.items():
-                bullet_points = article_data.get("bullet_points", [])
-                
-                # Convert bullet points to dictionary format if they're strings
-                for i, bp in enumerate(bullet_points):
-                    if isinstance(bp, str):
-                        bullet_points[i] = {
-                            'id': i + 1,
-                            'text': bp,
-                            'order': i + 1,
-                            'image_path': None,
-                            'audio_path': None
-                        }
-                
+            def attach_image(article_data):
                 # Update the specific bullet point with the image path
-                for bp in bullet_points:
-                    if isinstance(bp, dict) and bp.get('id') == bp_id_int:
+                for bp in structure_bullet_points(article_data):
+                    if bp.get('id') == bp_id_int:
                         bp['image_path'] = os.path.basename(result_path)  # Store just the filename
-                        logger.info(f"Updated database: bullet point {bp_id_int} in article {article_id} now has image_path: {bp['image_path']}")
-                        break
-                
-                # Save the updated article data
-                save_article_to_json(article_id, article_data)
+                        return True
+                return False
+            
+            # Find the article(s) that contain this bullet point
+            article_ids = [request.article_id] if request.article_id is not None else list(articles_db)
+            for article_id in article_ids:
+                try:
+                    attached = articles_db.mutate(article_id, attach_image)  # One row written per article
+                except KeyError:
+                    continue
+                if attached:
+                    image_store.record(article_id, bullet_point_role(bp_id_int), result_path)
+                    logger.info(f"Updated database: bullet point {bp_id_int} in article {article_id} now has image_path: {os.path.basename(result_path)}")
         
         # The result_path is the full path; we need to return a URL path for the frontend
         image_url_path = os.path.basename(result_path)
@@ -792,33 +974,22 @@ async def update_bullet_point(article_id: int, bullet_point_id: int, request: Bu
         if article_id not in articles_db:
             raise HTTPException(status_code=404, detail="Article not found")
         
-        article = articles_db[article_id]
-        bullet_points = article["bullet_points"]
-        
-        # Check if bullet point exists (1-indexed)
-        if bullet_point_id < 1 or bullet_point_id > len(bullet_points):
-            raise HTTPException(status_code=404, detail="Bullet point not found")
-        
-        # Convert bullet points to dictionary format if they're strings
-        for i, bp in enumerate(bullet_points):
-            if isinstance(bp, str):
-                # Convert string to dictionary
-                bullet_points[i] = {
-                    'id': i + 1,
-                    'text': bp,
-                    'order': i + 1,
-                    'image_path': None,
-                    'audio_path': None
-                }
-        
-        # Update the bullet point text (convert to 0-indexed)
-        # The text should already contain quotes for highlighted words from the frontend
-        idx = bullet_point_id - 1
-        if isinstance(bullet_points[idx], dict):
+        def update_text(article):
+            # Convert bullet points to dictionary format if they're strings
+            bullet_points = structure_bullet_points(article)
+            
+            # Check if bullet point exists (1-indexed)
+            if bullet_point_id < 1 or bullet_point_id > len(bullet_points):
+                raise HTTPException(status_code=404, detail="Bullet point not found")
+            
+            # Update the bullet point text (convert to 0-indexed)
+            # The text should already contain quotes for highlighted words from the frontend
+            idx = bullet_point_id - 1
             bullet_points[idx]['text'] = request.text
             bullet_points[idx]['image_path'] = None  # Reset image path when text changes
-        else:
-            bullet_points[idx] = request.text
+        
+        # Read, update and write back this article only
+        articles_db.mutate(article_id, update_text)
         
         logger.info(f"Updated bullet point {bullet_point_id} for article {article_id}: {request.text}")
         
@@ -879,8 +1050,9 @@ async def regenerate_bullet_point(article_id: int, bullet_point_id: int, request
         if not context:
             context = article.get("full_text", "")
         
-        # Call the new specific OpenAI function for regeneration
-        new_text = regenerate_bullet_point_with_openai(
+        # Call the new specific OpenAI function for regeneration (on the LLM thread pool)
+        new_text = await run_llm_call(
+            regenerate_bullet_point_with_openai,
             original_text=original_text,
             context=context,
             language=request.language,
@@ -890,16 +1062,19 @@ async def regenerate_bullet_point(article_id: int, bullet_point_id: int, request
         if not new_text or not isinstance(new_text, str):
             raise HTTPException(status_code=500, detail="Failed to regenerate bullet point content from OpenAI.")
 
-        # Update the bullet point text in our "database"
-        target_bullet_point["text"] = new_text
-
         # Clear associated cached files (image, audio) for this bullet point
         clear_cache_selective(article_id, [bullet_point_id])
-        # Also remove any custom uploaded image association
-        target_bullet_point["image_path"] = None
         
-        # Save the updated article data back to the 'DB'
-        save_and_clean_json(articles_db, 'articles_db.json')
+        def apply_new_text(article):
+            for bp in structure_bullet_points(article):
+                if bp['id'] == bullet_point_id:
+                    # Update the bullet point text in our "database"
+                    bp["text"] = new_text
+                    # Also remove any custom uploaded image association
+                    bp["image_path"] = None
+        
+        # Save the updated article back to the store (re-read: other bullet points may have changed meanwhile)
+        articles_db.mutate(article_id, apply_new_text)
 
         return JSONResponse(content={"message": "Bullet point regenerated successfully", "new_text": new_text}, status_code=200)
 
@@ -912,7 +1087,8 @@ async def upload_bullet_point_image(article_id: int, bullet_point_id: int, file:
     """
     Uploads an image for a specific bullet point, replacing the existing one.
     Processes the image to match the dimensions and format of AI-generated images.
-    The uploaded image will be saved as point_XX.jpg in cache/img/ directory.
+    The uploaded image is stored as a hash-named blob in cache/img/ and recorded
+    in the article's image manifest.
     """
     try:
         # Validate article and bullet point existence
@@ -953,19 +1129,6 @@ async def upload_bullet_point_image(article_id: int, bullet_point_id: int, file:
         if not bullet_point_to_update:
             raise HTTPException(status_code=404, detail=f"Bullet point with id {bullet_point_id} not found in article {article_id}.")
 
-        # Use the new naming convention for the uploaded image
-        # Format: point_XX.jpg where XX is the zero-padded bullet point ID
-        filename = f"point_{bullet_point_id:02d}.jpg"
-        save_locations = [
-            os.path.join("cache", "img", filename),
-            os.path.join("Article2Video", "cache", "img", filename),
-            os.path.join("static", "img", filename)
-        ]
-        
-        # Create directories if they don't exist
-        for file_path in save_locations:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
         # Read the file content once
         file_content = await file.read()
         
@@ -1014,20 +1177,20 @@ async def upload_bullet_point_image(article_id: int, bullet_point_id: int, file:
         except Exception as e:
             logger.warning(f"Error processing image: {e}. Using original image.")
         
-        # Save the processed image to all required locations
-        for file_path in save_locations:
-            try:
-                with open(file_path, "wb") as buffer:
-                    buffer.write(file_content)
-                logger.info(f"Saved uploaded image to {file_path}")
-            except Exception as e:
-                logger.warning(f"Failed to save to {file_path}: {e}")
+        # Store the processed image under its content hash
+        blob_path = image_store.save_bytes(file_content)
+        image_store.record(article_id, bullet_point_role(bullet_point_id), blob_path)
+        filename = os.path.basename(blob_path)
+        logger.info(f"Saved uploaded image to {blob_path}")
         
-        # Update the image path in the article data with the new naming convention
-        bullet_point_to_update['image_path'] = filename
+        def set_image_path(article):
+            for bp in structure_bullet_points(article):
+                if bp['id'] == bullet_point_id:
+                    # Update the image path in the article data
+                    bp['image_path'] = filename
 
-        # Save the updated article data back to the 'DB'
-        save_and_clean_json(articles_db, 'articles_db.json')
+        # Save the updated article back to the store
+        articles_db.mutate(article_id, set_image_path)
 
         return JSONResponse(content={
             "message": "Image uploaded successfully", 
@@ -1043,35 +1206,28 @@ async def upload_bullet_point_image(article_id: int, bullet_point_id: int, file:
 @app.delete("/api/articles/{article_id}/bullet-points/{bullet_point_id}/delete-image/")
 async def delete_bullet_point_image(article_id: int, bullet_point_id: int):
     """
-    Delete the image file for a specific bullet point and clear its image_path.
+    Detach the image of a specific bullet point and clear its image_path.
     """
     try:
         if article_id not in articles_db:
             raise HTTPException(status_code=404, detail=f"Article with id {article_id} not found.")
-        article = articles_db[article_id]
-        bullet_points = article['bullet_points']
-        # Find the bullet point
-        bullet_point = None
-        for bp in bullet_points:
-            if bp['id'] == bullet_point_id:
-                bullet_point = bp
-                break
-        if not bullet_point:
-            raise HTTPException(status_code=404, detail=f"Bullet point with id {bullet_point_id} not found.")
-        # Determine the filename
-        filename = f"point_{bullet_point_id:02d}.jpg"
-        deleted = False
-        for folder in ["cache/img", "static/img", "Article2Video/cache/img", "Article2Video/static/img"]:
-            file_path = os.path.join(folder, filename)
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                    deleted = True
-                except Exception as e:
-                    pass
-        # Clear the image_path
-        bullet_point['image_path'] = ''
-        save_and_clean_json(articles_db, 'articles_db.json')
+        def clear_image_path(article):
+            # Find the bullet point
+            bullet_point = None
+            for bp in article['bullet_points']:
+                if bp['id'] == bullet_point_id:
+                    bullet_point = bp
+                    break
+            if not bullet_point:
+                raise HTTPException(status_code=404, detail=f"Bullet point with id {bullet_point_id} not found.")
+            had_image = bool(bullet_point.get('image_path'))
+            # Clear the image_path
+            bullet_point['image_path'] = ''
+            return had_image
+        had_image = articles_db.mutate(article_id, clear_image_path)
+        # Detach the image; the blob is content-addressed and may be shared with other articles
+        deleted = bool(had_image or image_store.lookup(article_id, bullet_point_role(bullet_point_id)))
+        image_store.forget(article_id, bullet_point_role(bullet_point_id))
         return {"message": "Image deleted successfully", "deleted": deleted}
     except HTTPException as http_exc:
         raise http_exc
@@ -1093,22 +1249,31 @@ async def regenerate_all_bullet_points(article_id: int, request: BulletPointsReg
         
         # Use the same summarization logic as the original article processing
         logger.info(f"Regenerating all bullet points for article {article_id}")
-        summary_data = summarize_with_openai(
+        summary_data = await run_llm_call(
+            summarize_with_openai,
             article_text, 
-            request.language
+            request.language,
+            clean_input=False,  # Already cleaned
+            use_cache=not request.bypass_cache
         )
         
         if not summary_data or "bullet_point" not in summary_data:
             raise HTTPException(status_code=500, detail="Failed to regenerate bullet points")
         
-        # Update the article with new bullet point
-        article["bullet_points"] = [{
-            "id": 1,
-            "text": summary_data.get("bullet_point", "No summary available"),
-            "order": 1,
-            "image_path": None,
-            "audio_path": None
-        }]
+        # Update the article with new bullet point (re-read: the article may have changed during the LLM call)
+        def replace_bullet_points(article):
+            article["bullet_points"] = [{
+                "id": 1,
+                "text": summary_data.get("bullet_point", "No summary available"),
+                "order": 1,
+                "image_path": None,
+                "audio_path": None
+            }]
+        
+        try:
+            articles_db.mutate(article_id, replace_bullet_points)
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Article not found")
         
         # Convert to response format
         bullet_points = [BulletPoint(
@@ -1232,6 +1397,19 @@ async def clear_cache_endpoint():
         logger.error(f"Error clearing cache: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error clearing cache: {str(e)}")
 
+@app.get("/api/cache/stats/")
+async def get_cache_stats():
+    """Get hit/miss statistics of the application caches"""
+    scrape_cache = get_scrape_cache()
+    summary_cache = get_summary_cache()
+    return {
+        "scrape": scrape_cache.stats() if scrape_cache else {"enabled": False},
+        "summary": summary_cache.stats() if summary_cache else {"enabled": False},
+        "images": image_store.get_stats(),
+        "fonts": font_registry.get_stats(),
+        "frames": frame_cache.get_stats()
+    }
+
 # ==========================================
 # LOGO MANAGEMENT ENDPOINTS
 # ==========================================
@@ -1305,8 +1483,8 @@ async def apply_logo_to_article(
             article = articles_db[str(article_id)]
             if "bullet_points" in article:
                 for bullet_point in article["bullet_points"]:
-                    if bullet_point.get("image_path") and os.path.exists(bullet_point["image_path"]):
-                        image_path = bullet_point["image_path"]
+                    image_path = image_store.resolve(bullet_point.get("image_path"))
+                    if image_path:
                         logger.info(f"Found image for article {article_id}: {image_path}")
                         break
         
@@ -1316,8 +1494,8 @@ async def apply_logo_to_article(
             for aid, article in articles_db.items():
                 if "bullet_points" in article:
                     for bullet_point in article["bullet_points"]:
-                        if bullet_point.get("image_path") and os.path.exists(bullet_point["image_path"]):
-                            image_path = bullet_point["image_path"]
+                        image_path = image_store.resolve(bullet_point.get("image_path"))
+                        if image_path:
                             logger.info(f"Found alternative image from article {aid}: {image_path}")
                             break
                 if image_path:
@@ -1375,14 +1553,16 @@ async def apply_logo_to_article(
         result_path = result["output_path"]
         
         # 6. Mettre à jour la base de données avec le chemin de l'image avec logo
-        if str(article_id) in articles_db:
-            article = articles_db[str(article_id)]
-            if "bullet_points" in article:
-                for bullet_point in article["bullet_points"]:
+        if article_id in articles_db:
+            def set_image_paths(article):
+                bullet_points = article.get("bullet_points", [])
+                for bullet_point in bullet_points:
                     bullet_point["image_path"] = result_path
+                return [bullet_point["id"] for bullet_point in bullet_points]
             
-            # Sauvegarder les changements
-            save_article_to_json(article_id, article)
+            # Sauvegarder les changements (une seule ligne écrite)
+            for bullet_point_id in articles_db.mutate(article_id, set_image_paths):
+                image_store.record(article_id, bullet_point_role(bullet_point_id), result_path)
         
         logger.info(f"Logo applied successfully to {result_path}")
         return {
@@ -1506,8 +1686,8 @@ async def apply_frame_to_article(
             article = articles_db[str(article_id)]
             if "bullet_points" in article:
                 for bullet_point in article["bullet_points"]:
-                    if bullet_point.get("image_path") and os.path.exists(bullet_point["image_path"]):
-                        image_path = bullet_point["image_path"]
+                    image_path = image_store.resolve(bullet_point.get("image_path"))
+                    if image_path:
                         logger.info(f"Found image for article {article_id}: {image_path}")
                         break
         
@@ -1517,8 +1697,8 @@ async def apply_frame_to_article(
             for aid, article in articles_db.items():
                 if "bullet_points" in article:
                     for bullet_point in article["bullet_points"]:
-                        if bullet_point.get("image_path") and os.path.exists(bullet_point["image_path"]):
-                            image_path = bullet_point["image_path"]
+                        image_path = image_store.resolve(bullet_point.get("image_path"))
+                        if image_path:
                             logger.info(f"Found alternative image from article {aid}: {image_path}")
                             break
                 if image_path:
@@ -1587,14 +1767,16 @@ async def apply_frame_to_article(
         result_path = result["output_path"]
         
         # 7. Mettre à jour la base de données avec le chemin de l'image avec frame + logo
-        if str(article_id) in articles_db:
-            article = articles_db[str(article_id)]
-            if "bullet_points" in article:
-                for bullet_point in article["bullet_points"]:
+        if article_id in articles_db:
+            def set_image_paths(article):
+                bullet_points = article.get("bullet_points", [])
+                for bullet_point in bullet_points:
                     bullet_point["image_path"] = result_path
+                return [bullet_point["id"] for bullet_point in bullet_points]
             
-            # Sauvegarder les changements
-            save_article_to_json(article_id, article)
+            # Sauvegarder les changements (une seule ligne écrite)
+            for bullet_point_id in articles_db.mutate(article_id, set_image_paths):
+                image_store.record(article_id, bullet_point_role(bullet_point_id), result_path)
         
         # 8. Informations sur le frame intelligent utilisé
         smart_frame_info = ""
@@ -1636,6 +1818,7 @@ async def remove_persistent_frame():
         frame_path = "cache/frame.png"
         if os.path.exists(frame_path):
             os.remove(frame_path)
+            frame_cache.invalidate(frame_path)
             return {
                 "status": "success",
                 "message": "Persistent frame removed successfully"
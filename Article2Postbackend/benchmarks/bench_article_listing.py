@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GET /api/articles/ response time and size as the corpus grows (api_main.get_articles).
+
+Fills each article store backend with synthetic articles (--text-bytes of
+full_text and summary) and, at each checkpoint, times:
+
+- legacy: the former listing, an ArticleResponse model with every
+  article's full_text and full_summary, serialized as one JSON body
+- page: the first page of get_articles (default fields, no heavy text)
+- deep page: the page after a cursor taken from the middle of the corpus
+
+Checks beforehand that walking every page with the X-Next-Cursor header
+lists each article once, in (created_at, id) order.
+
+Usage:
+    python benchmarks/bench_article_listing.py --checkpoints 1000 10000 --limit 50
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from fastapi.encoders import jsonable_encoder
+from starlette.requests import Request
+import api_main
+from api_main import ArticleResponse, BulletPoint, get_articles, encode_article_cursor
+from services.article_store import SQLiteArticleStore, JournalArticleStore, LazyArticleStore
+
+def make_article(article_id, text_bytes):
+    return {
+        "id": article_id,
+        "title": f"Article {article_id}",
+        "summary": f"Résumé de l'article {article_id}",
+        "bullet_points": [{"id": 1, "text": f"Point clé {article_id}", "order": 1, "image_path": None, "audio_path": None}],
+        "full_text": ("Texte de l'article. " * (text_bytes // 20 + 1))[:text_bytes],
+        "full_summary": ("Résumé complet. " * (text_bytes // 32 + 1))[:text_bytes // 2],
+        "tone": "Neutral",
+        "created_at": f"2025-01-{article_id % 28 + 1:02d}T00:00:00"
+    }
+
+def legacy_list(articles_db):
+    """Reference: the former get_articles, serialized like FastAPI does"""
+    articles = []
+    for article in articles_db.values():
+        bullet_points = [BulletPoint(id=bp.get('id', i+1), text=bp.get('text', ''), order=bp.get('order', i+1),
+                                     image_path=bp.get('image_path'), audio_path=bp.get('audio_path'))
+                         for i, bp in enumerate(article["bullet_points"])]
+        articles.append(ArticleResponse(id=article["id"], title=article["title"], summary=article["summary"],
+                                        bullet_points=bullet_points, full_text=article.get("full_text"),
+                                        full_summary=article.get("full_summary", "")))
+    return json.dumps(jsonable_encoder(articles)).encode("utf-8")
+
+def list_page(cursor, limit):
+    request = Request({"type": "http", "method": "GET", "path": "/api/articles/", "headers": []})
+    return asyncio.run(get_articles(request, cursor=cursor, limit=limit, fields=None, order="asc"))
+
+def check_walk(store, limit):
+    expected = sorted(store.keys(), key=lambda key: (store[key]["created_at"], int(key)))
+    listed, cursor = [], None
+    while True:
+        response = list_page(cursor, limit)
+        listed += [str(article["id"]) for article in json.loads(response.body)]
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    assert listed == expected, (len(listed), len(expected))
+
+def timed(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checkpoints", type=int, nargs="+", default=[1000, 10000], help="Corpus sizes")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    parser.add_argument("--text-bytes", type=int, default=2000, help="Size of each article's full_text")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = {
+            "sqlite": SQLiteArticleStore(os.path.join(tmp, "articles_db.sqlite3")),
+            "journal": JournalArticleStore(os.path.join(tmp, "articles_db.json")),
+            "lazy": LazyArticleStore(os.path.join(tmp, "articles_db.jsonl"))
+        }
+        for store in stores.values():
+            with store._transaction():
+                for article_id in range(1, 2 * args.limit + 8):
+                    store[article_id] = make_article(article_id, args.text_bytes)
+            api_main.articles_db = store
+            check_walk(store, args.limit)
+        print("equivalence: OK")
+
+        size = 2 * args.limit + 7
+        print(f"{args.text_bytes} bytes of text per article, pages of {args.limit}")
+        print(f"{'articles':>9} {'mode':<8} {'legacy':>10} {'size':>9} {'page':>9} {'size':>8} {'deep page':>10}")
+        for checkpoint in sorted(args.checkpoints):
+            for store in stores.values():
+                with store._transaction():
+                    for article_id in range(size + 1, checkpoint + 1):
+                        store[article_id] = make_article(article_id, args.text_bytes)
+            size = checkpoint
+            middle = make_article(size // 2, 0)
+            middle_cursor = encode_article_cursor((middle["created_at"], size // 2))
+            for mode, store in stores.items():
+                api_main.articles_db = store
+                legacy_time, legacy_body = timed(lambda: legacy_list(store), repeat=1)
+                page_time, page = timed(lambda: list_page(None, args.limit))
+                deep_time, _ = timed(lambda: list_page(middle_cursor, args.limit))
+                print(f"{size:>9,} {mode:<8} {legacy_time * 1000:>8.0f}ms {len(legacy_body) / 1e6:>7.1f}MB "
+                      f"{page_time * 1000:>7.2f}ms {len(page.body) / 1e3:>6.1f}kB {deep_time * 1000:>8.2f}ms")
+        for store in stores.values():
+            store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark: article write latency as the corpus grows (services.article_store).
+
+Grows a corpus of synthetic articles (title, one bullet point, --text-bytes
+of full_text and summary) and, at each checkpoint, times bullet point
+updates with:
+
+- json: the former persistence, the whole articles_db dict dumped to
+  articles_db.json (indent=4) after every change
+- sqlite: SQLiteArticleStore.mutate, one row read and written per change
+- journal: JournalArticleStore.mutate, one line appended to the journal
+  per change (fsync batched), compacted into the snapshot in the background
+- lazy: LazyArticleStore.mutate, one line appended to the data file and
+  one to its index per change; only the index is loaded on open
+
+The json mode is only run up to --json-max articles, as each write
+rewrites the whole corpus. Also reports the time to reopen each store
+(journal: snapshot load + replay of the updates' journal tail; lazy: index
+load, then the time to read the full text of --updates articles), and checks
+that the stores round-trip articles and that int and string ids name the
+same article.
+
+Usage:
+    python benchmarks/bench_article_store.py --checkpoints 1000 10000 100000 --updates 200
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from services.article_store import SQLiteArticleStore, JournalArticleStore, LazyArticleStore
+
+def make_article(article_id, text_bytes):
+    return {
+        "id": article_id,
+        "title": f"Article {article_id}",
+        "summary": f"Résumé de l'article {article_id}",
+        "bullet_points": [{"id": 1, "text": f"Point clé {article_id}", "order": 1, "image_path": None, "audio_path": None}],
+        "full_text": ("Texte de l'article. " * (text_bytes // 20 + 1))[:text_bytes],
+        "full_summary": ("Résumé complet. " * (text_bytes // 32 + 1))[:text_bytes // 2],
+        "tone": "Neutral",
+        "created_at": f"2025-01-01T00:00:{article_id % 60:02d}"
+    }
+
+def update_text(article):
+    article["bullet_points"][0]["text"] += " (modifié)"
+    article["bullet_points"][0]["image_path"] = None
+
+def legacy_write(articles_db, json_path, article_id):
+    """Reference: in-memory dict change, then the whole snapshot dumped like save_and_clean_json"""
+    update_text(articles_db[str(article_id)])
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(articles_db, f, ensure_ascii=False, indent=4)
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+def check_store(store, text_bytes):
+    article = make_article(1, text_bytes)
+    store[1] = article
+    assert store["1"] == article and 1 in store and " 1" in store and "01" in store
+    store.mutate("1", update_text)
+    assert store[1]["bullet_points"][0]["text"].endswith("(modifié)")
+    del store[1]
+    assert 1 not in store and len(store) == 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checkpoints", type=int, nargs="+", default=[1000, 10000, 100000], help="Corpus sizes")
+    parser.add_argument("--updates", type=int, default=200, help="Timed updates per checkpoint and mode")
+    parser.add_argument("--text-bytes", type=int, default=2000, help="Size of each article's full_text")
+    parser.add_argument("--json-max", type=int, default=10000, help="Largest corpus timed in json mode")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_path = os.path.join(tmp, "articles_db.sqlite3")
+        journal_dir = os.path.join(tmp, "journal")
+        os.makedirs(journal_dir)
+        journal_path = os.path.join(journal_dir, "articles_db.json")
+        lazy_path = os.path.join(tmp, "articles_db.jsonl")
+        openers = {
+            "sqlite": (sqlite_path, SQLiteArticleStore),
+            "journal": (journal_path, JournalArticleStore),
+            "lazy": (lazy_path, LazyArticleStore)
+        }
+        stores = {mode: opener(path) for mode, (path, opener) in openers.items()}
+        for store in stores.values():
+            check_store(store, args.text_bytes)
+        print("equivalence: OK")
+        json_path = os.path.join(tmp, "articles_db.json")
+        articles_db = {}
+        size = 0
+
+        print(f"{args.text_bytes} bytes of text per article, {args.updates} updates per checkpoint")
+        print(f"{'articles':>9} {'mode':<7} {'p50':>10} {'p99':>10} {'reopen':>10} {'on disk':>9} {'first reads':>12}")
+        for checkpoint in sorted(args.checkpoints):
+            for store in stores.values():
+                with store._transaction():
+                    for article_id in range(size + 1, checkpoint + 1):
+                        store[article_id] = make_article(article_id, args.text_bytes)
+            stores["journal"].compact()
+            if checkpoint <= args.json_max:
+                for article_id in range(size + 1, checkpoint + 1):
+                    articles_db[str(article_id)] = make_article(article_id, args.text_bytes)
+            size = checkpoint
+            ids = [rng.randint(1, size) for _ in range(args.updates)]
+
+            results = []
+            if size <= args.json_max:
+                samples = []
+                for article_id in ids:
+                    start = time.perf_counter()
+                    legacy_write(articles_db, json_path, article_id)
+                    samples.append(time.perf_counter() - start)
+                results.append(("json", samples, os.path.getsize(json_path), None, None))
+
+            for mode, store in stores.items():
+                samples = []
+                for article_id in ids:
+                    start = time.perf_counter()
+                    store.mutate(article_id, update_text)
+                    samples.append(time.perf_counter() - start)
+                store.close()
+                path, opener = openers[mode]
+                start = time.perf_counter()
+                store = opener(path)
+                len(store)
+                reopen = time.perf_counter() - start
+                start = time.perf_counter()
+                for article_id in ids:
+                    store[article_id]["full_text"]
+                reads = time.perf_counter() - start
+                stores[mode] = store
+                directory, prefix = os.path.split(path)
+                disk = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory) if name.startswith(prefix))
+                results.append((mode, samples, disk, reopen, reads))
+
+            for mode, samples, file_size, reopen, reads in results:
+                reopen_text = f"{reopen * 1000:>8.0f}ms" if reopen is not None else f"{'':>10}"
+                reads_text = f"{reads * 1000:>10.1f}ms" if reads is not None else ""
+                print(f"{size:>9,} {mode:<7} {statistics.median(samples) * 1000:>8.2f}ms "
+                      f"{percentile(samples, 0.99) * 1000:>8.2f}ms {reopen_text} {file_size / 1e6:>7.1f}MB {reads_text}")
+        for store in stores.values():
+            store.close()
+
+if __name__ == "__main__":
+    main()
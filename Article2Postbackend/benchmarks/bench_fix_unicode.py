@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: core.text_processor.fix_unicode.
+
+Compares the single-pass regex decoder with a reference implementation of
+the former chained str.replace version (one full copy of the string per
+escape in its table) on short captions and 50 KB article bodies. Their
+equivalence is checked by tests/test_text_processor.py.
+
+Usage:
+    python benchmarks/bench_fix_unicode.py
+    python benchmarks/bench_fix_unicode.py --repeat 200
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.text_processor import fix_unicode
+from tests.test_text_processor import LEGACY_BROKEN, LEGACY_CODEPOINTS, legacy_fix_unicode
+
+def build_text(rng, size, escape_ratio):
+    words = "le gouvernement annonce une réforme des retraites pour la rentrée".split()
+    escapes = ['\\u%04x' % c for c in LEGACY_CODEPOINTS if c not in LEGACY_BROKEN]
+    parts, length = [], 0
+    while length < size:
+        part = rng.choice(escapes) if rng.random() < escape_ratio else rng.choice(words) + " "
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+def time_function(func, texts, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="Runs per case (best is kept)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    cases = [
+        ("caption, no escape", [build_text(rng, 120, 0.0) for _ in range(200)]),
+        ("caption, escapes", [build_text(rng, 120, 0.1) for _ in range(200)]),
+        ("50KB body, no escape", [build_text(rng, 50_000, 0.0) for _ in range(5)]),
+        ("50KB body, escapes", [build_text(rng, 50_000, 0.05) for _ in range(5)]),
+    ]
+    print(f"{'case':<22} {'legacy':>12} {'single pass':>12} {'speedup':>8}")
+    for name, texts in cases:
+        legacy_time = time_function(legacy_fix_unicode, texts, args.repeat)
+        new_time = time_function(fix_unicode, texts, args.repeat)
+        print(f"{name:<22} {legacy_time * 1e6:>10.1f}us {new_time * 1e6:>10.1f}us {legacy_time / new_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: font loading in the frame text-fitting loop (core.font_registry).
+
+Runs the font-size search of FrameOverlay.apply_frame_with_text (one font per
+candidate size, from INITIAL_MAIN_FONT_SIZE down to MIN_MAIN_FONT_SIZE, plus
+the 'Mg' line-height probe) once per simulated frame, with:
+
+- legacy: os.path.exists + ImageFont.truetype from scratch on every call
+- registry: FontRegistry.get_font (preloaded files, memoized per size)
+
+and checks both fonts measure the text identically.
+
+Usage:
+    python benchmarks/bench_font_registry.py --frames 200
+"""
+
+import os
+import sys
+import time
+import argparse
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)  # Font paths are relative to the backend directory
+
+from PIL import ImageFont
+from core.font_registry import FontRegistry
+from core.frame_overlay import frame_overlay, INITIAL_MAIN_FONT_SIZE, MIN_MAIN_FONT_SIZE
+
+TEXT = "Le gouvernement annonce une réforme ambitieuse du financement des hôpitaux publics d'ici 2026"
+
+def legacy_get_font(font_paths, size):
+    """Reference: the former get_font, parsing the TTF file on every call"""
+    for font_path in font_paths:
+        try:
+            if os.path.exists(font_path):
+                return ImageFont.truetype(font_path, size)
+        except Exception:
+            pass
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except Exception:
+        return ImageFont.load_default()
+
+def fit_loop(get_font, frames):
+    for _ in range(frames):
+        for size in range(INITIAL_MAIN_FONT_SIZE, MIN_MAIN_FONT_SIZE - 1, -5):
+            font = get_font(frame_overlay.preferred_fonts, size)
+            font.getbbox("Mg")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=200, help="Simulated frames")
+    args = parser.parse_args()
+
+    registry = FontRegistry("fonts")
+    registry.preload()
+
+    for size in range(MIN_MAIN_FONT_SIZE, INITIAL_MAIN_FONT_SIZE + 1):
+        legacy = legacy_get_font(frame_overlay.preferred_fonts, size)
+        cached = registry.get_font(frame_overlay.preferred_fonts, size)
+        assert legacy.getbbox(TEXT) == cached.getbbox(TEXT), size
+    print("equivalence: OK")
+
+    start = time.perf_counter()
+    fit_loop(legacy_get_font, args.frames)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fit_loop(registry.get_font, args.frames)
+    registry_time = time.perf_counter() - start
+
+    print(f"{args.frames} frames: legacy {legacy_time * 1000:.1f}ms, registry {registry_time * 1000:.1f}ms "
+          f"({legacy_time / registry_time:.0f}x)")
+    print(f"registry stats: {registry.get_stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark and equivalence check: frame preparation in build_frame_layers (core.frame_cache).
+
+Prepares a 1080x1080 PNG frame for 1920x1080 and 1080x1350 base images with:
+
+- legacy: the former path, Image.open + convert('RGBA') + LANCZOS resize on
+  every call
+- cached: FrameCache.get, decoded and resized once per frame file version and
+  target size
+
+and checks both give the same pixels, and that rewriting the frame file is
+picked up by the cache. Reports time per prepared frame.
+
+Usage:
+    python benchmarks/bench_frame_cache.py --calls 50
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import numpy as np
+from PIL import Image, ImageDraw
+from core.frame_cache import FrameCache
+
+FRAME_SIZE = (1080, 1080)
+TARGET_SIZES = [(1920, 1080), (1080, 1350)]
+
+def legacy_prepare(path, target_size):
+    """Reference: the former per-call frame loading and resizing"""
+    frame_rgba = Image.open(path).convert("RGBA")
+    if frame_rgba.size != target_size:
+        frame_rgba = frame_rgba.resize(target_size, Image.LANCZOS)
+    return frame_rgba
+
+def write_frame(path, fill):
+    frame = Image.new('RGBA', FRAME_SIZE, (0, 0, 0, 0))
+    ImageDraw.Draw(frame).rectangle((0, int(FRAME_SIZE[1] * 0.68), FRAME_SIZE[0], FRAME_SIZE[1]), fill=fill)
+    frame.save(path, "PNG")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50, help="Prepared frames per method and target size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "frame.png")
+        write_frame(path, (20, 20, 20, 230))
+        cache = FrameCache(max_entries=8)
+
+        for target_size in TARGET_SIZES:
+            entry = cache.get(path, target_size)
+            expected = legacy_prepare(path, target_size)
+            assert np.array_equal(np.asarray(entry["image"]), np.asarray(expected))
+            assert entry["box"] == expected.getchannel('A').getbbox()
+
+        # A rewritten frame file is reloaded (new mtime/size), without explicit invalidation
+        write_frame(path, (200, 30, 30, 255))
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        assert np.array_equal(np.asarray(cache.get(path, TARGET_SIZES[0])["image"]),
+                              np.asarray(legacy_prepare(path, TARGET_SIZES[0])))
+        os.remove(path)
+        assert cache.get(path, TARGET_SIZES[0]) is None
+        print("equivalence: OK")
+
+        write_frame(path, (20, 20, 20, 230))
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            for target_size in TARGET_SIZES:
+                legacy_prepare(path, target_size)
+        legacy_time = time.perf_counter() - start
+
+        cache = FrameCache(max_entries=8)
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            for target_size in TARGET_SIZES:
+                cache.get(path, target_size)
+        cached_time = time.perf_counter() - start
+        stats = cache.get_stats()
+
+    calls = args.calls * len(TARGET_SIZES)
+    print(f"{FRAME_SIZE[0]}x{FRAME_SIZE[1]} frame -> {', '.join(f'{w}x{h}' for w, h in TARGET_SIZES)}, {calls} calls")
+    print(f"{'':<8} {'time/frame':>11}")
+    print(f"{'legacy':<8} {legacy_time / calls * 1000:>9.2f}ms")
+    print(f"{'cached':<8} {cached_time / calls * 1000:>9.2f}ms   "
+          f"(decodes: {stats['decodes']}, resizes: {stats['resizes']}, hits: {stats['hits']})")
+
+if __name__ == "__main__":
+    main()
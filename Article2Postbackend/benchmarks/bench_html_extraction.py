@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: BeautifulSoup vs streaming lxml HTML text extraction.
+
+Runs both extraction engines of services.web_scraper over a corpus of saved
+HTML pages and reports the time per page, plus the main-content mode and
+how much of the full text it keeps (what is actually sent to the LLM). Without --corpus, a synthetic
+corpus of 2-5 MB news-like pages (heavy inline JS, navigation menus,
+article paragraphs) is generated in a temporary directory.
+
+Usage:
+    python benchmarks/bench_html_extraction.py --corpus path/to/saved_pages/
+    python benchmarks/bench_html_extraction.py --pages 6 --repeat 3
+"""
+
+import os
+import sys
+import glob
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.web_scraper import extract_text_from_html
+
+def build_synthetic_page(target_bytes, seed):
+    """Build a news-like HTML page of roughly target_bytes bytes"""
+    rng = random.Random(seed)
+    words = ("économie marché gouvernement réforme président santé climat "
+             "entreprise société élection culture sport technologie").split()
+    script = "<script>window.__STATE__ = {" + ",".join(
+        f'"k{i}": "{rng.random():.12f}"' for i in range(2000)) + "};</script>"
+    nav = "<nav><ul>" + "".join(f'<li><a href="/rubrique/{i}">Rubrique {i}</a></li>' for i in range(40)) + "</ul></nav>"
+    parts = ["<!DOCTYPE html><html><head><meta charset='utf-8'><title>Article</title>",
+             "<style>body { font-family: sans-serif; } .x { color: red; }</style></head><body>", nav]
+    size = sum(len(p) for p in parts)
+    while size < target_bytes:
+        paragraph = "<p>" + " ".join(rng.choice(words) for _ in range(120)) + "</p>"
+        chunk = script + paragraph if rng.random() < 0.5 else paragraph
+        parts.append(chunk)
+        size += len(chunk.encode("utf-8"))
+    parts.append("<footer>Mentions légales</footer></body></html>")
+    return "".join(parts).encode("utf-8")
+
+def load_corpus(args):
+    if args.corpus:
+        paths = sorted(glob.glob(os.path.join(args.corpus, "*.htm*")))
+        if not paths:
+            sys.exit(f"No .html files found in {args.corpus}")
+        return [(os.path.basename(p), open(p, "rb").read()) for p in paths]
+
+    corpus_dir = tempfile.mkdtemp(prefix="html_corpus_")
+    pages = []
+    for i in range(args.pages):
+        content = build_synthetic_page(random.Random(i).randint(2, 5) * 1024 * 1024, seed=i)
+        path = os.path.join(corpus_dir, f"page_{i:02d}.html")
+        with open(path, "wb") as f:
+            f.write(content)
+        pages.append((os.path.basename(path), content))
+    print(f"Generated synthetic corpus in {corpus_dir}")
+    return pages
+
+def time_engine(engine, content, repeat, mode="full"):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = extract_text_from_html(content, engine, mode)
+        timings.append(time.perf_counter() - start)
+    return min(timings), text
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory of saved .html pages")
+    parser.add_argument("--pages", type=int, default=6, help="Number of synthetic pages when no corpus is given")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per page and engine (best is kept)")
+    args = parser.parse_args()
+
+    pages = load_corpus(args)
+    totals = {"bs4": [], "lxml": [], "main": []}
+    kept = []
+    print(f"{'page':<20} {'size':>8} {'bs4':>10} {'lxml':>10} {'speedup':>8} {'text bs4/lxml':>16} "
+          f"{'main':>10} {'main kept':>10}")
+    for name, content in pages:
+        bs4_time, bs4_text = time_engine("bs4", content, args.repeat)
+        lxml_time, lxml_text = time_engine("lxml", content, args.repeat)
+        main_time, main_text = time_engine(None, content, args.repeat, mode="main")
+        totals["bs4"].append(bs4_time)
+        totals["lxml"].append(lxml_time)
+        totals["main"].append(main_time)
+        kept.append(len(main_text) / max(len(bs4_text), 1))
+        print(f"{name[:20]:<20} {len(content) / 1e6:>6.2f}MB {bs4_time * 1000:>8.1f}ms {lxml_time * 1000:>8.1f}ms "
+              f"{bs4_time / lxml_time:>7.1f}x {len(bs4_text):>7}/{len(lxml_text):<8} "
+              f"{main_time * 1000:>8.1f}ms {kept[-1]:>9.0%}")
+
+    bs4_mean = statistics.mean(totals["bs4"])
+    lxml_mean = statistics.mean(totals["lxml"])
+    print(f"mean per page: bs4={bs4_mean * 1000:.1f}ms lxml={lxml_mean * 1000:.1f}ms ({bs4_mean / lxml_mean:.1f}x) "
+          f"main={statistics.mean(totals['main']) * 1000:.1f}ms, main content keeps {statistics.mean(kept):.0%} of the text")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark: polling GET /api/articles/{id}/, /api/articles/ and /api/social-posts/{id}/ (utils.http_caching).
+
+Drives the FastAPI app directly over ASGI (no server, no network) and, for
+each endpoint, reports time and bytes on the wire per poll for:
+
+- full: a plain request, the body rebuilt and sent uncompressed (the former
+  behavior)
+- compressed: the same with Accept-Encoding: gzip, br
+- revalidated: a poll sending back the ETag of the previous response, while
+  the resource did not change (304 Not Modified)
+
+Checks beforehand that compressed bodies decode to the full body, that the
+ETag of every variant revalidates, and that a write changes the ETag.
+
+Usage:
+    python benchmarks/bench_http_revalidation.py --polls 200 --text-bytes 8000
+"""
+
+import os
+import sys
+import gzip
+import time
+import asyncio
+import argparse
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import api_main
+from services.article_store import SQLiteArticleStore
+from utils.http_caching import brotli
+
+def make_article(article_id, text_bytes):
+    return {
+        "id": article_id,
+        "title": f"Article {article_id}",
+        "summary": f"Résumé de l'article {article_id}",
+        "bullet_points": [{"id": i, "text": f"Point clé {i} de l'article {article_id}", "order": i,
+                           "image_path": None, "audio_path": None} for i in range(1, 6)],
+        "full_text": ("Texte de l'article. " * (text_bytes // 20 + 1))[:text_bytes],
+        "full_summary": ("Résumé complet. " * (text_bytes // 32 + 1))[:text_bytes // 2],
+        "tone": "Neutral",
+        "created_at": f"2025-01-{article_id % 28 + 1:02d}T00:00:00"
+    }
+
+def make_social_post(social_post_id):
+    post = {
+        "platform": "instagram", "caption": "Légende du post. " * 40, "hashtags": [f"#tag{i}" for i in range(20)],
+        "call_to_action": "Lire l'article", "image_path": None, "character_count": 640, "hashtag_count": 20,
+        "timestamp": 1735689600.0, "config_used": None
+    }
+    return {"id": social_post_id, "article_id": 1, "status": "completed", "posts": {"instagram": post},
+            "download_urls": {}}
+
+async def request(path, query="", headers=()):
+    """One GET through the whole middleware stack. Returns (status, headers, body)"""
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": query.encode(), "http_version": "1.1", "scheme": "http",
+        "server": ("localhost", 8000), "client": ("127.0.0.1", 50000),
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers]
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await api_main.app(scope, receive, send)
+    response_headers = {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+    return messages[0]["status"], response_headers, b"".join(m.get("body", b"") for m in messages[1:])
+
+def decode(body, encoding):
+    if encoding == "br":
+        return brotli.decompress(body)
+    return gzip.decompress(body) if encoding == "gzip" else body
+
+async def check(path, query, write):
+    status, headers, full = await request(path, query)
+    assert status == 200
+    for accept in ("identity", "gzip", "gzip, br"):
+        status, headers, body = await request(path, query, [("Accept-Encoding", accept)])
+        assert status == 200 and decode(body, headers.get("content-encoding")) == full, (path, accept)
+        status, _, body = await request(path, query, [("Accept-Encoding", accept), ("If-None-Match", headers["etag"])])
+        assert status == 304 and body == b"", (path, accept)
+    etag = headers["etag"]
+    write()
+    status, headers, _ = await request(path, query, [("Accept-Encoding", "gzip, br"), ("If-None-Match", etag)])
+    assert status == 200 and headers["etag"] != etag, path
+
+async def poll(path, query, headers, polls):
+    size = 0
+    start = time.perf_counter()
+    for _ in range(polls):
+        _, _, body = await request(path, query, headers)
+        size = len(body)
+    return (time.perf_counter() - start) / polls, size
+
+async def run(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteArticleStore(os.path.join(tmp, "articles_db.sqlite3"))
+        with store._transaction():
+            for article_id in range(1, 201):
+                store[article_id] = make_article(article_id, args.text_bytes)
+        api_main.articles_db = store
+        api_main.social_posts_db[1] = make_social_post(1)
+        api_main.touch_social_post(1)
+
+        endpoints = [
+            ("/api/articles/1/", "", lambda: store.mutate(1, lambda article: article.update(title="Nouveau titre"))),
+            ("/api/articles/", "limit=50", lambda: store.mutate(2, lambda article: article.update(tone="Formal"))),
+            ("/api/social-posts/1/", "", lambda: api_main.touch_social_post(1))
+        ]
+        for path, query, write in endpoints:
+            await check(path, query, write)
+        print("equivalence: OK")
+
+        accept = "gzip, br" if brotli is not None else "gzip"
+        print(f"{args.text_bytes} bytes of text per article, {args.polls} polls, Accept-Encoding: {accept}")
+        print(f"{'endpoint':<24} {'mode':<12} {'time/poll':>10} {'bytes/poll':>11}")
+        for path, query, _ in endpoints:
+            _, headers, _ = await request(path, query, [("Accept-Encoding", accept)])
+            for mode, request_headers in (
+                ("full", []),
+                ("compressed", [("Accept-Encoding", accept)]),
+                ("revalidated", [("Accept-Encoding", accept), ("If-None-Match", headers["etag"])])
+            ):
+                elapsed, size = await poll(path, query, request_headers, args.polls)
+                label = f"{path}?{query}" if query else path
+                print(f"{label:<24} {mode:<12} {elapsed * 1000:>8.2f}ms {size:>11,}")
+        store.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--polls", type=int, default=200, help="Polls per endpoint and mode")
+    parser.add_argument("--text-bytes", type=int, default=8000, help="Size of each article's full_text")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
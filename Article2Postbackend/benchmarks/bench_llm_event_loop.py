@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Load test: /api/health latency while bullet point regenerations are in flight.
+
+Starts the real FastAPI app with uvicorn in a temporary working directory,
+replaces the OpenAI call behind /bullet-points/{id}/regenerate/ with a
+stand-in that blocks for --llm-seconds (like a real round-trip), fires
+--inflight regenerations at once and polls /api/health meanwhile.
+
+Two runs are compared:
+
+- blocking: the LLM function is called directly inside the async handler
+  (the former behaviour, which freezes the event loop)
+- pool: the call goes through services.openai_client.run_llm_call
+
+Usage:
+    python benchmarks/bench_llm_event_loop.py --inflight 20 --llm-seconds 1.5
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import tempfile
+import threading
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# The app reads and writes cache/ and the article store relative to the working directory
+os.chdir(tempfile.mkdtemp(prefix="llm_load_test_"))
+
+import requests
+import uvicorn
+import api_main
+from services.openai_client import run_llm_call
+
+ARTICLE_ID = 1
+
+def slow_regenerate(llm_seconds):
+    def regenerate_bullet_point_with_openai(original_text, context, language, words_per_point):
+        time.sleep(llm_seconds)  # Blocking SDK call stand-in
+        return f"{original_text} (regenerated)"
+    return regenerate_bullet_point_with_openai
+
+async def run_inline(func, *args, **kwargs):
+    """Former behaviour: blocking call straight on the event loop"""
+    return func(*args, **kwargs)
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server():
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(api_main.app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            requests.get(f"{base_url}/api/health", timeout=1)
+            return server, base_url
+        except requests.RequestException:
+            time.sleep(0.05)
+    sys.exit("Server did not start")
+
+def reset_article(inflight):
+    # Written to the article store of the temporary working directory
+    api_main.articles_db[ARTICLE_ID] = {
+        "id": ARTICLE_ID,
+        "title": "Load test",
+        "full_text": "Texte de l'article. " * 50,
+        "bullet_points": [
+            {"id": i + 1, "text": f"Point {i + 1}", "order": i + 1, "image_path": None, "audio_path": None}
+            for i in range(inflight)
+        ]
+    }
+
+def run_scenario(base_url, inflight, duration):
+    reset_article(inflight)
+    latencies = []
+    stop = threading.Event()
+
+    def poll_health():
+        with requests.Session() as session:
+            while not stop.is_set():
+                start = time.perf_counter()
+                session.get(f"{base_url}/api/health", timeout=60)
+                latencies.append(time.perf_counter() - start)
+                time.sleep(0.01)
+
+    def regenerate(bullet_point_id):
+        return requests.post(
+            f"{base_url}/api/articles/{ARTICLE_ID}/bullet-points/{bullet_point_id}/regenerate/",
+            json={"article_id": ARTICLE_ID, "bullet_point_id": bullet_point_id, "language": "fr", "words_per_point": 20},
+            timeout=600
+        ).status_code
+
+    poller = threading.Thread(target=poll_health)
+    poller.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=inflight) as pool:
+        statuses = list(pool.map(regenerate, range(1, inflight + 1)))
+    elapsed = time.perf_counter() - start
+    time.sleep(max(duration - elapsed, 0))
+    stop.set()
+    poller.join()
+
+    latencies.sort()
+    p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+    return {
+        "ok": sum(1 for status in statuses if status == 200),
+        "elapsed": elapsed,
+        "health_requests": len(latencies),
+        "p50": statistics.median(latencies),
+        "p99": p99,
+        "max": latencies[-1]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--inflight", type=int, default=20, help="Concurrent regenerations")
+    parser.add_argument("--llm-seconds", type=float, default=1.5, help="Simulated LLM round-trip")
+    parser.add_argument("--duration", type=float, default=0, help="Minimum polling time per scenario (s)")
+    args = parser.parse_args()
+
+    api_main.regenerate_bullet_point_with_openai = slow_regenerate(args.llm_seconds)
+    api_main.clear_cache_selective = lambda *a, **k: None
+    server, base_url = start_server()
+
+    print(f"{args.inflight} regenerations in flight, {args.llm_seconds}s per LLM call")
+    print(f"{'mode':<10} {'ok':>4} {'batch time':>11} {'health reqs':>12} {'p50':>9} {'p99':>9} {'max':>9}")
+    for mode, runner in (("blocking", run_inline), ("pool", run_llm_call)):
+        api_main.run_llm_call = runner
+        result = run_scenario(base_url, args.inflight, args.duration)
+        print(f"{mode:<10} {result['ok']:>4} {result['elapsed']:>10.1f}s {result['health_requests']:>12} "
+              f"{result['p50'] * 1000:>7.1f}ms {result['p99'] * 1000:>7.1f}ms {result['max'] * 1000:>7.1f}ms")
+
+    server.should_exit = True
+
+if __name__ == "__main__":
+    main()
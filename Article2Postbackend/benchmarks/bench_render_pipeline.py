@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark and equivalence check: region-limited compositing (core.render_pipeline).
+
+Renders frame + text + logo layers over 1920x1080 base images with:
+
+- full-size: the former compositing, one transparent 1920x1080 overlay per
+  text/logo layer and Image.alpha_composite over the whole image per layer
+- region: RenderPipeline.composite, which allocates and blends only the
+  opaque box of image layers and the ink box of text
+
+and checks both produce the same pixels. Reports time per render and the
+overlay pixels allocated / destination pixels blended.
+
+Usage:
+    python benchmarks/bench_render_pipeline.py --renders 50
+"""
+
+import os
+import sys
+import time
+import argparse
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)  # Font paths are relative to the backend directory
+
+import numpy as np
+from PIL import Image, ImageDraw
+from core.render_pipeline import RenderPipeline, image_layer, text_layer
+from core.font_registry import font_registry
+from core.frame_overlay import frame_overlay
+
+WIDTH, HEIGHT = 1920, 1080
+TEXT = "Le gouvernement annonce une réforme ambitieuse du financement des hôpitaux publics d'ici 2026"
+
+def full_size_composite(base_image, layers):
+    """Reference: the former compositing, full-size overlays and blends"""
+    result = base_image
+    allocated = blended = 0
+    for layer in layers:
+        if layer["kind"] == "image" and layer["image"].size == result.size and layer["position"] == (0, 0):
+            result = Image.alpha_composite(result, layer["image"])
+            blended += result.width * result.height
+            continue
+        overlay = Image.new('RGBA', result.size, (0, 0, 0, 0))
+        allocated += result.width * result.height
+        if layer["kind"] == "image":
+            overlay.paste(layer["image"], layer["position"])
+        else:
+            draw = ImageDraw.Draw(overlay)
+            current_y = layer["start_y"]
+            for line in layer["lines"]:
+                line_bbox = draw.textbbox((0, 0), line, font=layer["font"])
+                start_x = (result.width - (line_bbox[2] - line_bbox[0])) // 2
+                draw.text((start_x, current_y), line, fill=layer["color"], font=layer["font"])
+                current_y += layer["line_height"] + layer["line_spacing"]
+        result = Image.alpha_composite(result, overlay)
+        blended += result.width * result.height
+    return result, allocated, blended
+
+def build_layers():
+    # Frame: transparent top, dark band over the bottom 32%
+    frame = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
+    ImageDraw.Draw(frame).rectangle((0, int(HEIGHT * 0.68), WIDTH, HEIGHT), fill=(20, 20, 20, 230))
+    # Logo with antialiased edges
+    logo = Image.new('RGBA', (150, 70), (0, 0, 0, 0))
+    ImageDraw.Draw(logo).ellipse((0, 0, 149, 69), fill=(255, 200, 0, 255))
+    logo = logo.resize((600, 280)).resize((150, 70), Image.LANCZOS)
+
+    font = font_registry.get_font(frame_overlay.preferred_fonts, 42)
+    lines = frame_overlay.wrap_text(TEXT, font, WIDTH - 120)
+    bbox = font.getbbox('Mg')
+    return [
+        image_layer(frame),
+        text_layer(lines, font, 800, bbox[3] - bbox[1], 15),
+        image_layer(logo, (WIDTH - 180, 30))
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--renders", type=int, default=50, help="Renders per method")
+    args = parser.parse_args()
+
+    font_registry.preload()
+    rng = np.random.default_rng(3)
+    base = Image.fromarray(rng.integers(0, 256, (HEIGHT, WIDTH, 4), dtype=np.uint8), 'RGBA')
+    layers = build_layers()
+
+    pipeline = RenderPipeline()
+    expected, _, _ = full_size_composite(base.copy(), layers)
+    assert np.array_equal(np.asarray(pipeline.composite(base.copy(), layers)), np.asarray(expected))
+    print("equivalence: OK")
+
+    start = time.perf_counter()
+    for _ in range(args.renders):
+        _, allocated, blended = full_size_composite(base.copy(), layers)
+    full_time = time.perf_counter() - start
+
+    pipeline = RenderPipeline()
+    start = time.perf_counter()
+    for _ in range(args.renders):
+        pipeline.composite(base.copy(), layers)
+    region_time = time.perf_counter() - start
+    stats = pipeline.get_stats()
+
+    print(f"{WIDTH}x{HEIGHT}, frame + text + logo, {args.renders} renders (base copy included)")
+    print(f"{'':<10} {'time/render':>12} {'overlay px':>12} {'blended px':>12}")
+    print(f"{'full-size':<10} {full_time / args.renders * 1000:>10.1f}ms {allocated:>12,} {blended:>12,}")
+    print(f"{'region':<10} {region_time / args.renders * 1000:>10.1f}ms "
+          f"{stats['allocated_pixels'] // args.renders:>12,} {stats['blended_pixels'] // args.renders:>12,}")
+
+if __name__ == "__main__":
+    main()
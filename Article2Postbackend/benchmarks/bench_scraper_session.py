@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scraper latency per URL with and without connection reuse.
+
+Starts a local HTTP/1.1 stand-in server that serves a synthetic news page and
+simulates the cost of opening a new connection (DNS + TCP + TLS) with a
+configurable delay. Then it scrapes the same set of URLs twice:
+
+- without reuse: a fresh session per URL (what a bare requests.get() does)
+- with reuse: the shared keep-alive session from services.web_scraper
+
+Usage:
+    python benchmarks/bench_scraper_session.py --urls 200 --handshake-ms 30
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import statistics
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from services import web_scraper
+
+PAGE = ("<html><head><title>Article</title><script>var x = 1;</script></head><body>"
+        + "<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>" * 200
+        + "</body></html>").encode("utf-8")
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    handshake_delay = 0.0
+
+    def setup(self):
+        # Called once per TCP connection: simulate the handshake cost
+        time.sleep(self.handshake_delay)
+        super().setup()
+        # Headers and body are written separately: avoid Nagle/delayed-ACK stalls on reused connections
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+def run(label, urls, session_factory, close_after_use):
+    latencies = []
+    for url in urls:
+        session = session_factory()
+        start = time.perf_counter()
+        web_scraper.scrape_text_from_url(url, session=session)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if close_after_use:
+            session.close()
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<16} mean={statistics.mean(latencies):7.2f} ms  "
+          f"p50={statistics.median(latencies):7.2f} ms  p95={p95:7.2f} ms")
+    return statistics.mean(latencies)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=100, help="Number of URLs to scrape per run")
+    parser.add_argument("--handshake-ms", type=float, default=20.0, help="Simulated cost of a new connection")
+    args = parser.parse_args()
+
+    StandInHandler.handshake_delay = args.handshake_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base_url}/article/{i}" for i in range(args.urls)]
+
+    print(f"Scraping {args.urls} URLs from {base_url} (simulated handshake: {args.handshake_ms} ms)")
+    without_reuse = run("without reuse", urls, requests.Session, close_after_use=True)
+    shared = web_scraper.get_scraper_session()
+    with_reuse = run("with reuse", urls, lambda: shared, close_after_use=False)
+    print(f"speedup: {without_reuse / with_reuse:.1f}x")
+
+    web_scraper.close_scraper_session()
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
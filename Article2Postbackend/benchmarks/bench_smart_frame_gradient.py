@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: gradients in SmartFrameGenerator (core.smart_frame_generator).
+
+Compares in time:
+
+- create_gradient_background: the former per-pixel putpixel loops against the
+  NumPy row interpolation broadcast over the width
+- the text zone of _generate_new_frame: the former per-row draw.line alpha
+  gradient against a single paste of create_text_zone_gradient
+
+Their pixel equivalence is checked by tests/test_smart_frame_generator.py.
+
+Usage:
+    python benchmarks/bench_smart_frame_gradient.py --width 1920 --height 1080
+"""
+
+import os
+import sys
+import time
+import argparse
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from core.smart_frame_generator import SmartFrameGenerator
+from tests.test_smart_frame_generator import legacy_gradient_background, legacy_text_zone, text_zone
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=1920, help="Frame width")
+    parser.add_argument("--height", type=int, default=1080, help="Frame height")
+    args = parser.parse_args()
+
+    generator = SmartFrameGenerator()
+    color1, color2 = generator.colors["gradient_start"], generator.colors["gradient_end"]
+    timings = []
+    for name, legacy, vectorized in (
+        ("gradient background",
+         lambda: legacy_gradient_background(args.width, args.height, color1, color2),
+         lambda: generator.create_gradient_background(args.width, args.height, color1, color2)),
+        ("text zone",
+         lambda: legacy_text_zone(args.width, args.height, generator.colors["black_text_bg"]),
+         lambda: text_zone(generator, args.width, args.height, generator.colors["black_text_bg"])),
+    ):
+        start = time.perf_counter()
+        legacy()
+        legacy_time = time.perf_counter() - start
+        start = time.perf_counter()
+        vectorized()
+        timings.append((name, legacy_time, time.perf_counter() - start))
+
+    print(f"{args.width}x{args.height}")
+    print(f"{'':<20} {'legacy':>10} {'vectorized':>11}")
+    for name, legacy_time, vectorized_time in timings:
+        print(f"{name:<20} {legacy_time * 1000:>8.1f}ms {vectorized_time * 1000:>9.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark and equivalence check: chunked text cleaning (utils.text_cleaning).
+
+Compares the former whole-string clean_encoding_issues (replace, NFKD,
+control-character regex, each over the full text) with the chunked pipeline
+on multi-megabyte inputs, reporting time and peak extra memory
+(tracemalloc), and checks both give the same output for every chunk size.
+
+Usage:
+    python benchmarks/bench_text_cleaning.py
+    python benchmarks/bench_text_cleaning.py --sizes 1 8 32
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.text_cleaning import clean_text
+
+def legacy_clean_encoding_issues(text):
+    """Reference: the former implementation, one whole-string pass per step"""
+    text = text.replace('�', ' ')
+    text = unicodedata.normalize('NFKD', text)
+    text = text.replace('�', 'é')
+    text = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', text)
+    return text
+
+def build_text(rng, size_bytes):
+    """Pasted-PDF-like text: accents, ligatures, replacement characters, control characters"""
+    words = ("économie réforme santé ﬁnancement déjà naïve être Œuvre "
+             "l’État á pr� \x0c page\x00  note").split(" ")
+    parts, size = [], 0
+    while size < size_bytes:
+        word = rng.choice(words)
+        parts.append(word + ("\n" if rng.random() < 0.1 else " "))
+        size += len(word) + 1
+    return "".join(parts)
+
+def check_equivalence(rng):
+    for _ in range(300):
+        text = build_text(rng, rng.randint(0, 400))
+        expected = legacy_clean_encoding_issues(text)
+        for chunk_size in (1, 2, 3, 7, 64, 4096):
+            assert clean_text(text, chunk_size) == expected, (text, chunk_size)
+    print("equivalence: OK")
+
+def measure(func, text):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(text)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Peak minus the result itself: the working memory of the function
+    return elapsed, max(peak - sys.getsizeof(result), 0)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 4, 16], help="Input sizes in MB")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    check_equivalence(rng)
+
+    print(f"{'size':>6} {'legacy':>10} {'chunked':>10} {'legacy extra mem':>17} {'chunked extra mem':>18}")
+    for size in args.sizes:
+        text = build_text(rng, size * 1024 * 1024)
+        legacy_time, legacy_mem = measure(legacy_clean_encoding_issues, text)
+        chunked_time, chunked_mem = measure(clean_text, text)
+        print(f"{size:>4}MB {legacy_time * 1000:>8.0f}ms {chunked_time * 1000:>8.0f}ms "
+              f"{legacy_mem / 1e6:>15.1f}MB {chunked_mem / 1e6:>16.1f}MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark and equivalence check: text fitting in apply_frame_with_text (core.text_layout).
+
+Compares the former fitting loop (45px down to 25px in 5px steps, each size
+re-wrapping with font.getbbox on an ever-growing test line) with the layout
+engine (word widths measured once per font, cumulative-width wrapping, binary
+search over every size from 25px to 45px). Reports time and FreeType
+measurement calls per fit, and checks the engine wraps exactly like the
+former wrap_text.
+
+Usage:
+    python benchmarks/bench_text_layout.py --texts 200
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)  # Font paths are relative to the backend directory
+
+from core.font_registry import font_registry
+from core.text_layout import TextLayoutEngine
+from core.frame_overlay import (
+    frame_overlay, INITIAL_MAIN_FONT_SIZE, MIN_MAIN_FONT_SIZE, MAIN_TEXT_LINE_SPACING, TEXT_SIDE_MARGIN
+)
+
+WORDS = ("Le gouvernement annonce une réforme ambitieuse du financement des hôpitaux publics "
+         "d'ici 2026 AVAWAY «Tous» l'État Œuvre très-long-mot-composé 12,5% WWWWWWWWWWWWWWWWWWWWWWWWWWWWWWWW").split()
+
+class CountingFont:
+    """Font proxy counting FreeType measurement calls"""
+
+    def __init__(self, font, counter):
+        self.font = font
+        self.counter = counter
+
+    def getbbox(self, text):
+        self.counter[0] += 1
+        return self.font.getbbox(text)
+
+    def getlength(self, text):
+        self.counter[0] += 1
+        return self.font.getlength(text)
+
+def legacy_wrap_text(text, font, max_width):
+    """Reference: the former FrameOverlay.wrap_text"""
+    words = text.split()
+    lines = []
+    current_line = ""
+    for word in words:
+        test_line = current_line + (" " if current_line else "") + word
+        bbox = font.getbbox(test_line)
+        if bbox[2] - bbox[0] <= max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line)
+                current_line = word
+            else:
+                lines.append(word)
+    if current_line:
+        lines.append(current_line)
+    return lines
+
+def legacy_fit(text, get_font, max_width, max_height):
+    """Reference: the former fitting loop of apply_frame_with_text"""
+    size = INITIAL_MAIN_FONT_SIZE
+    while size >= MIN_MAIN_FONT_SIZE:
+        font = get_font(size)
+        lines = legacy_wrap_text(text, font, max_width)
+        bbox = font.getbbox('Mg')
+        line_height = bbox[3] - bbox[1]
+        total_height = len(lines) * line_height + max(0, len(lines) - 1) * MAIN_TEXT_LINE_SPACING
+        if total_height <= max_height:
+            return size, lines
+        size -= 5
+    return MIN_MAIN_FONT_SIZE, legacy_wrap_text(text, get_font(MIN_MAIN_FONT_SIZE), max_width)
+
+def random_text(rng, max_words=60):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, max_words)))
+
+def check_equivalence(rng, engine):
+    for size in range(MIN_MAIN_FONT_SIZE - 5, INITIAL_MAIN_FONT_SIZE + 6):
+        font = font_registry.get_font(frame_overlay.preferred_fonts, size)
+        for _ in range(40):
+            text = random_text(rng, 30)
+            max_width = rng.choice([200, 500, 900, 1800])
+            assert engine.wrap(text, font, max_width) == legacy_wrap_text(text, font, max_width), (size, text, max_width)
+    print("equivalence: OK")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=200, help="Texts fitted per run")
+    args = parser.parse_args()
+
+    font_registry.preload()
+    rng = random.Random(5)
+    check_equivalence(rng, TextLayoutEngine())
+
+    # 1920x1080 frame geometry, as computed in apply_frame_with_text
+    band = int(1080 * 0.32)
+    max_width = 1920 - 2 * TEXT_SIDE_MARGIN
+    max_height = band - 80 - 60
+    texts = [random_text(rng) for _ in range(args.texts)]
+
+    legacy_calls, engine_calls = [0], [0]
+    legacy_fonts, engine_fonts = {}, {}
+
+    def legacy_font(size):
+        if size not in legacy_fonts:
+            legacy_fonts[size] = CountingFont(font_registry.get_font(frame_overlay.preferred_fonts, size), legacy_calls)
+        return legacy_fonts[size]
+
+    def engine_font(size):
+        if size not in engine_fonts:
+            engine_fonts[size] = CountingFont(font_registry.get_font(frame_overlay.preferred_fonts, size), engine_calls)
+        return engine_fonts[size]
+
+    engine = TextLayoutEngine()
+    start = time.perf_counter()
+    legacy_sizes = [legacy_fit(text, legacy_font, max_width, max_height)[0] for text in texts]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine_sizes = [engine.fit(text, engine_font, max_width, max_height, MIN_MAIN_FONT_SIZE,
+                               INITIAL_MAIN_FONT_SIZE, MAIN_TEXT_LINE_SPACING)["font_size"] for text in texts]
+    engine_time = time.perf_counter() - start
+
+    # The 1px search never picks a smaller size than the 5px steps
+    assert all(new >= old for new, old in zip(engine_sizes, legacy_sizes))
+    print(f"{'':<8} {'time/fit':>10} {'FreeType calls/fit':>19} {'mean font size':>15}")
+    for name, elapsed, calls, sizes in (("legacy", legacy_time, legacy_calls[0], legacy_sizes),
+                                        ("engine", engine_time, engine_calls[0], engine_sizes)):
+        print(f"{name:<8} {elapsed / len(texts) * 1000:>8.2f}ms {calls / len(texts):>19.1f} "
+              f"{sum(sizes) / len(sizes):>14.1f}px")
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,8 @@ class Config:
     CACHE_DIR: str = "cache"
     CACHE_SUBDIRS: list = [
         "img", "aud", "clg", "vid", 
-        "music", "custom", "uploads"
+        "music", "custom", "uploads", "renditions",
+        "manifests", "tmp"
     ]
     
     # Music API settings
@@ -38,6 +39,87 @@ class Config:
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_IMAGE_TYPES: list = ["image/jpeg", "image/png", "image/gif"]
     
+    # Web scraper settings (shared keep-alive session)
+    SCRAPER_CONNECT_TIMEOUT: float = float(os.getenv("SCRAPER_CONNECT_TIMEOUT", 5))
+    SCRAPER_READ_TIMEOUT: float = float(os.getenv("SCRAPER_READ_TIMEOUT", 20))
+    SCRAPER_POOL_CONNECTIONS: int = int(os.getenv("SCRAPER_POOL_CONNECTIONS", 16))  # Number of hosts kept in the pool
+    SCRAPER_POOL_MAXSIZE: int = int(os.getenv("SCRAPER_POOL_MAXSIZE", 8))  # Connections kept alive per host
+    SCRAPER_MAX_RETRIES: int = int(os.getenv("SCRAPER_MAX_RETRIES", 2))
+    SCRAPER_USER_AGENT: str = os.getenv(
+        "SCRAPER_USER_AGENT",
+        "Mozilla/5.0 (compatible; Article2Post/2.0; +https://github.com/AicraftersLab/Article2Post)"
+    )
+    
+    # HTML text extraction engine: "bs4" (full BeautifulSoup tree) or "lxml" (streaming, skips script/style/nav)
+    SCRAPER_ENGINE: str = os.getenv("SCRAPER_ENGINE", "bs4").lower()
+    
+    # Text extraction mode: "full" (all visible text) or "main" (article body only, boilerplate removed)
+    SCRAPER_EXTRACTION_MODE: str = os.getenv("SCRAPER_EXTRACTION_MODE", "full").lower()
+    
+    # Scrape cache (conditional GET with ETag / Last-Modified), stored under CACHE_DIR/scrape
+    SCRAPE_CACHE_ENABLED: bool = os.getenv("SCRAPE_CACHE_ENABLED", "true").lower() == "true"
+    SCRAPE_CACHE_MAX_BYTES: int = int(os.getenv("SCRAPE_CACHE_MAX_BYTES", 200 * 1024 * 1024))  # 200MB
+    
+    # Async batch ingestion settings (/api/articles/process-batch/)
+    SCRAPER_ASYNC_MAX_CONNECTIONS: int = int(os.getenv("SCRAPER_ASYNC_MAX_CONNECTIONS", 64))
+    SCRAPER_ASYNC_PER_HOST_LIMIT: int = int(os.getenv("SCRAPER_ASYNC_PER_HOST_LIMIT", 4))
+    BATCH_MAX_URLS: int = int(os.getenv("BATCH_MAX_URLS", 500))
+    BATCH_PARSE_CONCURRENCY: int = int(os.getenv("BATCH_PARSE_CONCURRENCY", 4))
+    BATCH_SUMMARIZE_CONCURRENCY: int = int(os.getenv("BATCH_SUMMARIZE_CONCURRENCY", 8))
+    
+    # OpenAI client connection pool (one client per process, see services.openai_client)
+    OPENAI_MAX_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", 20))
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", 10))
+    OPENAI_KEEPALIVE_EXPIRY: float = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", 60))
+    OPENAI_HTTP2: bool = os.getenv("OPENAI_HTTP2", "true").lower() == "true"  # Needs the h2 package
+    
+    # Thread pool for blocking LLM calls made from async handlers
+    LLM_MAX_WORKERS: int = int(os.getenv("LLM_MAX_WORKERS", 16))
+    
+    # Social post generation: run the per-platform caption / hashtags / image calls concurrently.
+    # SOCIAL_POST_MAX_CONCURRENCY sizes one pool shared by all jobs: it is the process-wide cap on
+    # those calls (the jobs themselves hold LLM_MAX_WORKERS threads while they wait on them)
+    SOCIAL_POST_CONCURRENT: bool = os.getenv("SOCIAL_POST_CONCURRENT", "true").lower() == "true"
+    SOCIAL_POST_MAX_CONCURRENCY: int = int(os.getenv("SOCIAL_POST_MAX_CONCURRENCY", 8))
+    # "batched": one LLM call for all platforms (per-platform fallback on invalid output), "per_platform"
+    SOCIAL_POST_GENERATION_MODE: str = os.getenv("SOCIAL_POST_GENERATION_MODE", "batched").lower()
+    
+    # Summary cache (summarize_with_openai results keyed by text, language, model and prompt version)
+    SUMMARY_CACHE_ENABLED: bool = os.getenv("SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+    SUMMARY_CACHE_TTL: int = int(os.getenv("SUMMARY_CACHE_TTL", 7 * 24 * 3600))  # Seconds, 0 = never expires
+    SUMMARY_CACHE_MAX_ENTRIES: int = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", 5000))
+    SUMMARY_CACHE_MAX_BYTES: int = int(os.getenv("SUMMARY_CACHE_MAX_BYTES", 100 * 1024 * 1024))  # 100MB
+    
+    # Font registry (fonts/ files preloaded at startup, FreeTypeFont objects memoized per path and size)
+    FONT_DIR: str = os.getenv("FONT_DIR", "fonts")
+    FONT_CACHE_MAX_ENTRIES: int = int(os.getenv("FONT_CACHE_MAX_ENTRIES", 128))
+    
+    # Frame cache (decoded RGBA frames per file version and target size, ~8 MB per 1920x1080 entry)
+    FRAME_CACHE_MAX_ENTRIES: int = int(os.getenv("FRAME_CACHE_MAX_ENTRIES", 8))
+    
+    # Article store (one row per article, replaces whole-file rewrites of articles_db.json)
+    # "sqlite": SQLite in WAL mode. articles_db.json is imported into the store on first start.
+    # "journal": articles_db.json snapshot + append-only articles_db.json.journal, compacted in the background
+    # "lazy": only an index (offsets, title, timestamps, bullet points) in memory, full_text / full_summary
+    #         read on demand from a memory-mapped JSON lines file
+    ARTICLE_STORE_BACKEND: str = os.getenv("ARTICLE_STORE_BACKEND", "sqlite").lower()
+    ARTICLE_STORE_PATH: str = os.getenv("ARTICLE_STORE_PATH", "articles_db.sqlite3")  # sqlite backend
+    ARTICLES_JSON_PATH: str = os.getenv("ARTICLES_JSON_PATH", "articles_db.json")
+    ARTICLE_JOURNAL_FSYNC_INTERVAL: float = float(os.getenv("ARTICLE_JOURNAL_FSYNC_INTERVAL", 0.05))  # Seconds
+    ARTICLE_JOURNAL_FSYNC_BATCH: int = int(os.getenv("ARTICLE_JOURNAL_FSYNC_BATCH", 64))  # Writes per forced fsync
+    ARTICLE_JOURNAL_COMPACT_BYTES: int = int(os.getenv("ARTICLE_JOURNAL_COMPACT_BYTES", 16 * 1024 * 1024))
+    ARTICLE_LAZY_PATH: str = os.getenv("ARTICLE_LAZY_PATH", "articles_db.jsonl")  # lazy backend, index in <path>.index
+    ARTICLE_LAZY_CACHE_ENTRIES: int = int(os.getenv("ARTICLE_LAZY_CACHE_ENTRIES", 256))  # Fully loaded articles kept in memory
+    
+    # Article listing (GET /api/articles/)
+    ARTICLES_PAGE_SIZE: int = int(os.getenv("ARTICLES_PAGE_SIZE", 50))  # Default page size
+    ARTICLES_PAGE_MAX: int = int(os.getenv("ARTICLES_PAGE_MAX", 200))  # Largest accepted limit
+    
+    # Response compression (gzip, or brotli when the brotli package is installed)
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))  # Smaller JSON bodies are sent as is
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 5))
+    
     # Video generation settings
     DEFAULT_LANGUAGE: str = "fr"
     DEFAULT_SLIDE_COUNT: int = 1
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Font Registry Module
+Process-wide cache of FreeTypeFont objects shared by the frame generators
+"""
+
+import os
+import logging
+import threading
+from io import BytesIO
+from collections import OrderedDict
+from PIL import ImageFont
+from typing import Dict, List, Optional, Tuple, Any
+from config.config import config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+FONT_EXTENSIONS = (".ttf", ".otf")
+FALLBACK_FONT = "arial.ttf"
+
+class FontRegistry:
+    """Preload font files and memoize FreeTypeFont instances per (path, size)"""
+
+    def __init__(self, font_dir: str = "fonts", max_entries: int = 128):
+        self.font_dir = font_dir
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._font_data = {}            # normalized path -> file bytes
+        self._fonts = OrderedDict()     # (path, size) -> font, least recently used first
+        self._candidates = {}           # tuple of requested paths -> those that exist
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def preload(self) -> int:
+        """
+        Read every font file of the font directory into memory
+
+        Returns:
+            int: Number of preloaded files
+        """
+        if not os.path.isdir(self.font_dir):
+            logger.warning(f"Font directory not found: {self.font_dir}")
+            return 0
+
+        loaded = {}
+        for filename in sorted(os.listdir(self.font_dir)):
+            if not filename.lower().endswith(FONT_EXTENSIONS):
+                continue
+            path = os.path.normpath(os.path.join(self.font_dir, filename))
+            try:
+                with open(path, "rb") as f:
+                    loaded[path] = f.read()
+            except OSError as e:
+                logger.warning(f"Could not preload font {path}: {e}")
+
+        with self._lock:
+            self._font_data.update(loaded)
+            self._candidates.clear()
+        logger.info(f"Preloaded {len(loaded)} fonts from {self.font_dir}")
+        return len(loaded)
+
+    def _existing_paths(self, font_paths: List[str]) -> List[str]:
+        """Get the requested paths that exist (checked once per list of paths)"""
+        key = tuple(font_paths)
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            candidates = []
+            for font_path in font_paths:
+                path = os.path.normpath(font_path)
+                if path in self._font_data or os.path.exists(path):
+                    candidates.append(path)
+            with self._lock:
+                self._candidates[key] = candidates
+        return candidates
+
+    def _load(self, path: str, size: int):
+        data = self._font_data.get(path)
+        if data is not None:
+            return ImageFont.truetype(BytesIO(data), size)
+        return ImageFont.truetype(path, size)
+
+    def _cached(self, key: Tuple[Optional[str], int]):
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                self.hits += 1
+            return font
+
+    def _store(self, key: Tuple[Optional[str], int], font) -> None:
+        with self._lock:
+            self.misses += 1
+            self._fonts[key] = font
+            self._fonts.move_to_end(key)
+            while len(self._fonts) > self.max_entries:
+                self._fonts.popitem(last=False)
+                self.evictions += 1
+
+    def get_font(self, font_paths: List[str], size: int) -> ImageFont.FreeTypeFont:
+        """
+        Get font with fallback options
+
+        Args:
+            font_paths (list): List of font paths to try, in order
+            size (int): Font size
+
+        Returns:
+            ImageFont.FreeTypeFont: Font object (shared, do not modify)
+        """
+        for path in self._existing_paths(font_paths):
+            key = (path, size)
+            font = self._cached(key)
+            if font is not None:
+                return font
+            try:
+                font = self._load(path, size)
+            except Exception as e:
+                logger.warning(f"Could not load font {path}: {e}")
+                continue
+            self._store(key, font)
+            return font
+
+        # Fallback to default font
+        key = (None, size)
+        font = self._cached(key)
+        if font is None:
+            try:
+                font = ImageFont.truetype(FALLBACK_FONT, size)
+            except Exception:
+                font = ImageFont.load_default()
+            self._store(key, font)
+        return font
+
+    def clear(self) -> None:
+        """Drop every cached font (the preloaded files are kept)"""
+        with self._lock:
+            self._fonts.clear()
+            self._candidates.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._fonts),
+                "max_entries": self.max_entries,
+                "preloaded_files": len(self._font_data)
+            }
+
+# Global font registry instance
+font_registry = FontRegistry(config.FONT_DIR, config.FONT_CACHE_MAX_ENTRIES)
+
+def get_font(font_paths: List[str], size: int) -> ImageFont.FreeTypeFont:
+    """
+    Convenience function to get a cached font
+    """
+    return font_registry.get_font(font_paths, size)
+
+def preload_fonts() -> int:
+    """
+    Convenience function to preload the font directory
+    """
+    return font_registry.preload()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Frame Cache Module
+Decoded, pre-resized RGBA frames kept in memory per frame file version and target size
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from PIL import Image
+from typing import Any, Dict, Optional, Tuple
+from config.config import config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class FrameCache:
+    """
+    Memoize frame files as ready-to-composite RGBA images
+
+    Entries are keyed by (path, version, target size), the version being the
+    file's (mtime_ns, size): a frame replaced on disk is reloaded on next use
+    even without an explicit invalidate(). Cached images are shared between
+    callers and must not be modified in place.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # (path, version, size or None) -> entry, least recently used first
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.resizes = 0
+        self.evictions = 0
+
+    def _version(self, path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _cached(self, key) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            # Drop every entry of an older version of the same file
+            for stale in [k for k in self._entries if k[0] == key[0] and k[1] != key[1]]:
+                del self._entries[stale]
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _entry(self, image: Image.Image) -> Dict[str, Any]:
+        return {"image": image, "box": image.getchannel('A').getbbox()}
+
+    def get(self, path: str, target_size: Optional[Tuple[int, int]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a frame file as an RGBA image, optionally resized (LANCZOS) to a target size
+
+        Args:
+            path (str): Frame file path
+            target_size (tuple, optional): (width, height). If None, the frame's own size
+
+        Returns:
+            dict or None: image (shared, read-only) and box (opaque bounding box,
+                          None if fully transparent), or None if the file does not exist
+        """
+        path = os.path.normpath(path)
+        version = self._version(path)
+        if version is None:
+            self.invalidate(path)
+            return None
+
+        # The sized entry first: it stays usable after the native frame is evicted
+        entry = None
+        if target_size is not None:
+            entry = self._cached((path, version, tuple(target_size)))
+        native_key = (path, version, None)
+        native = self._cached(native_key) if entry is None else None
+        if entry is None and native is not None and (target_size is None or native["image"].size == tuple(target_size)):
+            entry = native
+
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        with self._lock:
+            self.misses += 1
+
+        if native is None:
+            with Image.open(path) as opened:
+                native = self._entry(opened.convert("RGBA"))
+            with self._lock:
+                self.decodes += 1
+            self._store(native_key, native)
+
+        if target_size is None or native["image"].size == tuple(target_size):
+            return native
+
+        logger.info(f"Resizing frame {path} from {native['image'].size} to {tuple(target_size)}")
+        entry = self._entry(native["image"].resize(tuple(target_size), Image.LANCZOS))
+        with self._lock:
+            self.resizes += 1
+        self._store((path, version, tuple(target_size)), entry)
+        return entry
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """
+        Drop the cached frames of a file, or of every file
+
+        Returns:
+            int: Number of dropped entries
+        """
+        with self._lock:
+            if path is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            path = os.path.normpath(path)
+            stale = [k for k in self._entries if k[0] == path]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "decodes": self.decodes,
+                "resizes": self.resizes,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries
+            }
+
+# Global frame cache instance
+frame_cache = FrameCache(config.FRAME_CACHE_MAX_ENTRIES)
+
+def get_frame(path: str, target_size: Optional[Tuple[int, int]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Convenience function to get a cached frame
+    """
+    return frame_cache.get(path, target_size)
+
+def invalidate_frame(path: Optional[str] = None) -> int:
+    """
+    Convenience function to drop cached frames
+    """
+    return frame_cache.invalidate(path)
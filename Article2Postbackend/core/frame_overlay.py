@@ -10,6 +10,10 @@ from PIL import Image, ImageDraw, ImageFont
 from typing import Optional, Tuple, Dict, Any, List
 import textwrap
 from .smart_frame_generator import smart_frame_generator  # 🎨 NOUVEAU IMPORT
+from .font_registry import font_registry
+from .frame_cache import frame_cache
+from .text_layout import text_layout_engine
+from .render_pipeline import render_pipeline, image_layer, text_layer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -44,20 +48,9 @@ class FrameOverlay:
             size (int): Font size
             
         Returns:
-            ImageFont.FreeTypeFont: Font object
+            ImageFont.FreeTypeFont: Font object (shared through the font registry)
         """
-        for font_path in font_paths:
-            try:
-                if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, size)
-            except Exception as e:
-                logger.warning(f"Could not load font {font_path}: {e}")
-        
-        # Fallback to default font
-        try:
-            return ImageFont.truetype("arial.ttf", size)
-        except:
-            return ImageFont.load_default()
+        return font_registry.get_font(font_paths, size)
     
     def wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
         """
@@ -71,29 +64,7 @@ class FrameOverlay:
         Returns:
             List[str]: List of wrapped lines
         """
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            bbox = font.getbbox(test_line)
-            text_width = bbox[2] - bbox[0]
-            
-            if text_width <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                    current_line = word
-                else:
-                    # Single word is too long, force it
-                    lines.append(word)
-        
-        if current_line:
-            lines.append(current_line)
-        
-        return lines
+        return text_layout_engine.wrap(text, font, max_width)
     
     def draw_main_text(self, draw: ImageDraw.Draw, lines: List[str], font: ImageFont.FreeTypeFont, 
                       start_y: int, img_width: int, color: Tuple[int, int, int], 
@@ -140,6 +111,7 @@ class FrameOverlay:
             # Convert to RGBA and save
             frame_rgba = frame_image.convert('RGBA')
             frame_rgba.save(self.frame_path, "PNG")
+            frame_cache.invalidate(self.frame_path)
             
             logger.info(f"Frame saved persistently at {self.frame_path}")
             return True
@@ -148,30 +120,50 @@ class FrameOverlay:
             logger.error(f"Error saving persistent frame: {e}")
             return False
     
-    def load_frame(self) -> Optional[Image.Image]:
+    def load_frame(self, target_size: Tuple[int, int] = None) -> Optional[Image.Image]:
         """
         Load persistent frame if exists (priorité au frame intelligent)
         
+        Args:
+            target_size (tuple, optional): Resize the frame to (width, height)
+            
+        Returns:
+            Image.Image or None: Loaded frame (shared through the frame cache, do not modify) or None if not found
+        """
+        entry = self.load_cached_frame(target_size=target_size)
+        return entry["image"] if entry else None
+    
+    def load_cached_frame(self, article_data: Dict[str, Any] = None,
+                          target_size: Tuple[int, int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the frame to apply from the frame cache, resized to the target size
+        
+        Frame.png when generating for an article, else the smart frame, else Frame.png
+        
+        Args:
+            article_data (dict, optional): Données de l'article
+            target_size (tuple, optional): (width, height) of the base image
+            
         Returns:
-            Image.Image or None: Loaded frame or None if not found
+            dict or None: image (RGBA, shared) and box (opaque bounding box), or None if no frame file exists
         """
-        try:
+        if article_data:
+            candidates = [self.frame_path, self.smart_frame_path]
+        else:
             # 🎨 PRIORITÉ AU FRAME INTELLIGENT
-            if os.path.exists(self.smart_frame_path):
-                frame = Image.open(self.smart_frame_path).convert("RGBA")
-                logger.info("Smart frame loaded successfully")
-                return frame
-            elif os.path.exists(self.frame_path):
-                frame = Image.open(self.frame_path).convert("RGBA")
-                logger.info("Persistent frame loaded successfully")
-                return frame
-            else:
-                logger.info("No persistent frame found")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error loading persistent frame: {e}")
-            return None
+            candidates = [self.smart_frame_path, self.frame_path]
+        
+        for path in candidates:
+            try:
+                entry = frame_cache.get(path, target_size)
+            except Exception as e:
+                logger.error(f"Error loading frame {path}: {e}")
+                continue
+            if entry is not None:
+                return entry
+        
+        logger.info("No persistent frame found")
+        return None
     
     def generate_smart_frame_for_article(self, article_data: Dict[str, Any]) -> Optional[Image.Image]:
         """
@@ -181,14 +173,13 @@ class FrameOverlay:
             article_data (dict): Données de l'article (non utilisées pour le frame simple)
             
         Returns:
-            Image.Image or None: Frame existant exactement comme il est
+            Image.Image or None: Frame existant exactement comme il est (partagé via le cache de frames)
         """
         try:
             # Charger directement le Frame.png existant sans modification
-            if os.path.exists(self.frame_path):
-                frame = Image.open(self.frame_path).convert("RGBA")
-                logger.info("✅ Frame.png existant chargé sans modification")
-                return frame
+            entry = frame_cache.get(self.frame_path)
+            if entry is not None:
+                return entry["image"]
             else:
                 logger.warning("❌ Frame.png non trouvé")
                 return None
@@ -223,6 +214,87 @@ class FrameOverlay:
         # Fallback : utiliser le titre si pas de bullet points
         return article_data.get('title', 'Texte par défaut').strip()
     
+    def build_frame_layers(self, target_size: Tuple[int, int], bullet_point_text: str = None,
+                           frame_image: Optional[Image.Image] = None,
+                           article_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Build the frame and text layers for a base image of the given size
+        
+        Args:
+            target_size (tuple): (width, height) of the base image
+            bullet_point_text (str): Text to overlay on the frame (auto si None)
+            frame_image (Image.Image, optional): Frame to overlay. If None, génère automatiquement
+            article_data (dict, optional): Données de l'article pour génération automatique
+            
+        Returns:
+            dict: layers (for the render pipeline), text, text_lines and font_size
+        """
+        img_width, img_height = target_size
+        
+        # 🎨 GÉNÉRATION AUTOMATIQUE DU FRAME SI NÉCESSAIRE
+        if frame_image is None:
+            # Frame décodé et redimensionné une fois par version du fichier et taille cible
+            frame = self.load_cached_frame(article_data, target_size)
+            if frame is None:
+                raise ValueError("No frame provided and no persistent frame found")
+        else:
+            # Resize frame to match image size
+            frame_rgba = frame_image.convert('RGBA')
+            if frame_rgba.size != target_size:
+                logger.warning(f"Resizing frame from {frame_rgba.size} to {target_size}")
+                frame_rgba = frame_rgba.resize(target_size, Image.LANCZOS)
+            frame = {"image": frame_rgba, "box": None}
+        
+        # 🎨 OBTENTION AUTOMATIQUE DU TEXTE
+        if article_data:
+            bullet_point_text = self.get_bullet_point_text(article_data, bullet_point_text)
+        
+        if not bullet_point_text or not bullet_point_text.strip():
+            bullet_point_text = "Texte automatique du bullet point"
+        
+        logger.info(f"📝 Texte utilisé: {bullet_point_text[:50]}...")
+        
+        # Define text area parameters (32% du bas pour le texte)
+        black_band_height_assumption = int(img_height * 0.32)
+        text_area_top = img_height - black_band_height_assumption + 60
+        text_area_height = black_band_height_assumption - 80
+        side_margin = TEXT_SIDE_MARGIN
+        max_text_width = img_width - (side_margin * 2)
+        
+        # Calculate available height for main text
+        available_height_for_main_text = text_area_height - 60
+        
+        # Calculate main text size with adaptive sizing (largest size that fits, 1px resolution)
+        layout = text_layout_engine.fit(
+            bullet_point_text.strip(),
+            lambda size: self.get_font(self.preferred_fonts, size),
+            max_text_width,
+            available_height_for_main_text,
+            MIN_MAIN_FONT_SIZE,
+            INITIAL_MAIN_FONT_SIZE,
+            MAIN_TEXT_LINE_SPACING
+        )
+        
+        if layout["fits"]:
+            logger.info(f"Text fits with font size {layout['font_size']}px, {len(layout['lines'])} lines")
+        else:
+            logger.warning(f"Text may not fit properly, using minimum font size {MIN_MAIN_FONT_SIZE}px")
+        
+        # Calculate starting Y position to center text vertically in available area
+        start_y = text_area_top + (available_height_for_main_text - layout["total_height"]) // 2
+        
+        # Layer order matters: frame, then text
+        return {
+            "layers": [
+                image_layer(frame["image"], box=frame["box"]),
+                text_layer(layout["lines"], layout["font"], start_y, layout["line_height"],
+                           MAIN_TEXT_LINE_SPACING, DEFAULT_TEXT_COLOR)
+            ],
+            "text": bullet_point_text,
+            "text_lines": len(layout["lines"]),
+            "font_size": layout["font_size"]
+        }
+    
     def apply_frame_with_text(self, base_image_path: str, bullet_point_text: str = None,
                              frame_image: Optional[Image.Image] = None,
                              output_path: str = None,
@@ -234,141 +306,22 @@ class FrameOverlay:
             base_image_path (str): Path to the base image
             bullet_point_text (str): Text to overlay on the frame (auto si None)
             frame_image (Image.Image, optional): Frame to overlay. If None, génère automatiquement
-            output_path (str, optional): Output path. If None, overwrites original
+            output_path (str, optional): Output path. If None, the result is stored as a new image store blob
             article_data (dict, optional): Données de l'article pour génération automatique
             
         Returns:
             dict: Result with status and details
         """
         try:
-            # Load base image
-            if not os.path.exists(base_image_path):
-                raise FileNotFoundError(f"Base image not found: {base_image_path}")
-            
-            base_image = Image.open(base_image_path).convert('RGBA')
-            target_size = base_image.size
-            img_width, img_height = target_size
-            
-            logger.info(f"Processing image: {target_size}")
-            
-            # 🎨 GÉNÉRATION AUTOMATIQUE DU FRAME SI NÉCESSAIRE
-            if frame_image is None:
-                if article_data:
-                    # Générer un frame intelligent basé sur l'article
-                    frame_image = self.generate_smart_frame_for_article(article_data)
-                
-                if frame_image is None:
-                    # Fallback : charger le frame persistant
-                    frame_image = self.load_frame()
-                
-                if frame_image is None:
-                    return {
-                        "status": "error",
-                        "message": "No frame provided and no persistent frame found",
-                        "output_path": None
-                    }
-            
-            # 🎨 OBTENTION AUTOMATIQUE DU TEXTE
-            if article_data:
-                bullet_point_text = self.get_bullet_point_text(article_data, bullet_point_text)
-            
-            if not bullet_point_text or not bullet_point_text.strip():
-                bullet_point_text = "Texte automatique du bullet point"
+            base_image = render_pipeline.load_base(base_image_path)
+            logger.info(f"Processing image: {base_image.size}")
             
-            logger.info(f"📝 Texte utilisé: {bullet_point_text[:50]}...")
-            
-            # Resize frame to match image size
-            frame_rgba = frame_image.convert('RGBA')
-            if frame_rgba.size != target_size:
-                logger.warning(f"Resizing frame from {frame_rgba.size} to {target_size}")
-                frame_rgba = frame_rgba.resize(target_size, Image.LANCZOS)
-            
-            # Define text area parameters (32% du bas pour le texte)
-            black_band_height_assumption = int(img_height * 0.32)
-            text_area_top = img_height - black_band_height_assumption + 60
-            text_area_height = black_band_height_assumption - 80
-            side_margin = TEXT_SIDE_MARGIN
-            max_text_width = img_width - (side_margin * 2)
-            
-            # Calculate available height for main text
-            available_height_for_main_text = text_area_height - 60
-            
-            # Calculate main text size with adaptive sizing
-            current_font_size = INITIAL_MAIN_FONT_SIZE
-            final_lines = []
-            text_fits = False
-            main_font = None
-            
-            while current_font_size >= MIN_MAIN_FONT_SIZE:
-                try:
-                    main_font = self.get_font(self.preferred_fonts, current_font_size)
-                    wrapped_lines = self.wrap_text(bullet_point_text.strip(), main_font, max_text_width)
-                    
-                    # Calculate total height needed
-                    line_height_bbox = main_font.getbbox('Mg')
-                    actual_line_height = line_height_bbox[3] - line_height_bbox[1]
-                    total_height = len(wrapped_lines) * actual_line_height + max(0, len(wrapped_lines) - 1) * MAIN_TEXT_LINE_SPACING
-                    
-                    if total_height <= available_height_for_main_text:
-                        final_lines = wrapped_lines
-                        text_fits = True
-                        logger.info(f"Text fits with font size {current_font_size}px, {len(wrapped_lines)} lines")
-                        break
-                    else:
-                        current_font_size -= 5
-                        
-                except Exception as e:
-                    logger.error(f"Error calculating text size: {e}")
-                    current_font_size -= 5
-            
-            if not text_fits:
-                logger.warning(f"Text may not fit properly, using minimum font size {MIN_MAIN_FONT_SIZE}px")
-                main_font = self.get_font(self.preferred_fonts, MIN_MAIN_FONT_SIZE)
-                final_lines = self.wrap_text(bullet_point_text.strip(), main_font, max_text_width)
-            
-            # Create text overlay
-            text_overlay = Image.new('RGBA', target_size, (0, 0, 0, 0))
-            text_draw = ImageDraw.Draw(text_overlay)
-            
-            # Calculate starting Y position to center text vertically in available area
-            line_height_bbox = main_font.getbbox('Mg')
-            actual_line_height = line_height_bbox[3] - line_height_bbox[1]
-            total_text_height = len(final_lines) * actual_line_height + max(0, len(final_lines) - 1) * MAIN_TEXT_LINE_SPACING
-            start_y = text_area_top + (available_height_for_main_text - total_text_height) // 2
-            
-            # Draw the text
-            self.draw_main_text(
-                text_draw, 
-                final_lines, 
-                main_font, 
-                start_y, 
-                img_width, 
-                DEFAULT_TEXT_COLOR, 
-                actual_line_height, 
-                MAIN_TEXT_LINE_SPACING
-            )
-            
-            # Compositing sequence (ordre important!)
-            final_image = base_image                                                    # 1. Image de base
-            final_image = Image.alpha_composite(final_image, frame_rgba)               # 2. + Frame
-            final_image = Image.alpha_composite(final_image, text_overlay)             # 3. + Texte
-            
-            # Save result
-            output_path = output_path or base_image_path
-            final_image_rgb = final_image.convert('RGB')
-            final_image_rgb.save(output_path, "JPEG", quality=95)
+            frame = self.build_frame_layers(base_image.size, bullet_point_text, frame_image, article_data)
+            output_path = render_pipeline.render(base_image, frame["layers"], output_path)
             
             logger.info(f"Frame with text applied successfully to {output_path}")
             
-            return {
-                "status": "success",
-                "message": "Frame with text applied successfully",
-                "output_path": output_path,
-                "text_lines": len(final_lines),
-                "font_size": current_font_size,
-                "text_content": bullet_point_text[:50] + "..." if len(bullet_point_text) > 50 else bullet_point_text,
-                "smart_frame_used": article_data is not None  # 🎨 INDICATEUR FRAME INTELLIGENT
-            }
+            return self.frame_result(frame, output_path, article_data)
             
         except Exception as e:
             logger.error(f"Error applying frame with text: {e}")
@@ -377,6 +330,19 @@ class FrameOverlay:
                 "message": str(e),
                 "output_path": None
             }
+    
+    def frame_result(self, frame: Dict[str, Any], output_path: str, article_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Result of a frame application, from build_frame_layers() details"""
+        text = frame["text"]
+        return {
+            "status": "success",
+            "message": "Frame with text applied successfully",
+            "output_path": output_path,
+            "text_lines": frame["text_lines"],
+            "font_size": frame["font_size"],
+            "text_content": text[:50] + "..." if len(text) > 50 else text,
+            "smart_frame_used": article_data is not None  # 🎨 INDICATEUR FRAME INTELLIGENT
+        }
 
 # Global instance
 frame_overlay = FrameOverlay()
@@ -4,13 +4,11 @@ from PIL import Image, ImageDraw, ImageFont
 import textwrap
 from io import BytesIO
 import hashlib
-import re
-import shutil
-from openai import OpenAI
+from services.openai_client import get_openai_client
 from core.text_processor import fix_unicode
 from utils.image_utils import calculate_shadow, smart_wrap_text
-from prompts.image_generation_prompt import get_image_generation_prompt_from_json
-from utils.openai_utils import generate_image_prompt, generate_batch_image_prompts
+from utils.openai_utils import generate_image_prompt
+from utils.image_store import image_store, store_file
 import requests
 import json
 import time
@@ -42,142 +40,6 @@ def add_text_to_image(image, text):
     
     return image
 
-def generate_images_for_bullet_points(bullet_points, article_text, output_dir="cache/img/"):
-    """
-    Generate images for all bullet points in a batch
-    
-    Args:
-        bullet_points (list): List of bullet point texts
-        article_text (str): The full article text for context
-        output_dir (str): Directory to save the generated images
-        
-    Returns:
-        list: List of paths to the generated images
-    """
-    os.makedirs(output_dir, exist_ok=True)
-    image_paths = []
-    
-    try:
-        # Generate all image prompts in one batch API call
-        print(f"Generating image prompts for {len(bullet_points)} bullet points...")
-        image_prompts_data = generate_batch_image_prompts(bullet_points, article_text)
-        
-        # Process each image prompt
-        for i, prompt_data in enumerate(image_prompts_data):
-            bullet_point = prompt_data["bullet_point"]
-            image_prompt = prompt_data["image_prompt"]
-            keywords = prompt_data.get("keywords", [])
-            
-            print(f"Generating image {i+1}/{len(bullet_points)}: {bullet_point[:30]}...")
-            
-            # Create a sequential filename with zero-padding for easier tracking
-            output_file = os.path.join(output_dir, f"point_{i+1:02d}.jpg")
-            
-            # Generate the image using the optimized prompt
-            try:
-                print(f"Generating image with prompt: {image_prompt[:100]}...")
-                generate_image_with_prompt(image_prompt, output_file)
-                if os.path.exists(output_file):
-                    print(f"Successfully generated image: {output_file}")
-                    image_paths.append(output_file)
-                else:
-                    print(f"Image generation failed - file not created: {output_file}")
-                    raise Exception("Image file not created")
-            except Exception as e:
-                print(f"Error generating image for bullet point {i+1}: {e}")
-                # Create fallback image with consistent naming
-                fallback_file = os.path.join(output_dir, f"point_{i+1:02d}.jpg")
-                create_fallback_image(bullet_point, output_dir, fallback_file)
-                image_paths.append(fallback_file)
-    
-    except Exception as e:
-        print(f"Error in batch image generation: {e}")
-        # Create fallback images for all bullet points
-        for i, bullet_point in enumerate(bullet_points):
-            fallback_file = os.path.join(output_dir, f"point_{i+1:02d}.jpg")
-            create_fallback_image(bullet_point, output_dir, fallback_file)
-            image_paths.append(fallback_file)
-    
-    return image_paths
-
-def generate_image_from_json(article_id, output_dir="cache/img/"):
-    """
-    Generate image for article using data from JSON file
-    
-    Args:
-        article_id (int): The article ID to load from JSON
-        output_dir (str): Directory to save the generated image
-        
-    Returns:
-        str: Path to the generated image
-    """
-    os.makedirs(output_dir, exist_ok=True)
-    
-    try:
-        # Get image generation prompt from JSON data
-        print(f"Loading article {article_id} from JSON for image generation...")
-        prompt_data = get_image_generation_prompt_from_json(article_id)
-        
-        if not prompt_data:
-            print(f"No data found for article {article_id}")
-            return None
-        
-        # Load the bullet point from JSON for fallback
-        json_file_path = "cache/articles_data.json"
-        bullet_point = ""
-        if os.path.exists(json_file_path):
-            try:
-                with open(json_file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    article_data = data.get(str(article_id), {})
-                    bullet_point = article_data.get("bullet_point", "")
-            except Exception as e:
-                print(f"Error loading bullet point from JSON: {e}")
-        
-        # Generate image prompt using OpenAI
-        print(f"Generating image prompt for article {article_id}...")
-        try:
-            client = OpenAI()
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=prompt_data["messages"],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            image_prompt = response.choices[0].message.content
-            print(f"Generated image prompt: {image_prompt[:200]}...")
-            
-        except Exception as e:
-            print(f"Error generating image prompt: {e}")
-            # Use a simple fallback prompt
-            image_prompt = f"Professional editorial photograph related to: {bullet_point}"
-        
-        # Create output file
-        output_file = os.path.join(output_dir, f"point_01.jpg")
-        
-        # Generate the image
-        try:
-            print(f"Generating image for article {article_id}...")
-            generate_image_with_prompt(image_prompt, output_file)
-            
-            if os.path.exists(output_file):
-                print(f"Successfully generated image: {output_file}")
-                return output_file
-            else:
-                print(f"Image generation failed - file not created")
-                raise Exception("Image file not created")
-                
-        except Exception as e:
-            print(f"Error generating image: {e}")
-            # Create fallback image
-            create_fallback_image(bullet_point, output_dir, output_file)
-            return output_file
-    
-    except Exception as e:
-        print(f"Error in JSON-based image generation: {e}")
-        return None
-
 def generate_image_with_prompt(prompt, output_file, overlay_text=None):
     """
     Generate an image using OpenAI's DALL-E model with a specific prompt
@@ -190,21 +52,11 @@ def generate_image_with_prompt(prompt, output_file, overlay_text=None):
     Returns:
         None
     """
-    # Ensure we're using the standardized naming convention
-    # Extract the bullet point ID if present in the path
-    import re
-    match = re.search(r'(\d+)\.jpg$', output_file)
-    if match:
-        bp_id = int(match.group(1))
-        # Force the correct naming convention
-        dirname = os.path.dirname(output_file)
-        output_file = os.path.join(dirname, f"point_{bp_id:02d}.jpg")
-        print(f"Standardized output filename to: {output_file}")
     print(f"Generating image with prompt: {prompt[:10000]}...")
 
     try:
-        # Initialize OpenAI client. It will automatically use the OPENAI_API_KEY from the environment.
-        client = OpenAI()
+        # Shared OpenAI client (pooled connections, API key resolved once)
+        client = get_openai_client()
         
         # Use a try-except block specifically for the API call
         try:
@@ -324,28 +176,6 @@ def generate_image_with_prompt(prompt, output_file, overlay_text=None):
             if overlay_text:
                 img = add_text_to_image(img, overlay_text)
                 
-            # FINAL CHECK: Look for any generated images with the old naming convention and rename them
-            cache_dir = os.path.dirname(output_file)
-            # Extract the bullet point ID from our target filename
-            match = re.search(r'point_(\d+)\.jpg$', output_file)
-            if match:
-                bp_id = match.group(1)
-                # Check for the old naming convention file
-                old_format_file = os.path.join(cache_dir, f"generated_slide_{int(bp_id)}.jpg")
-                if os.path.exists(old_format_file) and old_format_file != output_file:
-                    print(f"Found image with old naming convention: {old_format_file}")
-                    try:
-                        # If the correct file doesn't exist yet, copy the old one
-                        if not os.path.exists(output_file):
-                            import shutil
-                            shutil.copy(old_format_file, output_file)
-                            print(f"Renamed {old_format_file} to {output_file}")
-                        # Delete the old file
-                        os.remove(old_format_file)
-                        print(f"Removed old file: {old_format_file}")
-                    except Exception as rename_error:
-                        print(f"Error renaming file: {rename_error}")
-                
         except Exception as api_error:
             print(f"OpenAI API error: {api_error}")
             raise ValueError(f"OpenAI API error: {api_error}")
@@ -424,16 +254,6 @@ def generate_image(text, output_file, overlay_text=None):
         output_file (str): Path to save the generated image
         overlay_text (str, optional): Text to draw on the image. Defaults to None.
     """
-    # Ensure we're using the standardized naming convention
-    # Extract the bullet point ID if present in the path
-    import re
-    match = re.search(r'(\d+)\.jpg$', output_file)
-    if match:
-        bp_id = int(match.group(1))
-        # Force the correct naming convention
-        dirname = os.path.dirname(output_file)
-        output_file = os.path.join(dirname, f"point_{bp_id:02d}.jpg")
-        print(f"Standardized output filename to: {output_file}")
     try:
         print(f"Generating image prompt for: {text[:100]}...")
         # Use the full text as both headline and context for better prompts
@@ -444,47 +264,28 @@ def generate_image(text, output_file, overlay_text=None):
         
     except Exception as e:
         print(f"Error in generate_image: {str(e)}, creating fallback image...")
-        # Create a fallback image with the overlay text or the base text
+        # Create a fallback image with the overlay text or the base text, at the caller's own path
         fallback_text = overlay_text or text
-        fallback_file = create_fallback_image(fallback_text, os.path.dirname(output_file))
-        
-        # Copy fallback to the expected output path if it's different
-        if fallback_file != output_file:
-            try:
-                shutil.copy(fallback_file, output_file)
-            except Exception as copy_error:
-                print(f"Error copying fallback image: {copy_error}")
+        create_fallback_image(fallback_text, os.path.dirname(output_file), output_file)
 
-def generate_image_for_text(text, output_file=None, article_text=None, index=None, force_regenerate=False):
+def generate_image_for_text(text, output_file=None, force_regenerate=False):
     """
     Generate an image for the given text and return the path to the created image
     
     Args:
         text (str): The text to generate an image for
-        output_file (str, optional): Specific output file path. If None, one will be generated.
-        article_text (str, optional): Additional context for image generation
-        index (int, optional): Index number for the image (for ordering)
+        output_file (str, optional): Specific output file path. If None, a private
+                                     work file of the image store
         force_regenerate (bool): If True, regenerate the image even if it exists
         
     Returns:
         str: Path to the generated image
     """
+    if output_file is None:
+        output_file = image_store.work_path()
+    print(f"Output file will be: {output_file}")
+    
     try:
-        # Ensure cache directory exists
-        os.makedirs("cache/img/", exist_ok=True)
-        
-        # If output_file is not specified, create one based on index or hash
-        if output_file is None:
-            if index is not None:
-                # Use zero-padded numbering for consistency
-                output_file = f"cache/img/point_{index:02d}.jpg"
-            else:
-                # Create a unique filename based on the hash of the text
-                text_hash = hashlib.md5(text.encode()).hexdigest()[:10]
-                output_file = f"cache/img/{text_hash}.jpg"
-        
-        print(f"Output file will be: {output_file}")
-        
         # Check if the image already exists to avoid regenerating
         if not force_regenerate and os.path.exists(output_file):
             print(f"Using cached image: {output_file}")
@@ -505,62 +306,45 @@ def generate_image_for_text(text, output_file=None, article_text=None, index=Non
                 print(f"Error verifying cached image: {img_error}, regenerating...")
                 force_regenerate = True
         
-        # If force_regenerate is True or the file doesn't exist or is invalid, generate a new image
-        if force_regenerate or not os.path.exists(output_file):
-            print(f"Generating new image for text: {text[:50]}...")
-            
-            try:
-                # Try to generate image with OpenAI
-                generate_image(text, output_file)
-                
-                # Verify the image was created and is valid
-                if os.path.exists(output_file):
-                    try:
-                        with Image.open(output_file) as img:
-                            # Check if the image is valid
-                            img_format = img.format
-                            img_size = img.size
-                            print(f"Successfully generated image: {output_file} ({img_format}, {img_size})")
-                            return output_file
-                    except Exception as img_verify_error:
-                        print(f"Error verifying generated image: {img_verify_error}, creating fallback...")
-                        raise Exception(f"Invalid image generated: {img_verify_error}")
-                else:
-                    raise FileNotFoundError(f"Image generation failed - file not created: {output_file}")
-            except Exception as gen_error:
-                print(f"Error in image generation: {str(gen_error)}, creating fallback image...")
-                # Let it continue to the fallback
-                raise gen_error
+        print(f"Generating new image for text: {text[:50]}...")
+        
+        # Try to generate image with OpenAI
+        generate_image(text, output_file)
+        
+        # Verify the image was created and is valid
+        if not os.path.exists(output_file):
+            raise FileNotFoundError(f"Image generation failed - file not created: {output_file}")
+        try:
+            with Image.open(output_file) as img:
+                print(f"Successfully generated image: {output_file} ({img.format}, {img.size})")
+                return output_file
+        except Exception as img_verify_error:
+            print(f"Error verifying generated image: {img_verify_error}, creating fallback...")
+            raise Exception(f"Invalid image generated: {img_verify_error}")
     except Exception as e:
         print(f"Error in generate_image_for_text: {str(e)}")
-        # Create a fallback image
-        if index is not None:
-            fallback_file = f"cache/img/point_{index:02d}.jpg"
-            return create_fallback_image(text, "cache/img/", fallback_file)
-        else:
-            return create_fallback_image(text, "cache/img/")
-            
-    # FINAL CHECK: Look for any generated images with the old naming convention and rename them
-    if index is not None:
-        cache_dir = "cache/img/"
-        # Check for the old naming convention file
-        old_format_file = os.path.join(cache_dir, f"generated_slide_{index}.jpg")
-        correct_file = os.path.join(cache_dir, f"point_{index:02d}.jpg")
-        
-        if os.path.exists(old_format_file):
-            print(f"Found image with old naming convention: {old_format_file}")
-            try:
-                # If the correct file doesn't exist yet, copy the old one
-                if not os.path.exists(correct_file):
-                    import shutil
-                    shutil.copy(old_format_file, correct_file)
-                    print(f"Renamed {old_format_file} to {correct_file}")
-                # Delete the old file
-                os.remove(old_format_file)
-                print(f"Removed old file: {old_format_file}")
-                # Return the path to the correctly named file
-                return correct_file
-            except Exception as rename_error:
-                print(f"Error renaming file: {rename_error}")
+        # Create a fallback image at the same (private) path
+        return create_fallback_image(text, os.path.dirname(output_file), output_file)
+
+def generate_stored_image(text, article_id=None, role=None):
+    """
+    Generate an image for the given text into the content-addressed image store
+    
+    The image is generated into a private work file, so concurrent jobs never
+    write to the same path, then moved to its hash-named blob.
     
-    return output_file 
\ No newline at end of file
+    Args:
+        text (str): The text to generate an image for
+        article_id (optional): Article whose manifest records the image
+        role (str, optional): Manifest role, e.g. "point_01" or "post_instagram"
+        
+    Returns:
+        str: Path to the image blob
+    """
+    work_file = image_store.work_path()
+    result_path = generate_image_for_text(text, output_file=work_file, force_regenerate=True)
+    try:
+        return store_file(result_path, article_id, role)
+    finally:
+        if os.path.exists(work_file):
+            os.remove(work_file)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Image Renditions Module
+Produces platform-sized renditions (1080x1080, 1200x630, ...) of a source image
+"""
+
+import os
+import hashlib
+import logging
+import threading
+import numpy as np
+from PIL import Image
+from typing import Dict, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+RENDITION_JPEG_QUALITY = 90
+ENERGY_MAP_MAX_SIDE = 256      # Smart crop analysis runs on a thumbnail this big
+CENTER_BIAS = 0.15             # Penalty for crop windows far from the center (0 = none)
+HASH_CHUNK_SIZE = 1024 * 1024
+SOURCE_LOCK_STRIPES = 64       # Locks shared by source hash, so renders of one source never overlap
+
+def parse_image_format(image_format: str) -> Tuple[int, int]:
+    """
+    Parse a PLATFORM_CONFIGS image format
+
+    Args:
+        image_format (str): e.g. "1080x1080"
+
+    Returns:
+        tuple: (width, height)
+    """
+    width, height = image_format.lower().split("x")
+    return int(width), int(height)
+
+def hash_file(path: str) -> str:
+    """Compute the SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def compute_energy_map(image: Image.Image) -> Tuple[np.ndarray, float]:
+    """
+    Compute an edge-energy map of a downscaled grayscale copy of the image
+
+    Returns:
+        tuple: (energy array of shape (h, w), scale from thumbnail to source pixels)
+    """
+    scale = max(image.width, image.height) / ENERGY_MAP_MAX_SIDE
+    if scale > 1:
+        thumbnail = image.convert("L").resize(
+            (max(1, round(image.width / scale)), max(1, round(image.height / scale))),
+            Image.BILINEAR
+        )
+    else:
+        scale = 1.0
+        thumbnail = image.convert("L")
+
+    gray = np.asarray(thumbnail, dtype=np.float32)
+    energy = np.zeros_like(gray)
+    energy[:, 1:] += np.abs(np.diff(gray, axis=1))
+    energy[1:, :] += np.abs(np.diff(gray, axis=0))
+    return energy, scale
+
+def best_window(profile: np.ndarray, window: int) -> int:
+    """
+    Find the start of the window of the given length with the most energy
+
+    Args:
+        profile (np.ndarray): Energy per column (or row)
+        window (int): Window length, in profile cells
+
+    Returns:
+        int: Start index of the best window
+    """
+    length = len(profile)
+    if window >= length:
+        return 0
+    cumulative = np.concatenate(([0.0], np.cumsum(profile, dtype=np.float64)))
+    sums = cumulative[window:] - cumulative[:-window]
+
+    # Slight preference for centered windows, so flat images crop in the middle
+    starts = np.arange(len(sums))
+    center = (length - window) / 2
+    distance = np.abs(starts - center) / max(center, 1)
+    scores = sums * (1 - CENTER_BIAS * distance)
+    return int(np.argmax(scores))
+
+def smart_crop_box(size: Tuple[int, int], target: Tuple[int, int],
+                   energy: np.ndarray, scale: float) -> Tuple[float, float, float, float]:
+    """
+    Find the crop box with the target aspect ratio that keeps the most detailed region
+
+    Args:
+        size (tuple): Source (width, height)
+        target (tuple): Target (width, height)
+        energy (np.ndarray): Energy map from compute_energy_map()
+        scale (float): Thumbnail to source scale
+
+    Returns:
+        tuple: (left, upper, right, lower) in source pixels
+    """
+    width, height = size
+    target_ratio = target[0] / target[1]
+
+    if width / height > target_ratio:
+        # Too wide: keep the full height, slide horizontally
+        crop_width = height * target_ratio
+        window = max(1, round(crop_width / scale))
+        left = best_window(energy.sum(axis=0), window) * scale
+        left = min(max(left, 0), width - crop_width)
+        return (left, 0, left + crop_width, height)
+
+    # Too tall (or same ratio): keep the full width, slide vertically
+    crop_height = width / target_ratio
+    window = max(1, round(crop_height / scale))
+    top = best_window(energy.sum(axis=1), window) * scale
+    top = min(max(top, 0), height - crop_height)
+    return (0, top, width, top + crop_height)
+
+class RenditionEngine:
+    """Render and cache sized renditions of source images"""
+
+    def __init__(self, cache_dir: str = "cache/renditions"):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._source_locks = [threading.Lock() for _ in range(SOURCE_LOCK_STRIPES)]
+        self._hashes = {}         # (path, mtime, size) -> source hash
+        self.hits = 0
+        self.misses = 0
+
+    def source_hash(self, source_path: str) -> str:
+        """Get the content hash of a source image (memoized per path, mtime and size)"""
+        stat = os.stat(source_path)
+        key = (os.path.abspath(source_path), stat.st_mtime_ns, stat.st_size)
+        source_hash = self._hashes.get(key)
+        if source_hash is None:
+            source_hash = hash_file(source_path)
+            self._hashes[key] = source_hash
+        return source_hash
+
+    def rendition_path(self, source_hash: str, size: Tuple[int, int]) -> str:
+        return os.path.join(self.cache_dir, f"{source_hash[:32]}_{size[0]}x{size[1]}.jpg")
+
+    def render(self, source_path: str, sizes: Dict[str, Tuple[int, int]]) -> Dict[str, str]:
+        """
+        Get renditions of a source image, rendering the missing ones from a single decode
+
+        Args:
+            source_path (str): Source image path
+            sizes (dict): Name (e.g. platform) -> (width, height)
+
+        Returns:
+            dict: Name -> rendition path
+        """
+        source_hash = self.source_hash(source_path)
+        paths = {name: self.rendition_path(source_hash, size) for name, size in sizes.items()}
+
+        # Fixed set of striped locks: a source is decoded once at a time, and the lock
+        # table does not grow with the number of sources a long-lived server sees
+        source_lock = self._source_locks[int(source_hash[:8], 16) % len(self._source_locks)]
+        with source_lock:
+            missing = {size for name, size in sizes.items() if not os.path.exists(paths[name])}
+            with self._lock:
+                self.hits += len(set(sizes.values())) - len(missing)
+                self.misses += len(missing)
+            if missing:
+                self._render_sizes(source_path, source_hash, missing)
+
+        return paths
+
+    def _render_sizes(self, source_path: str, source_hash: str, sizes) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Decode once; every size is cut from this shared buffer
+        with Image.open(source_path) as opened:
+            image = opened.convert("RGB")
+        energy, scale = compute_energy_map(image)
+
+        for size in sizes:
+            box = smart_crop_box(image.size, size, energy, scale)
+            # Crop and resample in one high-quality pass
+            rendition = image.resize(size, Image.LANCZOS, box=box)
+
+            output_path = self.rendition_path(source_hash, size)
+            tmp_path = f"{output_path}.{threading.get_ident()}.tmp"
+            rendition.save(tmp_path, "JPEG", quality=RENDITION_JPEG_QUALITY, optimize=True)
+            os.replace(tmp_path, output_path)
+            logger.info(f"Rendered {size[0]}x{size[1]} rendition: {output_path}")
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+# Global rendition engine instance
+rendition_engine = RenditionEngine()
+
+def render_platform_images(source_path: str, image_formats: Dict[str, str]) -> Dict[str, str]:
+    """
+    Convenience function to get the renditions of an image for several platforms
+
+    Args:
+        source_path (str): Source image path
+        image_formats (dict): Platform -> image format (e.g. "1200x630")
+
+    Returns:
+        dict: Platform -> rendition path
+    """
+    sizes = {platform: parse_image_format(image_format) for platform, image_format in image_formats.items()}
+    return rendition_engine.render(source_path, sizes)
+
+def render_platform_image(source_path: str, image_format: str) -> str:
+    """
+    Convenience function to get the rendition of an image for one platform
+
+    Args:
+        source_path (str): Source image path
+        image_format (str): Image format (e.g. "1080x1080")
+
+    Returns:
+        str: Rendition path
+    """
+    return render_platform_images(source_path, {image_format: image_format})[image_format]
@@ -9,6 +9,7 @@ import logging
 from PIL import Image
 from typing import Optional, Tuple, Dict, Any
 from .frame_overlay import frame_overlay  # 👈 NOUVEAU IMPORT
+from .render_pipeline import render_pipeline, image_layer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -105,7 +106,7 @@ class LogoOverlay:
         Args:
             base_image_path (str): Path to the base image
             logo_image (Image.Image, optional): Logo to overlay. If None, loads persistent logo
-            output_path (str, optional): Output path. If None, overwrites original
+            output_path (str, optional): Output path. If None, the result is stored as a new image store blob
             logo_size (tuple, optional): Logo size. If None, uses default
             position (str): Logo position
             offset (tuple): Offset from edges
@@ -114,61 +115,14 @@ class LogoOverlay:
             dict: Result with status and details
         """
         try:
-            # Load base image
-            if not os.path.exists(base_image_path):
-                raise FileNotFoundError(f"Base image not found: {base_image_path}")
+            base_image = render_pipeline.load_base(base_image_path)
             
-            base_image = Image.open(base_image_path).convert('RGBA')
-            img_width, img_height = base_image.size
-            
-            # Get logo
-            if logo_image is None:
-                logo_image = self.load_persistent_logo()
-                if logo_image is None:
-                    return {
-                        "status": "error",
-                        "message": "No logo provided and no persistent logo found",
-                        "output_path": None
-                    }
-            
-            # Prepare logo
-            logo_rgba = logo_image.convert('RGBA') if logo_image.mode != 'RGBA' else logo_image
-            
-            # Use fixed logo size inspired by your code: 150x70 pixels
-            FIXED_LOGO_SIZE = (150, 70)  # 👈 TAILLE FINALE DU LOGO : 150x70 pixels
-            
-            if logo_size is None:
-                logo_size = FIXED_LOGO_SIZE  # Use fixed size by default
-            
-            # Always resize logo to specified size with high quality
-            logo_resized = logo_rgba.resize(logo_size, Image.LANCZOS)  # 👈 REDIMENSIONNEMENT haute qualité
-            
-            # Calculate position
-            logo_x, logo_y = self.calculate_logo_position(
-                (img_width, img_height), logo_size, position, offset
-            )
-            
-            # Create logo overlay
-            logo_overlay = Image.new('RGBA', (img_width, img_height), (0, 0, 0, 0))
-            logo_overlay.paste(logo_resized, (logo_x, logo_y), logo_resized)
-            
-            # Composite final image
-            final_image = Image.alpha_composite(base_image, logo_overlay)
-            
-            # Save result
-            output_path = output_path or base_image_path
-            final_image_rgb = final_image.convert('RGB')
-            final_image_rgb.save(output_path, "JPEG", quality=95)
+            logo = self.build_logo_layer(base_image.size, logo_image, logo_size, position, offset)
+            output_path = render_pipeline.render(base_image, [logo["layer"]], output_path)
             
             logger.info(f"Logo overlay applied successfully to {output_path}")
             
-            return {
-                "status": "success",
-                "message": "Logo overlay applied successfully",
-                "output_path": output_path,
-                "logo_position": (logo_x, logo_y),
-                "logo_size": logo_size
-            }
+            return self.logo_result(logo, output_path)
             
         except Exception as e:
             logger.error(f"Error adding logo overlay: {e}")
@@ -178,6 +132,59 @@ class LogoOverlay:
                 "output_path": None
             }
     
+    def build_logo_layer(self, image_size: Tuple[int, int], logo_image: Optional[Image.Image] = None,
+                         logo_size: Tuple[int, int] = None, position: str = "top_right",
+                         offset: Tuple[int, int] = (30, 30)) -> Dict[str, Any]:
+        """
+        Build the logo layer for a base image of the given size
+        
+        Args:
+            image_size (tuple): (width, height) of the base image
+            logo_image (Image.Image, optional): Logo to overlay. If None, loads persistent logo
+            logo_size (tuple, optional): Logo size. If None, uses default
+            position (str): Logo position
+            offset (tuple): Offset from edges
+            
+        Returns:
+            dict: layer (for the render pipeline), logo_position and logo_size
+        """
+        # Get logo
+        if logo_image is None:
+            logo_image = self.load_persistent_logo()
+            if logo_image is None:
+                raise ValueError("No logo provided and no persistent logo found")
+        
+        # Prepare logo
+        logo_rgba = logo_image.convert('RGBA') if logo_image.mode != 'RGBA' else logo_image
+        
+        # Use fixed logo size inspired by your code: 150x70 pixels
+        FIXED_LOGO_SIZE = (150, 70)  # 👈 TAILLE FINALE DU LOGO : 150x70 pixels
+        
+        if logo_size is None:
+            logo_size = FIXED_LOGO_SIZE  # Use fixed size by default
+        
+        # Always resize logo to specified size with high quality
+        logo_resized = logo_rgba.resize(logo_size, Image.LANCZOS)  # 👈 REDIMENSIONNEMENT haute qualité
+        
+        # Calculate position
+        logo_x, logo_y = self.calculate_logo_position(image_size, logo_size, position, offset)
+        
+        return {
+            "layer": image_layer(logo_resized, (logo_x, logo_y)),
+            "logo_position": (logo_x, logo_y),
+            "logo_size": logo_size
+        }
+    
+    def logo_result(self, logo: Dict[str, Any], output_path: str) -> Dict[str, Any]:
+        """Result of a logo application, from build_logo_layer() details"""
+        return {
+            "status": "success",
+            "message": "Logo overlay applied successfully",
+            "output_path": output_path,
+            "logo_position": logo["logo_position"],
+            "logo_size": logo["logo_size"]
+        }
+    
     def batch_add_logo(self, image_paths: list, logo_image: Optional[Image.Image] = None,
                       **kwargs) -> Dict[str, Any]:
         """
@@ -226,7 +233,7 @@ class LogoOverlay:
             bullet_point_text (str): Text to overlay on the frame (auto si None)
             logo_image (Image.Image, optional): Logo to overlay
             frame_image (Image.Image, optional): Frame to overlay
-            output_path (str, optional): Output path. If None, overwrites original
+            output_path (str, optional): Output path. If None, the result is stored as a new image store blob
             logo_size (tuple, optional): Logo size. If None, uses default (150, 70)
             position (str): Logo position
             article_data (dict, optional): Données de l'article pour génération automatique
@@ -235,48 +242,31 @@ class LogoOverlay:
             dict: Combined result with status and details
         """
         try:
-            # Étape 1: Appliquer le frame avec le texte (AVEC INTELLIGENCE)
-            logger.info("Step 1: Applying intelligent frame with text...")
-            frame_result = frame_overlay.apply_frame_with_text(
-                base_image_path, 
-                bullet_point_text, 
-                frame_image, 
-                output_path,
+            # Une seule passe : décodage de la base, frame + texte + logo composités en mémoire, un seul encodage
+            base_image = render_pipeline.load_base(base_image_path)
+            
+            logger.info("Step 1: Building intelligent frame with text layers...")
+            frame = frame_overlay.build_frame_layers(
+                base_image.size,
+                bullet_point_text,
+                frame_image,
                 article_data=article_data  # 🎨 PASSER LES DONNÉES DE L'ARTICLE
             )
             
-            if frame_result["status"] != "success":
-                return {
-                    "status": "error",
-                    "message": f"Frame application failed: {frame_result['message']}",
-                    "frame_result": frame_result,
-                    "logo_result": None
-                }
+            logger.info("Step 2: Building logo layer on top of intelligent frame...")
+            logo = self.build_logo_layer(base_image.size, logo_image, logo_size, position)
             
-            # Étape 2: Appliquer le logo sur l'image avec frame
-            logger.info("Step 2: Applying logo on top of intelligent frame...")
-            logo_result = self.add_logo_to_image(
-                frame_result["output_path"],
-                logo_image,
-                output_path,
-                logo_size,
-                position
-            )
+            output_path = render_pipeline.render(base_image, frame["layers"] + [logo["layer"]], output_path)
             
-            if logo_result["status"] != "success":
-                return {
-                    "status": "error", 
-                    "message": f"Logo application failed: {logo_result['message']}",
-                    "frame_result": frame_result,
-                    "logo_result": logo_result
-                }
+            frame_result = frame_overlay.frame_result(frame, output_path, article_data)
+            logo_result = self.logo_result(logo, output_path)
             
             logger.info("✅ Intelligent Frame + Logo application completed successfully!")
             
             return {
                 "status": "success",
                 "message": "Intelligent frame with text and logo applied successfully",
-                "output_path": logo_result["output_path"],
+                "output_path": output_path,
                 "frame_result": frame_result,
                 "logo_result": logo_result,
                 "text_content": frame_result.get("text_content"),
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Render Pipeline Module
+Composites base image, frame, text and logo layers in memory and encodes once
+"""
+
+import os
+import logging
+import threading
+from PIL import Image, ImageDraw
+from typing import Any, Dict, List, Optional
+from utils.image_store import image_store
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+JPEG_QUALITY = 95
+TEXT_BOX_PADDING = 2    # Pixels around the text ink box, for antialiasing
+
+def image_layer(image: Image.Image, position=(0, 0), box=None) -> Dict[str, Any]:
+    """
+    Build an image layer (frame, logo, ...)
+
+    Args:
+        image (Image.Image): RGBA image
+        position (tuple): Top-left corner on the base image
+        box (tuple, optional): Precomputed opaque bounding box of the image. Default: computed at composite time
+
+    Returns:
+        dict: Layer description
+    """
+    layer = {"kind": "image", "image": image, "position": tuple(position)}
+    if box is not None:
+        layer["box"] = tuple(box)
+    return layer
+
+def text_layer(lines: List[str], font, start_y: int, line_height: int, line_spacing: int,
+               color=(255, 255, 255)) -> Dict[str, Any]:
+    """
+    Build a text layer: lines centered horizontally, starting at start_y
+
+    Args:
+        lines (list): Wrapped text lines
+        font (ImageFont.FreeTypeFont): Font to draw with
+        start_y (int): Y position of the first line
+        line_height (int): Height of each line
+        line_spacing (int): Spacing between lines
+        color (tuple): Text color
+
+    Returns:
+        dict: Layer description
+    """
+    return {
+        "kind": "text",
+        "lines": lines,
+        "font": font,
+        "start_y": start_y,
+        "line_height": line_height,
+        "line_spacing": line_spacing,
+        "color": color
+    }
+
+class RenderPipeline:
+    """Decode a base image once, composite layers over it in memory, encode once"""
+
+    def __init__(self, jpeg_quality: int = JPEG_QUALITY):
+        self.jpeg_quality = jpeg_quality
+        self._lock = threading.Lock()
+        self.allocated_pixels = 0   # Overlay pixels allocated
+        self.blended_pixels = 0     # Destination pixels alpha-composited
+
+    def load_base(self, base_image_path: str) -> Image.Image:
+        """
+        Decode the base image
+
+        Returns:
+            Image.Image: RGBA base image
+        """
+        if not os.path.exists(base_image_path):
+            raise FileNotFoundError(f"Base image not found: {base_image_path}")
+        with Image.open(base_image_path) as opened:
+            return opened.convert('RGBA')
+
+    def text_box(self, layer: Dict[str, Any], img_width: int) -> Dict[str, Any]:
+        """
+        Place the lines of a text layer
+
+        Returns:
+            dict: positions (x, y of each line) and bbox (union of the line boxes, in image pixels)
+        """
+        measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+        positions = []
+        left = top = right = bottom = None
+        current_y = layer["start_y"]
+        for line in layer["lines"]:
+            line_bbox = measure.textbbox((0, 0), line, font=layer["font"])
+            line_width = line_bbox[2] - line_bbox[0]
+            start_x = (img_width - line_width) // 2  # Centrage horizontal
+            positions.append((start_x, current_y))
+            box = (start_x + line_bbox[0], current_y + line_bbox[1], start_x + line_bbox[2], current_y + line_bbox[3])
+            left = box[0] if left is None else min(left, box[0])
+            top = box[1] if top is None else min(top, box[1])
+            right = box[2] if right is None else max(right, box[2])
+            bottom = box[3] if bottom is None else max(bottom, box[3])
+            current_y += layer["line_height"] + layer["line_spacing"]
+        bbox = None
+        if positions:
+            bbox = (left - TEXT_BOX_PADDING, top - TEXT_BOX_PADDING,
+                    right + TEXT_BOX_PADDING, bottom + TEXT_BOX_PADDING)
+        return {"positions": positions, "bbox": bbox}
+
+    def blend(self, result: Image.Image, image: Image.Image, position, box=None) -> None:
+        """
+        Alpha-composite a region of an image onto result, in place, clipped to result
+
+        Args:
+            result (Image.Image): RGBA destination, modified in place
+            image (Image.Image): RGBA source
+            position (tuple): Where the source's top-left corner lands on result
+            box (tuple, optional): Region of the source to blend. Default: all of it
+        """
+        box = box or (0, 0, image.width, image.height)
+        left = max(position[0] + box[0], 0)
+        top = max(position[1] + box[1], 0)
+        right = min(position[0] + box[2], result.width)
+        bottom = min(position[1] + box[3], result.height)
+        if right <= left or bottom <= top:
+            return
+        source = (left - position[0], top - position[1], right - position[0], bottom - position[1])
+        result.alpha_composite(image, (left, top), source)
+        with self._lock:
+            self.blended_pixels += (right - left) * (bottom - top)
+
+    def composite(self, base_image: Image.Image, layers: List[Dict[str, Any]]) -> Image.Image:
+        """
+        Composite layers over the base image, in order
+
+        Only the region each layer actually covers is allocated and blended:
+        the opaque bounding box of image layers, the ink bounding box of text.
+
+        Args:
+            base_image (Image.Image): RGBA base image, modified in place
+            layers (list): Layers from image_layer() / text_layer()
+
+        Returns:
+            Image.Image: RGBA result
+        """
+        result = base_image
+        for layer in layers:
+            if layer["kind"] == "image":
+                image = layer["image"]
+                box = layer["box"] if "box" in layer else image.getchannel('A').getbbox()
+                if box:
+                    self.blend(result, image, layer["position"], box)
+            elif layer["kind"] == "text":
+                placed = self.text_box(layer, result.width)
+                bbox = placed["bbox"]
+                if bbox is None:
+                    continue
+                overlay = Image.new('RGBA', (bbox[2] - bbox[0], bbox[3] - bbox[1]), (0, 0, 0, 0))
+                with self._lock:
+                    self.allocated_pixels += overlay.width * overlay.height
+                draw = ImageDraw.Draw(overlay)
+                for line, (x, y) in zip(layer["lines"], placed["positions"]):
+                    draw.text((x - bbox[0], y - bbox[1]), line, fill=layer["color"], font=layer["font"])
+                self.blend(result, overlay, (bbox[0], bbox[1]))
+            else:
+                raise ValueError(f"Unknown layer kind: {layer['kind']}")
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"allocated_pixels": self.allocated_pixels, "blended_pixels": self.blended_pixels}
+
+    def encode(self, image: Image.Image, output_path: Optional[str] = None) -> str:
+        """
+        Encode the result as JPEG, to output_path or as a new image store blob
+
+        Returns:
+            str: Output path
+        """
+        image_rgb = image.convert('RGB')
+        if output_path:
+            image_rgb.save(output_path, "JPEG", quality=self.jpeg_quality)
+            return output_path
+        return image_store.save_image(image_rgb, quality=self.jpeg_quality)
+
+    def render(self, base_image: Image.Image, layers: List[Dict[str, Any]], output_path: Optional[str] = None) -> str:
+        """
+        Composite layers over an already decoded base image and encode the result once
+
+        Args:
+            base_image (Image.Image): RGBA base image (see load_base()), modified in place
+            layers (list): Layers, bottom to top
+            output_path (str, optional): Output path. If None, stored as a new image store blob
+
+        Returns:
+            str: Output path
+        """
+        output_path = self.encode(self.composite(base_image, layers), output_path)
+        logger.info(f"Rendered {len(layers)} layers to {output_path}")
+        return output_path
+
+# Global render pipeline instance
+render_pipeline = RenderPipeline()
+
+def render_layers(base_image_path: str, layers: List[Dict[str, Any]], output_path: Optional[str] = None) -> str:
+    """
+    Convenience function to render layers over a base image file
+    """
+    return render_pipeline.render(render_pipeline.load_base(base_image_path), layers, output_path)
@@ -10,6 +10,9 @@ from PIL import Image, ImageDraw, ImageFont
 from typing import Optional, Tuple, Dict, Any
 from datetime import datetime
 import locale
+import numpy as np
+from .font_registry import font_registry
+from .frame_cache import frame_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -53,18 +56,8 @@ class SmartFrameGenerator:
         }
     
     def get_font(self, font_paths: list, size: int) -> ImageFont.FreeTypeFont:
-        """Obtenir une police avec fallback"""
-        for font_path in font_paths:
-            try:
-                if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, size)
-            except Exception as e:
-                logger.warning(f"Could not load font {font_path}: {e}")
-        
-        try:
-            return ImageFont.truetype("arial.ttf", size)
-        except:
-            return ImageFont.load_default()
+        """Obtenir une police avec fallback (mise en cache par le registre de polices)"""
+        return font_registry.get_font(font_paths, size)
     
     def detect_category(self, article_title: str, bullet_points: list) -> str:
         """Détecter automatiquement la catégorie de l'article"""
@@ -126,24 +119,41 @@ class SmartFrameGenerator:
         day_name = days_fr.get(now.strftime('%A'), now.strftime('%A'))
         return f"{day_name}, {now.strftime('%d/%m/%Y')}"
     
+    def vertical_gradient(self, width: int, row_colors) -> Image.Image:
+        """
+        Construire une image dont chaque ligne est d'une couleur unie
+        
+        Args:
+            width (int): Largeur de l'image
+            row_colors (array): Couleur de chaque ligne, forme (hauteur, 3) pour RGB ou (hauteur, 4) pour RGBA
+            
+        Returns:
+            Image.Image: Image RGB ou RGBA de taille (width, hauteur)
+        """
+        rows = np.asarray(row_colors, dtype=np.uint8)
+        mode = 'RGBA' if rows.shape[1] == 4 else 'RGB'
+        if rows.shape[0] == 0 or width == 0:
+            return Image.new(mode, (width, rows.shape[0]))
+        # Colonne de 1 pixel étirée sur la largeur (NEAREST recopie exactement chaque ligne)
+        column = Image.fromarray(np.ascontiguousarray(rows[:, np.newaxis, :]), mode)
+        return column.resize((width, rows.shape[0]), Image.NEAREST)
+    
     def create_gradient_background(self, width: int, height: int, color1: tuple, color2: tuple) -> Image.Image:
         """Créer un arrière-plan avec dégradé"""
-        image = Image.new('RGB', (width, height))
+        # Position de chaque ligne dans le dégradé (0.0 à 1.0)
+        ratio = np.arange(height)[:, np.newaxis] / height
         
-        for y in range(height):
-            # Calculer la position dans le dégradé (0.0 à 1.0)
-            ratio = y / height
-            
-            # Interpoler entre les deux couleurs
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            
-            # Dessiner une ligne horizontale avec cette couleur
-            for x in range(width):
-                image.putpixel((x, y), (r, g, b))
+        # Interpoler entre les deux couleurs (même calcul flottant et troncature que int())
+        rows = np.asarray(color1[:3], dtype=np.float64) * (1 - ratio) + np.asarray(color2[:3], dtype=np.float64) * ratio
         
-        return image
+        return self.vertical_gradient(width, np.trunc(rows))
+    
+    def create_text_zone_gradient(self, width: int, text_zone_height: int) -> Image.Image:
+        """Créer le dégradé d'opacité de la zone de texte (240 en haut vers 220 en bas)"""
+        rows = np.empty((text_zone_height, 4), dtype=np.float64)
+        rows[:, :3] = self.colors["black_text_bg"]
+        rows[:, 3] = np.clip(np.trunc(240 - (np.arange(text_zone_height) * 20 / text_zone_height)), 200, 240)
+        return self.vertical_gradient(width, rows)
     
     def generate_smart_frame_from_existing(self, base_frame_path: str = "cache/Frame.png", 
                                           category: str = None, article_title: str = "", 
@@ -346,13 +356,9 @@ class SmartFrameGenerator:
         
         # 4. EFFET D'OMBRE ET PROFONDEUR (comme dans le screenshot)
         # Gradient subtil dans la zone de texte pour donner de la profondeur
-        for i in range(text_zone_height):
-            alpha = int(240 - (i * 20 / text_zone_height))  # Gradient d'opacité
-            alpha = max(200, min(240, alpha))
-            y_pos = text_zone_y + i
-            if y_pos < height:
-                draw.line([(0, y_pos), (width, y_pos)], 
-                         fill=(*self.colors["black_text_bg"], alpha))
+        # (remplace les pixels de chaque ligne, comme draw.line sur une image RGBA)
+        if text_zone_height > 0:
+            frame.paste(self.create_text_zone_gradient(width, text_zone_height), (0, text_zone_y))
         
         # 5. ÉLÉMENTS DÉCORATIFS SUBTILS (comme dans le screenshot)
         # Petites lignes décoratives dans la zone de texte
@@ -370,6 +376,7 @@ class SmartFrameGenerator:
         try:
             os.makedirs(os.path.dirname(path), exist_ok=True)
             frame.save(path, "PNG")
+            frame_cache.invalidate(path)
             logger.info(f"Frame sauvegardé: {path}")
             return True
         except Exception as e:
@@ -6,13 +6,18 @@ Generates optimized social media posts from articles instead of videos
 
 import os
 import json
+import re
 import time
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from services.openai_client import get_openai_api_key
-from openai import OpenAI
-from core.image_generator import generate_image_for_text
+from config.config import config as app_config
+from services.openai_client import get_openai_client, safely_parse_json
+from core.image_generator import generate_stored_image
+from core.image_renditions import render_platform_images
 from utils.json_utils import save_and_clean_json
+from utils.image_store import image_store, post_role
 
 # Platform-specific configurations
 PLATFORM_CONFIGS = {
@@ -42,6 +47,37 @@ PLATFORM_CONFIGS = {
     }
 }
 
+# Process-wide pool for the per-platform caption / hashtags / image calls.
+# Jobs run on the LLM pool (run_llm_call) and only wait on these futures, so
+# SOCIAL_POST_MAX_CONCURRENCY caps those calls across all jobs, not per job.
+_social_post_executor = None
+_social_post_executor_lock = threading.Lock()
+
+def get_social_post_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool shared by every social post generation job
+    
+    Returns:
+        ThreadPoolExecutor: Pool of Config.SOCIAL_POST_MAX_CONCURRENCY threads
+    """
+    global _social_post_executor
+    if _social_post_executor is None:
+        with _social_post_executor_lock:
+            if _social_post_executor is None:
+                _social_post_executor = ThreadPoolExecutor(
+                    max_workers=max(1, app_config.SOCIAL_POST_MAX_CONCURRENCY),
+                    thread_name_prefix="social-post"
+                )
+    return _social_post_executor
+
+def shutdown_social_post_executor() -> None:
+    """Stop the social post thread pool, waiting for running calls"""
+    global _social_post_executor
+    with _social_post_executor_lock:
+        executor, _social_post_executor = _social_post_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
 def generate_social_posts(article_data: Dict[str, Any], platforms: List[str] = None, language: str = "fr") -> Dict[str, Any]:
     """
     Generate social media posts from article data
@@ -62,53 +98,306 @@ def generate_social_posts(article_data: Dict[str, Any], platforms: List[str] = N
     # Create output directory
     os.makedirs("cache/social_posts/", exist_ok=True)
     
+    # One image for the whole article, rendered at every platform size, prepared while the texts are generated
+    images_future = get_social_post_executor().submit(prepare_post_images, article_data, platforms)
+    
     posts = {}
+    remaining_platforms = list(platforms)
+    
+    if app_config.SOCIAL_POST_GENERATION_MODE == "batched":
+        posts = generate_social_posts_batched(article_data, platforms, language)
+        remaining_platforms = [platform for platform in platforms if platform not in posts]
+        if remaining_platforms:
+            print(f"Falling back to per-platform generation for: {remaining_platforms}")
+    
+    if app_config.SOCIAL_POST_CONCURRENT and len(remaining_platforms) > 1:
+        posts.update(generate_social_posts_concurrently(article_data, remaining_platforms, language))
+    else:
+        for platform in remaining_platforms:
+            try:
+                print(f"Generating post for {platform}...")
+                post = generate_platform_post(article_data, platform, language)
+                posts[platform] = post
+            except Exception as e:
+                print(f"Error generating post for {platform}: {e}")
+                posts[platform] = {"error": str(e)}
+    
+    images = images_future.result()
+    for post in posts.values():
+        if "error" not in post:
+            post["image_path"] = images.get(post["platform"])
+    
+    # Keep the requested platform order
+    posts = {platform: posts[platform] for platform in platforms if platform in posts}
+    
+    # Save posts to file (one file per article, so concurrent jobs don't overwrite each other)
+    article_id = article_data.get("id")
+    posts_file = f"generated_posts_{article_id}.json" if article_id is not None else "generated_posts.json"
+    save_and_clean_json(posts, os.path.join("cache/social_posts", posts_file))
     
+    return posts
+
+def prepare_post_images(article_data: Dict[str, Any], platforms: List[str]) -> Dict[str, str]:
+    """
+    Get the image of every platform's post, from one source image for the whole article
+    
+    The source is the article's existing image (with logo) if it has one. Otherwise a
+    single image is generated for all platforms, never one per platform. It is rendered
+    at every platform size from a single decode, and each rendition is recorded as the
+    platform's image in the article's manifest.
+    
+    Returns:
+        Dictionary of rendition paths per platform (empty if no image could be produced)
+    """
+    source_path = find_existing_post_image(article_data, "all platforms")
+    try:
+        if not source_path:
+            # 🔄 FALLBACK : Générer une seule image pour toutes les plateformes
+            bullet_points = article_data.get("summary", [])
+            main_content = bullet_points[0] if bullet_points else "Article content"
+            print("No existing image with logo found, generating one image for all platforms")
+            source_path = generate_stored_image(create_comprehensive_image_prompt(main_content))
+        
+        renditions = render_platform_images(source_path, {
+            platform: PLATFORM_CONFIGS.get(platform, PLATFORM_CONFIGS["instagram"])["image_format"]
+            for platform in platforms
+        })
+    except Exception as e:
+        print(f"Error preparing post images: {e}")
+        return {}
+    
+    article_id = article_data.get("id")
+    if article_id is not None:
+        for platform, output_path in renditions.items():
+            image_store.record(article_id, post_role(platform), output_path)
+    print(f"✅ Post images rendered for {list(renditions)} from {source_path}")
+    return renditions
+
+def generate_social_posts_concurrently(article_data: Dict[str, Any], platforms: List[str], language: str) -> Dict[str, Any]:
+    """
+    Generate the posts of all platforms at once
+    
+    Every platform x (caption, hashtags) call runs on the shared social post
+    pool (get_social_post_executor), so the total time approaches the slowest
+    single call. A failing platform gets an error entry, the others are
+    unaffected. Images are attached by generate_social_posts.
+    """
+    bullet_points = article_data.get("summary", [])
+    executor = get_social_post_executor()
+    print(f"Generating posts for {len(platforms)} platforms concurrently...")
+    
+    futures = {}
     for platform in platforms:
+        config = PLATFORM_CONFIGS.get(platform, PLATFORM_CONFIGS["instagram"])
+        futures[platform] = (
+            executor.submit(generate_optimized_caption, bullet_points, platform, language, config),
+            executor.submit(generate_hashtags, bullet_points, platform, language, config)
+        )
+    
+    posts = {}
+    for platform, (caption_future, hashtags_future) in futures.items():
         try:
-            print(f"Generating post for {platform}...")
-            post = generate_platform_post(article_data, platform, language)
-            posts[platform] = post
+            posts[platform] = build_platform_post(
+                platform, language, caption_future.result(), hashtags_future.result()
+            )
         except Exception as e:
             print(f"Error generating post for {platform}: {e}")
             posts[platform] = {"error": str(e)}
     
-    # Save posts to file
-    save_and_clean_json(posts, "cache/social_posts/generated_posts.json")
+    return posts
+
+def generate_social_posts_batched(article_data: Dict[str, Any], platforms: List[str], language: str) -> Dict[str, Any]:
+    """
+    Generate the posts of all platforms with a single LLM call
+    
+    Platforms whose generated content fails validation are left out of the
+    result, so the caller can generate them with the per-platform path.
+    Images are attached by generate_social_posts.
+    """
+    bullet_points = article_data.get("summary", [])
+    try:
+        contents = generate_batched_post_contents(bullet_points, platforms, language)
+    except Exception as e:
+        print(f"Error in batched social post generation: {e}")
+        return {}
+    
+    posts = {}
+    for platform, content in contents.items():
+        try:
+            posts[platform] = build_platform_post(
+                platform, language, content["caption"], content["hashtags"],
+                call_to_action=content["call_to_action"]
+            )
+        except Exception as e:
+            print(f"Error generating post for {platform}: {e}")
+            posts[platform] = {"error": str(e)}
     
     return posts
 
-def generate_platform_post(article_data: Dict[str, Any], platform: str, language: str) -> Dict[str, Any]:
+def generate_batched_post_contents(bullet_points: List[str], platforms: List[str], language: str) -> Dict[str, Dict[str, Any]]:
     """
-    Generate a single platform-specific social media post
+    Ask once for the caption, hashtags and call-to-action of every platform
+    
+    Returns:
+        Dictionary of validated contents per platform (invalid platforms are missing)
+    """
+    client = get_openai_client()
+    
+    prompt = create_batched_posts_prompt(bullet_points, platforms, language)
+    
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "Tu es un expert en marketing des réseaux sociaux. Tu réponds uniquement en JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.7,
+        max_tokens=1000 * len(platforms)
+    )
+    
+    result, error = safely_parse_json(response.choices[0].message.content)
+    if not isinstance(result, dict):
+        raise ValueError(f"Invalid batched post JSON: {error}")
+    
+    contents = {}
+    for platform in platforms:
+        content = validate_batched_post_content(result.get(platform), platform)
+        if content:
+            contents[platform] = content
+        else:
+            print(f"Batched content for {platform} failed validation")
+    
+    return contents
+
+def validate_batched_post_content(content: Any, platform: str) -> Optional[Dict[str, Any]]:
+    """
+    Validate the generated content of one platform and enforce its PLATFORM_CONFIGS limits
+    
+    Returns:
+        The normalized content, or None if it is unusable
     """
+    if not isinstance(content, dict):
+        return None
     config = PLATFORM_CONFIGS.get(platform, PLATFORM_CONFIGS["instagram"])
     
-    # Extract key information from article
-    bullet_points = article_data.get("summary", [])
-    full_text = article_data.get("full_text", "")
+    caption = content.get("caption")
+    if not isinstance(caption, str) or not caption.strip():
+        return None
+    caption = caption.strip()
+    if len(caption) > config["max_caption_length"]:
+        caption = caption[:config["max_caption_length"]-3] + "..."
+    
+    raw_hashtags = content.get("hashtags")
+    if isinstance(raw_hashtags, str):
+        raw_hashtags = raw_hashtags.split()
+    if not isinstance(raw_hashtags, list):
+        return None
+    hashtags = []
+    for tag in raw_hashtags:
+        if not isinstance(tag, str):
+            continue
+        match = re.search(r'\w+', tag)
+        if match and f"#{match.group(0)}" not in hashtags:
+            hashtags.append(f"#{match.group(0)}")
+    if not hashtags:
+        return None
+    
+    call_to_action = content.get("call_to_action")
+    if not isinstance(call_to_action, str) or not call_to_action.strip():
+        call_to_action = None
+    
+    return {
+        "caption": caption,
+        "hashtags": hashtags[:config["recommended_hashtags"]],
+        "call_to_action": call_to_action.strip() if call_to_action else None
+    }
+
+def create_batched_posts_prompt(bullet_points: List[str], platforms: List[str], language: str) -> str:
+    """
+    Create a prompt asking for the posts of several platforms as one JSON object
+    """
+    platform_styles = {
+        "instagram": "engageant et visuel, avec des émojis et un ton inspirant",
+        "facebook": "conversationnel et informatif, encourageant les interactions",
+        "linkedin": "professionnel et informatif, axé sur la valeur business",
+        "twitter": "concis et accrocheur, avec un angle d'actualité"
+    }
+    
+    bullet_text = "\n".join([f"- {point}" for point in bullet_points])
     
+    platform_lines = []
+    for platform in platforms:
+        config = PLATFORM_CONFIGS.get(platform, PLATFORM_CONFIGS["instagram"])
+        style = platform_styles.get(platform, "engageant")
+        platform_lines.append(
+            f"- {platform} : style {style}, maximum {config['max_caption_length']} caractères, "
+            f"{config['recommended_hashtags']} hashtags"
+        )
+    platform_text = "\n".join(platform_lines)
+    
+    prompt = f"""
+Génère un post en {language} pour chacune de ces plateformes, basé sur ces points clés :
+
+{bullet_text}
+
+Plateformes :
+{platform_text}
+
+Instructions :
+- Inclus un hook accrocheur au début de chaque caption
+- Utilise des émojis appropriés (sauf LinkedIn)
+- N'inclus PAS les hashtags dans la caption
+- Hashtags en {language}, mix de hashtags populaires et de niche, format #hashtag
+- Un call-to-action court adapté à chaque plateforme
+
+Réponds avec un objet JSON de la forme :
+{{"<plateforme>": {{"caption": "...", "hashtags": ["#...", "..."], "call_to_action": "..."}}}}
+avec une clé par plateforme : {", ".join(platforms)}
+"""
+    
+    return prompt
+
+def find_existing_post_image(article_data: Dict[str, Any], platform: str) -> Optional[str]:
+    """
+    Find an existing image (with logo applied) of this article to reuse for the post
+    
+    Only the article's own images are considered (manifest, then bullet points),
+    never whatever happens to be in cache/img, which may belong to another article.
+    """
     # 🎯 RECHERCHER L'IMAGE EXISTANTE AVEC LOGO APPLIQUÉ
     existing_image_path = None
     
-    # 1. Chercher dans les bullet_points s'il y a une image avec logo
-    for bullet_point in article_data.get("bullet_points", []):
-        if bullet_point.get("image_path") and os.path.exists(bullet_point["image_path"]):
-            existing_image_path = bullet_point["image_path"]
-            print(f"Found existing image for {platform}: {existing_image_path}")
-            break
+    # 1. Chercher dans le manifeste d'images de l'article
+    article_id = article_data.get("id")
+    if article_id is not None:
+        images = image_store.load_manifest(article_id)
+        for role in sorted(role for role in images if role.startswith("point_")):
+            existing_image_path = image_store.resolve(images[role])
+            if existing_image_path:
+                break
     
-    # 2. Si pas d'image trouvée dans l'article, chercher dans le cache img
+    # 2. Sinon, chercher dans les bullet_points s'il y a une image avec logo
     if not existing_image_path:
-        cache_img_dir = "cache/img"
-        if os.path.exists(cache_img_dir):
-            for img_file in os.listdir(cache_img_dir):
-                if img_file.lower().endswith(('.jpg', '.jpeg', '.png')):
-                    img_path = os.path.join(cache_img_dir, img_file)
-                    if os.path.exists(img_path):
-                        existing_image_path = img_path
-                        print(f"Found cached image for {platform}: {existing_image_path}")
-                        break
+        for bullet_point in article_data.get("bullet_points", []):
+            if isinstance(bullet_point, dict):
+                existing_image_path = image_store.resolve(bullet_point.get("image_path"))
+                if existing_image_path:
+                    break
+    
+    if existing_image_path:
+        print(f"Found existing image for {platform}: {existing_image_path}")
+    
+    return existing_image_path
+
+def generate_platform_post(article_data: Dict[str, Any], platform: str, language: str) -> Dict[str, Any]:
+    """
+    Generate a single platform-specific social media post
+    """
+    config = PLATFORM_CONFIGS.get(platform, PLATFORM_CONFIGS["instagram"])
+    
+    # Extract key information from article
+    bullet_points = article_data.get("summary", [])
     
     # Generate optimized caption
     caption = generate_optimized_caption(bullet_points, platform, language, config)
@@ -116,11 +405,18 @@ def generate_platform_post(article_data: Dict[str, Any], platform: str, language
     # Generate hashtags
     hashtags = generate_hashtags(bullet_points, platform, language, config)
     
-    # Generate call-to-action
-    cta = generate_call_to_action(platform, language)
+    # The image is attached by generate_social_posts (one image shared by all platforms)
+    return build_platform_post(platform, language, caption, hashtags)
+
+def build_platform_post(platform: str, language: str, caption: str, hashtags: List[str], image_path: Optional[str] = None,
+                        call_to_action: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Assemble a post object from its generated parts
+    """
+    config = PLATFORM_CONFIGS.get(platform, PLATFORM_CONFIGS["instagram"])
     
-    # Generate image for the post (using existing image with logo if available)
-    image_path = generate_post_image(bullet_points, platform, config, existing_image_path)
+    # Generate call-to-action
+    cta = call_to_action or generate_call_to_action(platform, language)
     
     # Create post object
     post = {
@@ -142,10 +438,7 @@ def generate_optimized_caption(bullet_points: List[str], platform: str, language
     Generate an optimized caption for the specific platform
     """
     try:
-        api_key = get_openai_api_key()
-        if not api_key:
-            raise ValueError("OpenAI API key not found")
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client()
         
         # Create platform-specific prompt
         prompt = create_caption_prompt(bullet_points, platform, language, config)
@@ -212,10 +505,7 @@ def generate_hashtags(bullet_points: List[str], platform: str, language: str, co
     Generate relevant hashtags for the post
     """
     try:
-        api_key = get_openai_api_key()
-        if not api_key:
-            raise ValueError("OpenAI API key not found")
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client()
         
         max_hashtags = config["recommended_hashtags"]
         bullet_text = " ".join(bullet_points)
@@ -288,54 +578,14 @@ def generate_call_to_action(platform: str, language: str) -> str:
     
     return random.choice(language_ctas)
 
-def generate_post_image(bullet_points: List[str], platform: str, config: Dict, existing_image_path: str = None) -> str:
-    """
-    Generate a single image based on the single bullet point for social media posts
-    If an existing image with logo is available, use it instead of generating a new one
-    """
-    try:
-        # 🎯 PRIORITÉ : Utiliser l'image existante avec logo si disponible
-        if existing_image_path and os.path.exists(existing_image_path):
-            print(f"Using existing image with logo for {platform}: {existing_image_path}")
-            
-            # Copier l'image existante vers le dossier des posts sociaux
-            output_path = f"cache/social_posts/{platform}_post_image.jpg"
-            
-            # Copier l'image avec logo vers le dossier des posts sociaux
-            import shutil
-            shutil.copy2(existing_image_path, output_path)
-            
-            print(f"✅ Image with logo copied for {platform}: {output_path}")
-            return output_path
-        
-        # 🔄 FALLBACK : Générer une nouvelle image si aucune image avec logo n'existe
-        print(f"No existing image with logo found, generating new image for {platform}")
-        
-        # Use the single bullet point (first and only one)
-        main_content = bullet_points[0] if bullet_points else "Article content"
-        
-        # Create platform-specific image prompt for the bullet point
-        image_prompt = create_comprehensive_image_prompt(main_content, platform)
-        
-        # Generate single image for the article
-        output_path = f"cache/social_posts/{platform}_post_image.jpg"
-        
-        # Use existing image generation function
-        from ..core.image_generator import generate_image_for_text
-        generate_image_for_text(image_prompt, output_path)
-        
-        print(f"Generated new image for {platform} based on: {main_content[:50]}...")
-        return output_path
-        
-    except Exception as e:
-        print(f"Error generating image for {platform}: {e}")
-        return None
-
-def create_comprehensive_image_prompt(content: str, platform: str) -> str:
+def create_comprehensive_image_prompt(content: str, platform: Optional[str] = None) -> str:
     """
     Create a comprehensive image prompt representing the entire article
+    
+    Without a platform, the image is meant to be cropped for every platform.
     """
     platform_styles = {
+        None: "Versatile social media image with a clear central focal point, suited to square and landscape crops",
         "instagram": "Modern, vibrant Instagram post with clean design and engaging visual elements",
         "facebook": "Professional Facebook post image with clear focal point and readable text overlay",
         "linkedin": "Business-appropriate LinkedIn image with professional colors and subtle branding",
@@ -343,6 +593,7 @@ def create_comprehensive_image_prompt(content: str, platform: str) -> str:
     }
     
     style = platform_styles.get(platform, platform_styles["instagram"])
+    target_format = f"{platform} format" if platform else "square and landscape crops"
     
     prompt = f"""
 Create a {style} representing this article content: {content}
@@ -352,7 +603,7 @@ Style requirements:
 - High contrast for mobile viewing
 - Minimal text overlay
 - Professional photography style
-- Optimized for {platform} format
+- Optimized for {target_format}
 - Single cohesive image representing the main theme
 - Attractive and engaging for social media sharing
 """
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Text Layout Module
+Word-width memoization, greedy wrapping on cumulative widths and font-size fitting
+"""
+
+import logging
+import threading
+import weakref
+from PIL import ImageFont
+from typing import Callable, Dict, List, Any, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MAX_WORDS_PER_FONT = 4096       # Word metrics kept per font before the table is reset
+LINE_HEIGHT_PROBE = "Mg"        # Same probe as the former per-size measurement
+
+class TextLayoutEngine:
+    """
+    Wrap and fit text with as few FreeType calls as possible
+
+    Each word is measured once per font object (advance width and ink
+    extent). A line of words i..j then spans
+    advance(i..j-1) + spaces + ink_right(j) - ink_left(i),
+    which is what font.getbbox(line) returns, so wrapping needs no
+    measurement of growing test lines.
+    """
+
+    def __init__(self, max_words_per_font: int = MAX_WORDS_PER_FONT):
+        self.max_words_per_font = max_words_per_font
+        self._lock = threading.Lock()
+        self._metrics = weakref.WeakKeyDictionary()  # font -> {word: (advance, ink_left, ink_right)}
+        self._line_heights = weakref.WeakKeyDictionary()  # font -> line height
+        self.measurements = 0
+
+    def _font_metrics(self, font) -> Dict[str, Tuple[float, int, int]]:
+        with self._lock:
+            metrics = self._metrics.get(font)
+            if metrics is None or len(metrics) > self.max_words_per_font:
+                metrics = {}
+                self._metrics[font] = metrics
+            return metrics
+
+    def measure(self, font, word: str) -> Tuple[float, int, int]:
+        """
+        Get the advance width and horizontal ink extent of a word
+
+        Returns:
+            tuple: (advance, ink_left, ink_right)
+        """
+        metrics = self._font_metrics(font)
+        measured = metrics.get(word)
+        if measured is None:
+            bbox = font.getbbox(word)
+            measured = (font.getlength(word), bbox[0], bbox[2])
+            metrics[word] = measured
+            with self._lock:
+                self.measurements += 1
+        return measured
+
+    def wrap(self, text: str, font, max_width: int) -> List[str]:
+        """
+        Wrap text to fit within specified width (greedy, like FrameOverlay.wrap_text)
+
+        Args:
+            text (str): Text to wrap
+            font (ImageFont.FreeTypeFont): Font to use
+            max_width (int): Maximum width in pixels
+
+        Returns:
+            List[str]: List of wrapped lines
+        """
+        words = text.split()
+        if not words:
+            return []
+        space = self.measure(font, " ")[0]
+        measured = [self.measure(font, word) for word in words]
+
+        lines = []
+        start = 0
+        line_left = measured[0][1]
+        pen = 0.0  # Advance from the start of the line to the start of the current word
+        for index in range(1, len(words)):
+            pen += measured[index - 1][0] + space
+            ink_right = measured[index][2]
+            if pen + ink_right - line_left > max_width:
+                lines.append(" ".join(words[start:index]))
+                start = index
+                line_left = measured[index][1]
+                pen = 0.0
+        lines.append(" ".join(words[start:]))
+        return lines
+
+    def line_height(self, font) -> int:
+        """Height of a line of text (ink extent of the probe string), measured once per font"""
+        with self._lock:
+            height = self._line_heights.get(font)
+        if height is None:
+            bbox = font.getbbox(LINE_HEIGHT_PROBE)
+            height = bbox[3] - bbox[1]
+            with self._lock:
+                self._line_heights[font] = height
+                self.measurements += 1
+        return height
+
+    def fit(self, text: str, get_font: Callable[[int], Any], max_width: int, max_height: int,
+            min_size: int, max_size: int, line_spacing: int) -> Dict[str, Any]:
+        """
+        Find the largest font size (1px resolution) whose wrapped text fits in a box
+
+        Args:
+            text (str): Text to lay out
+            get_font (callable): Size -> font (e.g. a font registry lookup)
+            max_width (int): Box width in pixels
+            max_height (int): Box height in pixels
+            min_size (int): Smallest font size allowed
+            max_size (int): Largest font size tried
+            line_spacing (int): Spacing between lines in pixels
+
+        Returns:
+            dict: font, font_size, lines, line_height, total_height and fits
+                  (at min_size when nothing fits)
+        """
+        def layout(size):
+            font = get_font(size)
+            lines = self.wrap(text, font, max_width)
+            line_height = self.line_height(font)
+            total_height = len(lines) * line_height + max(0, len(lines) - 1) * line_spacing
+            return {
+                "font": font,
+                "font_size": size,
+                "lines": lines,
+                "line_height": line_height,
+                "total_height": total_height,
+                "fits": total_height <= max_height
+            }
+
+        # Larger sizes never need fewer lines, so "fits" flips once over the size range
+        best = None
+        low, high = min_size, max_size
+        while low <= high:
+            size = (low + high) // 2
+            candidate = layout(size)
+            if candidate["fits"]:
+                best = candidate
+                low = size + 1
+            else:
+                high = size - 1
+
+        if best is None:
+            best = layout(min_size)
+        return best
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"measurements": self.measurements, "fonts": len(self._metrics)}
+
+# Global text layout engine instance
+text_layout_engine = TextLayoutEngine()
+
+def wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
+    """
+    Convenience function to wrap text with memoized word widths
+    """
+    return text_layout_engine.wrap(text, font, max_width)
+
+def fit_text(text: str, get_font: Callable[[int], Any], max_width: int, max_height: int,
+             min_size: int, max_size: int, line_spacing: int) -> Dict[str, Any]:
+    """
+    Convenience function to find the largest font size at which text fits a box
+    """
+    return text_layout_engine.fit(text, get_font, max_width, max_height, min_size, max_size, line_spacing)
@@ -1,7 +1,8 @@
-from .openai_summarization_prompt import get_openai_summarization_prompt
+from .openai_summarization_prompt import get_openai_summarization_prompt, PROMPT_VERSION
 from .image_generation_prompt import get_image_generation_prompt_from_json
 
 __all__ = [
     'get_openai_summarization_prompt',
+    'PROMPT_VERSION',
     'get_image_generation_prompt_from_json'
 ] 
\ No newline at end of file
@@ -88,17 +88,13 @@ def get_image_generation_prompt_from_json(article_id):
     """
     import re
     
-    # Load article data from JSON
-    json_file_path = "cache/articles_data.json"
-    article_data = None
+    # Load article data from the article store
+    from services.article_store import load_image_generation_data
     
     try:
-        if os.path.exists(json_file_path):
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                article_data = data.get(str(article_id))
+        article_data = load_image_generation_data(article_id)
     except Exception as e:
-        print(f"Error loading article data from JSON: {e}")
+        print(f"Error loading article data from the article store: {e}")
         return None
     
     if not article_data:
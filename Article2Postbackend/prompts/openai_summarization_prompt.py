@@ -1,3 +1,7 @@
+# Version of the summarization prompt. Bump it whenever the prompt or its
+# JSON schema changes, so that cached summaries are not reused.
+PROMPT_VERSION = "1"
+
 def get_openai_summarization_prompt(article_text, language):
     """
     Generate the OpenAI prompt for article summarization with optimal JSON schema
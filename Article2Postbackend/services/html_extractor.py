@@ -0,0 +1,382 @@
+"""
+Streaming HTML text extraction.
+
+Event-based alternative to building a full BeautifulSoup tree: the page is
+fed to an lxml HTMLParser in chunks and a parser target collects text as
+it goes, skipping script/style/nav subtrees without materializing them.
+
+Also provides a main-content mode that keeps only the article body.
+"""
+
+import re
+import codecs
+from html.parser import HTMLParser
+
+# Subtrees whose text is never part of the article
+SKIPPED_TAGS = {"script", "style", "noscript", "template", "nav", "svg"}
+
+# Size of the chunks fed to the parser
+FEED_CHUNK_SIZE = 64 * 1024
+
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?\s*([A-Za-z0-9_.:\-]+)', re.IGNORECASE)
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    LXML_AVAILABLE = False
+
+class TextCollector:
+    """lxml parser target that keeps the text outside of skipped subtrees"""
+
+    def __init__(self, skipped_tags=SKIPPED_TAGS):
+        self.skipped_tags = skipped_tags
+        self.skip_depth = 0
+        self.parts = []
+
+    def start(self, tag, attrib):
+        if self.skip_depth or tag in self.skipped_tags:
+            self.skip_depth += 1
+
+    def end(self, tag):
+        if self.skip_depth:
+            self.skip_depth -= 1
+
+    def data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        # Same whitespace normalization as re.sub(r'\s+', ' ', text).strip()
+        return " ".join("".join(self.parts).split())
+
+def sniff_encoding(content):
+    """
+    Guess the encoding of an HTML document.
+
+    libxml2 falls back to Latin-1 when a page has no <meta charset>, which
+    garbles UTF-8 pages, so the encoding is determined up front: BOM, then
+    <meta charset> in the first bytes, then UTF-8 if the bytes are valid UTF-8,
+    then Windows-1252.
+
+    Args:
+        content (bytes): The raw HTML document
+
+    Returns:
+        str: Encoding name
+    """
+    if content.startswith(b'\xef\xbb\xbf'):
+        return "utf-8"
+    match = META_CHARSET_PATTERN.search(content[:4096])
+    if match:
+        declared = match.group(1).decode('ascii').lower()
+        try:
+            codecs.lookup(declared)
+            return declared
+        except LookupError:
+            pass  # Unknown label, sniff the bytes instead
+    try:
+        content.decode('utf-8')
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "windows-1252"
+
+def feed_parser(parser, content):
+    """
+    Feed HTML content to an lxml feed parser chunk by chunk and close it.
+
+    Args:
+        parser (etree.HTMLParser): Parser created with a target
+        content (bytes | str): The HTML document
+
+    Returns:
+        The value returned by the target's close()
+    """
+    for start in range(0, len(content), FEED_CHUNK_SIZE):
+        parser.feed(content[start:start + FEED_CHUNK_SIZE])
+    return parser.close()
+
+def create_parser(target, content):
+    """Create an lxml feed parser for a document, with its encoding resolved up front"""
+    encoding = sniff_encoding(content) if isinstance(content, bytes) else None
+    return etree.HTMLParser(target=target, encoding=encoding, recover=True, remove_comments=True)
+
+def extract_text_streaming(content):
+    """
+    Extract the visible text of an HTML document with a streaming lxml parser.
+
+    Args:
+        content (bytes | str): The HTML document (bytes are decoded with sniff_encoding())
+
+    Returns:
+        str: The extracted text, whitespace normalized
+    """
+    if not LXML_AVAILABLE:
+        raise ImportError("lxml is required for the streaming HTML extractor")
+    if not content:
+        return ""
+
+    parser = create_parser(TextCollector(), content)
+    return feed_parser(parser, content)
+
+# ---------------------------------------------------------------------------
+# Main-content (boilerplate removal) extraction
+# ---------------------------------------------------------------------------
+
+# Subtrees dropped in main-content mode on top of SKIPPED_TAGS
+BOILERPLATE_TAGS = {"footer", "aside", "form", "button", "select", "iframe"}
+
+# <header> is site chrome at page level, but holds the title and standfirst
+# when it sits inside one of these
+CONTENT_ROOT_TAGS = {"article", "main"}
+
+# Elements that delimit text blocks
+BLOCK_TAGS = {
+    "body", "main", "article", "section", "div", "p", "li", "ul", "ol", "td", "th", "tr", "table",
+    "blockquote", "pre", "h1", "h2", "h3", "h4", "h5", "h6", "dd", "dt", "dl", "figure", "figcaption"
+}
+
+# Void elements never get an end event from the stdlib parser
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+NEGATIVE_HINT_PATTERN = re.compile(
+    r"comment|footer|menu|nav|sidebar|cookie|consent|banner|share|social|related|promo|"
+    r"newsletter|subscribe|breadcrumb|advert|sponsor|popup|modal|widget|outbrain|taboola",
+    re.IGNORECASE
+)
+POSITIVE_HINT_PATTERN = re.compile(r"article|content|story|body|post|entry|main|text|chapo|paragraph", re.IGNORECASE)
+
+MIN_BLOCK_CHARS = 25          # Shorter blocks don't count as content evidence
+MAX_LINK_DENSITY = 0.33       # Blocks with more link text than this are navigation-like
+MIN_MAIN_CONTENT_CHARS = 250  # Below this, main-content detection is considered failed
+
+class BlockCollector:
+    """
+    Parser target that segments a page into text blocks.
+
+    For every block element it records its parent block, its class/id hints,
+    and how much of its own text sits inside links. Text segments are kept in
+    document order so the selected blocks can be re-assembled afterwards.
+    """
+
+    def __init__(self):
+        self.skip_depth = 0
+        self.link_depth = 0
+        self.stack = []       # (tag, block index or None) for every open element
+        self.blocks = []      # dicts: parent, tag, hint, text_len, link_len
+        self.segments = []    # (block index, text) in document order
+
+    def current_block(self):
+        for _, block in reversed(self.stack):
+            if block is not None:
+                return block
+        return None
+
+    def is_page_header(self, tag):
+        return tag == "header" and not any(open_tag in CONTENT_ROOT_TAGS for open_tag, _ in self.stack)
+
+    def start(self, tag, attrib):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if self.skip_depth or tag in SKIPPED_TAGS or tag in BOILERPLATE_TAGS or self.is_page_header(tag):
+            self.skip_depth += 1
+            self.stack.append((tag, None))
+            return
+
+        block = None
+        if tag in BLOCK_TAGS:
+            hint_text = f"{attrib.get('class', '') or ''} {attrib.get('id', '') or ''}"
+            hint = 0
+            if NEGATIVE_HINT_PATTERN.search(hint_text):
+                hint -= 1
+            if POSITIVE_HINT_PATTERN.search(hint_text):
+                hint += 1
+            block = len(self.blocks)
+            self.blocks.append({
+                "parent": self.current_block(),
+                "tag": tag,
+                "hint": hint,
+                "text_len": 0,
+                "link_len": 0,
+                "commas": 0
+            })
+        elif tag == "a":
+            self.link_depth += 1
+        self.stack.append((tag, block))
+
+    def end(self, tag):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        # Tolerate unclosed elements: pop up to the matching start tag
+        if not any(open_tag == tag for open_tag, _ in self.stack):
+            return
+        while self.stack:
+            open_tag, _ = self.stack.pop()
+            if self.skip_depth:
+                self.skip_depth -= 1
+            elif open_tag == "a":
+                self.link_depth -= 1
+            if open_tag == tag:
+                break
+
+    def data(self, data):
+        if self.skip_depth or not data.strip():
+            return
+        block = self.current_block()
+        if block is None:
+            return
+        info = self.blocks[block]
+        length = len(data.strip())
+        info["text_len"] += length
+        info["commas"] += data.count(",")
+        if self.link_depth:
+            info["link_len"] += length
+        self.segments.append((block, data))
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return self
+
+    def select_main_blocks(self):
+        """
+        Score the blocks and pick the container holding the article body.
+
+        Content-like blocks (long enough, few links) score by length and comma
+        count; the score flows to their parent and, halved, to their
+        grandparent. The container with the best score, weighted by its class/id
+        hints and its overall link density, wins.
+
+        Returns:
+            set or None: Indexes of the blocks whose text is kept, or None if nothing qualifies
+        """
+        if not self.blocks:
+            return None
+
+        # Subtree text/link totals (children are always created after their parent)
+        subtree_text = [b["text_len"] for b in self.blocks]
+        subtree_link = [b["link_len"] for b in self.blocks]
+        for index in range(len(self.blocks) - 1, -1, -1):
+            parent = self.blocks[index]["parent"]
+            if parent is not None:
+                subtree_text[parent] += subtree_text[index]
+                subtree_link[parent] += subtree_link[index]
+
+        scores = [0.0] * len(self.blocks)
+        for index, block in enumerate(self.blocks):
+            text_len = block["text_len"]
+            if text_len < MIN_BLOCK_CHARS or block["link_len"] / text_len > MAX_LINK_DENSITY:
+                continue
+            score = 1 + block["commas"] + min(text_len / 100, 3)
+            parent = block["parent"]
+            if parent is not None:
+                scores[parent] += score
+                grandparent = self.blocks[parent]["parent"]
+                if grandparent is not None:
+                    scores[grandparent] += score / 2
+
+        best, best_score = None, 0.0
+        for index, block in enumerate(self.blocks):
+            if not scores[index]:
+                continue
+            link_density = subtree_link[index] / subtree_text[index] if subtree_text[index] else 1
+            score = scores[index] * (1 + 0.25 * block["hint"]) * (1 - link_density)
+            if score > best_score:
+                best, best_score = index, score
+        if best is None:
+            return None
+
+        # Keep the descendants of the winner, minus boilerplate-hinted and link-heavy blocks
+        kept = set()
+        dropped = set()
+        for index, block in enumerate(self.blocks):
+            if index == best:
+                inside = True
+            else:
+                parent = block["parent"]
+                inside = parent in kept or parent in dropped
+            if not inside:
+                continue
+            if block["hint"] < 0 or block["parent"] in dropped:
+                dropped.add(index)
+                continue
+            kept.add(index)
+        return {
+            index for index in kept
+            if self.blocks[index]["link_len"] <= MAX_LINK_DENSITY * self.blocks[index]["text_len"]
+        }
+
+    def text_of(self, blocks):
+        """Assemble the text of the given blocks in document order, one space between blocks"""
+        parts = []
+        previous = None
+        for block, data in self.segments:
+            if block not in blocks:
+                continue
+            if previous is not None and block != previous:
+                parts.append(" ")
+            parts.append(data)
+            previous = block
+        return " ".join("".join(parts).split())
+
+class StdlibParserAdapter(HTMLParser):
+    """Drive a parser target with the stdlib html.parser when lxml is not installed"""
+
+    def __init__(self, target):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag, {name: value or "" for name, value in attrs})
+        if tag in VOID_TAGS:
+            self.target.end(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.target.start(tag, {name: value or "" for name, value in attrs})
+        self.target.end(tag)
+
+    def handle_endtag(self, tag):
+        if tag not in VOID_TAGS:
+            self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+    def close(self):
+        super().close()
+        return self.target.close()
+
+def extract_main_content(content):
+    """
+    Extract only the main article body of an HTML document.
+
+    Menus, footers, cookie banners and related-article lists are dropped
+    using text-density / link-density scoring of the page blocks. Falls back
+    to the text of all blocks when no convincing main content is found.
+
+    Args:
+        content (bytes | str): The HTML document
+
+    Returns:
+        str: The main-content text, whitespace normalized
+    """
+    if not content:
+        return ""
+
+    collector = BlockCollector()
+    if LXML_AVAILABLE:
+        feed_parser(create_parser(collector, content), content)
+    else:
+        if isinstance(content, bytes):
+            content = content.decode(sniff_encoding(content), errors="replace")
+        feed_parser(StdlibParserAdapter(collector), content)
+
+    selected = collector.select_main_blocks()
+    if selected:
+        text = collector.text_of(selected)
+        if len(text) >= MIN_MAIN_CONTENT_CHARS:
+            return text
+    return collector.text_of(set(range(len(collector.blocks))))
@@ -1,13 +1,22 @@
 import os
 import json
-import re
-import unicodedata
 import time
+import asyncio
+import functools
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+import openai
 from openai import OpenAI
+from config.config import config
 from utils.json_utils import fix_json_quotes, additional_json_cleanup
+from utils.text_cleaning import clean_text
 from prompts import get_openai_summarization_prompt
+from services.summary_cache import get_summary_cache
+
+# Model used for article summarization
+SUMMARY_MODEL = "gpt-4o-mini"
 
-# Define our own version of clean_encoding_issues to avoid circular imports
 def clean_encoding_issues(text):
     """
     Clean text with encoding issues like replacement characters
@@ -18,25 +27,7 @@ def clean_encoding_issues(text):
     Returns:
         str: Cleaned text
     """
-    # Replace replacement character with space
-    text = text.replace('\ufffd', ' ')
-    
-    # Try to normalize unicode characters
-    try:
-        text = unicodedata.normalize('NFKD', text)
-    except Exception as e:
-        print(f"Warning: Unicode normalization failed: {e}")
-    
-    # Manually fix some common encoding issues in French text
-    text = text.replace('fractur\ufffd', 'fracturée')
-    text = text.replace('pr\ufffd', 'pré')
-    text = text.replace('\ufffdchanges', 'échanges')
-    text = text.replace('\ufffd', 'é')
-    
-    # Remove any remaining control characters
-    text = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', text)
-    
-    return text
+    return clean_text(text)
 
 def get_openai_api_key():
     """
@@ -66,6 +57,122 @@ def get_openai_api_key():
     
     return api_key
 
+# Process-wide clients, one per API key, sharing a pooled keep-alive HTTP client
+_clients = {}
+_client_lock = threading.Lock()
+_resolved_api_key = None
+
+def resolve_openai_api_key():
+    """
+    Get the OpenAI API key, looked up once per process (see get_openai_api_key).
+    
+    Returns:
+        str: The OpenAI API key
+        
+    Raises:
+        ValueError: If no API key is configured
+    """
+    global _resolved_api_key
+    if _resolved_api_key is None:
+        _resolved_api_key = get_openai_api_key()
+    if not _resolved_api_key:
+        raise ValueError("OpenAI API key not found. Please set the OPENAI_API_KEY environment variable.")
+    return _resolved_api_key
+
+def get_openai_http_client_options():
+    """
+    Get the connection pool options shared by the OpenAI HTTP clients.
+    
+    HTTP/2 is only enabled if configured and the h2 package is installed.
+    
+    Returns:
+        dict: Keyword arguments for openai.DefaultHttpxClient
+    """
+    # Same Limits class as the HTTP library the SDK is built on
+    limits = type(openai.DEFAULT_CONNECTION_LIMITS)(
+        max_connections=config.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=config.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=config.OPENAI_KEEPALIVE_EXPIRY
+    )
+    http2 = config.OPENAI_HTTP2 and importlib.util.find_spec("h2") is not None
+    return {"limits": limits, "http2": http2}
+
+def get_openai_client(api_key=None):
+    """
+    Get the shared OpenAI client, created once per process and API key.
+    
+    Args:
+        api_key (str, optional): API key. Defaults to the configured key
+        
+    Returns:
+        OpenAI: Client whose connection pool is reused by every call
+    """
+    api_key = api_key or resolve_openai_api_key()
+    client = _clients.get(api_key)
+    if client is None:
+        with _client_lock:
+            client = _clients.get(api_key)
+            if client is None:
+                client = OpenAI(
+                    api_key=api_key,
+                    http_client=openai.DefaultHttpxClient(**get_openai_http_client_options())
+                )
+                _clients[api_key] = client
+    return client
+
+async def close_openai_clients():
+    """Close the shared OpenAI clients and release their pooled connections"""
+    with _client_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+# Bounded pool running the blocking SDK calls made from async handlers
+_llm_executor = None
+
+def get_llm_executor():
+    """
+    Get the thread pool dedicated to blocking LLM calls.
+    
+    Returns:
+        ThreadPoolExecutor: Pool of Config.LLM_MAX_WORKERS threads
+    """
+    global _llm_executor
+    if _llm_executor is None:
+        with _client_lock:
+            if _llm_executor is None:
+                _llm_executor = ThreadPoolExecutor(
+                    max_workers=config.LLM_MAX_WORKERS,
+                    thread_name_prefix="llm"
+                )
+    return _llm_executor
+
+async def run_llm_call(func, *args, **kwargs):
+    """
+    Run a blocking LLM function on the LLM thread pool without blocking the event loop.
+    
+    When all workers are busy, calls wait in the pool queue; the event loop
+    keeps serving other requests (health checks, static files) meanwhile.
+    
+    Args:
+        func (callable): Blocking function, e.g. summarize_with_openai
+        *args, **kwargs: Its arguments
+        
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_llm_executor(), functools.partial(func, *args, **kwargs))
+
+def shutdown_llm_executor():
+    """Stop the LLM thread pool, waiting for running calls"""
+    global _llm_executor
+    with _client_lock:
+        executor, _llm_executor = _llm_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
 def safely_parse_json(json_str):
     """
     Safely parse a JSON string with multiple fallback mechanisms
@@ -109,28 +216,34 @@ def safely_parse_json(json_str):
             print(f"All JSON parsing attempts failed: {error_msg}")
             return None, error_msg
 
-def summarize_with_openai(article_text, language):
+def summarize_with_openai(article_text, language, clean_input=True, use_cache=True):
     """
     Summarize an article using OpenAI's API with optimal 15-word format
     
     Args:
         article_text (str): The text of the article to summarize
         language (str): The language to generate the summary in
+        clean_input (bool): Clean encoding issues first. Pass False when the text
+            already went through clean_encoding_issues.
+        use_cache (bool): Return the cached summary of identical text if any. With
+            False the model is always called, and the cache is refreshed with the result.
         
     Returns:
         dict: The generated summary data
     """
     try:
         # Clean the article text to fix encoding issues
-        cleaned_article_text = clean_encoding_issues(article_text)
+        cleaned_article_text = clean_encoding_issues(article_text) if clean_input else article_text
         
-        # Get API key
-        api_key = get_openai_api_key()
-        if not api_key:
-            raise ValueError("OpenAI API key not found. Please set the OPENAI_API_KEY environment variable.")
+        summary_cache = get_summary_cache()
+        if summary_cache and use_cache:
+            cached_summary = summary_cache.get(cleaned_article_text, language, SUMMARY_MODEL)
+            if cached_summary:
+                print(f"Using cached summary ({language})")
+                return cached_summary
         
-        # Initialize client
-        client = OpenAI(api_key=api_key)
+        # Shared client (raises ValueError if no API key is configured)
+        client = get_openai_client()
         
         # Get prompt
         prompt_data = get_openai_summarization_prompt(cleaned_article_text, language)
@@ -138,7 +251,7 @@ def summarize_with_openai(article_text, language):
         # Call OpenAI API
         print(f"Calling OpenAI API for text summarization in {language}...")
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=SUMMARY_MODEL,
             messages=prompt_data["messages"],
             response_format=prompt_data["response_format"],
             temperature=0.7,
@@ -155,7 +268,10 @@ def summarize_with_openai(article_text, language):
             print(f"Successfully generated summary with bullet point and full summary")
             # Extract from nested structure if needed
             if 'summary' in result:
-                return result['summary']
+                result = result['summary']
+            # Only successful summaries are cached, never the error fallbacks
+            if summary_cache and isinstance(result, dict):
+                summary_cache.set(cleaned_article_text, language, SUMMARY_MODEL, result)
             return result
         else:
             # If all parsing attempts failed, we'll create a fallback response
@@ -193,11 +309,7 @@ def regenerate_bullet_point_with_openai(original_text: str, context: str, langua
         str: The newly generated bullet point text.
     """
     try:
-        api_key = get_openai_api_key()
-        if not api_key:
-            raise ValueError("OpenAI API key not found.")
-        
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client()
 
         regeneration_prompt = f"""
         Based on the article context below, regenerate the following bullet point to be more engaging and concise for a video slide.
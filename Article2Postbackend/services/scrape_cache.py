@@ -0,0 +1,177 @@
+import os
+import hashlib
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from config.config import config
+from utils.disk_cache import DiskCache
+
+# Query parameters that never change the article content
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid"}
+
+def normalize_url(url):
+    """
+    Normalize a URL so that trivially different spellings share a cache entry.
+
+    Lowercases the scheme and host, drops default ports, fragments and
+    tracking parameters, and sorts the remaining query parameters.
+
+    Args:
+        url (str): The URL to normalize
+
+    Returns:
+        str: The normalized URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+
+    query = [
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in TRACKING_PARAMS and not name.startswith(TRACKING_PARAM_PREFIXES)
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+class ScrapeCache:
+    """
+    On-disk cache of scraped article text with HTTP validators.
+
+    Entries store the ETag / Last-Modified of the page and its extracted text,
+    so a re-scrape can send a conditional GET and skip both the download and
+    the HTML parse when the server answers 304 Not Modified.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.store = DiskCache(directory, max_bytes)
+        self._lock = threading.Lock()
+        self.hits = 0          # Served from cache after a 304
+        self.misses = 0        # No usable entry, page downloaded
+        self.revalidated = 0   # Entry existed but the page changed (200)
+
+    @staticmethod
+    def cache_key(url):
+        return hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+
+    def lookup(self, url, extractor):
+        """
+        Get the cached entry for a URL.
+
+        Args:
+            url (str): Page URL
+            extractor (str): Extraction engine/mode in use. Entries produced by another one are ignored.
+
+        Returns:
+            dict or None: Entry with "etag", "last_modified" and "text", or None
+        """
+        entry = self.store.get(self.cache_key(url))
+        if entry and entry.get("extractor") != extractor:
+            return None
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        Build the revalidation headers for a cached entry.
+
+        Args:
+            entry (dict or None): Entry returned by lookup()
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers (empty if no entry)
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def store_page(self, url, response_headers, text, extractor, had_entry=False):
+        """
+        Store the extracted text of a freshly downloaded page.
+
+        Pages without ETag or Last-Modified cannot be revalidated and are not stored.
+
+        Args:
+            url (str): Page URL
+            response_headers (Mapping): Response headers (case-insensitive mapping)
+            text (str): Extracted text
+            extractor (str): Extraction engine/mode that produced the text
+            had_entry (bool): Whether a stale entry existed for this URL
+        """
+        with self._lock:
+            if had_entry:
+                self.revalidated += 1
+            else:
+                self.misses += 1
+
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        self.store.set(self.cache_key(url), {
+            "url": normalize_url(url),
+            "etag": etag,
+            "last_modified": last_modified,
+            "text": text,
+            "extractor": extractor,
+            "stored_at": time.time()
+        })
+
+    def stats(self):
+        """
+        Get scrape cache statistics.
+
+        Returns:
+            dict: 304 hits, misses, changed pages and disk usage
+        """
+        with self._lock:
+            requests_seen = self.hits + self.misses + self.revalidated
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated_changed": self.revalidated,
+                "hit_rate": round(self.hits / requests_seen, 4) if requests_seen else 0.0
+            }
+        disk = self.store.stats()
+        stats.update({
+            "entries": disk["entries"],
+            "bytes": disk["bytes"],
+            "max_bytes": disk["max_bytes"],
+            "evictions": disk["evictions"]
+        })
+        return stats
+
+_scrape_cache = None
+_scrape_cache_lock = threading.Lock()
+
+def get_scrape_cache():
+    """
+    Get the process-wide scrape cache, or None if disabled in Config.
+
+    Returns:
+        ScrapeCache or None: The shared cache
+    """
+    global _scrape_cache
+    if not config.SCRAPE_CACHE_ENABLED:
+        return None
+    if _scrape_cache is None:
+        with _scrape_cache_lock:
+            if _scrape_cache is None:
+                _scrape_cache = ScrapeCache(
+                    os.path.join(config.CACHE_DIR, "scrape"),
+                    config.SCRAPE_CACHE_MAX_BYTES
+                )
+    return _scrape_cache
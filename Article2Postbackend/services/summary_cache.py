@@ -0,0 +1,92 @@
+import os
+import hashlib
+import threading
+from config.config import config
+from utils.disk_cache import DiskCache
+from prompts import PROMPT_VERSION
+
+class SummaryCache:
+    """
+    On-disk cache of article summaries.
+
+    Entries are keyed by a hash of the cleaned article text, the language,
+    the model and the summarization prompt version, so duplicate wire stories
+    and regenerations of unchanged text reuse the previous summary.
+    """
+
+    def __init__(self, directory, max_bytes, max_entries=None, ttl=None):
+        self.store = DiskCache(directory, max_bytes, max_entries=max_entries, ttl=ttl)
+
+    @staticmethod
+    def cache_key(text, language, model, prompt_version=PROMPT_VERSION):
+        digest = hashlib.sha256()
+        for part in (prompt_version, model, language):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, text, language, model):
+        """
+        Get the cached summary of a text.
+
+        Args:
+            text (str): Cleaned article text
+            language (str): Summary language
+            model (str): Model that produced the summary
+
+        Returns:
+            dict or None: The summary data, or None on miss
+        """
+        entry = self.store.get(self.cache_key(text, language, model))
+        return entry["summary"] if entry else None
+
+    def set(self, text, language, model, summary):
+        """
+        Store the summary of a text.
+
+        Args:
+            text (str): Cleaned article text
+            language (str): Summary language
+            model (str): Model that produced the summary
+            summary (dict): The summary data
+        """
+        self.store.set(self.cache_key(text, language, model), {
+            "language": language,
+            "model": model,
+            "prompt_version": PROMPT_VERSION,
+            "summary": summary
+        })
+
+    def stats(self):
+        """
+        Get summary cache statistics.
+
+        Returns:
+            dict: Hits, misses, evictions, expirations and disk usage
+        """
+        return self.store.stats()
+
+_summary_cache = None
+_summary_cache_lock = threading.Lock()
+
+def get_summary_cache():
+    """
+    Get the process-wide summary cache, or None if disabled in Config.
+
+    Returns:
+        SummaryCache or None: The shared cache
+    """
+    global _summary_cache
+    if not config.SUMMARY_CACHE_ENABLED:
+        return None
+    if _summary_cache is None:
+        with _summary_cache_lock:
+            if _summary_cache is None:
+                _summary_cache = SummaryCache(
+                    os.path.join(config.CACHE_DIR, "summaries"),
+                    config.SUMMARY_CACHE_MAX_BYTES,
+                    max_entries=config.SUMMARY_CACHE_MAX_ENTRIES,
+                    ttl=config.SUMMARY_CACHE_TTL
+                )
+    return _summary_cache
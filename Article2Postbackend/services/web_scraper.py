@@ -1,24 +1,269 @@
+import asyncio
+import logging
+import threading
 import requests
+import aiohttp
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import re
+from config.config import config
+from services.scrape_cache import get_scrape_cache
+from services.html_extractor import extract_text_streaming, extract_main_content, LXML_AVAILABLE
 
-def scrape_text_from_url(url):
+logger = logging.getLogger(__name__)
+
+# Shared per-process session so that repeated ingests from the same news
+# domains reuse their keep-alive connections instead of paying a fresh
+# DNS + TCP + TLS handshake for every URL.
+_session = None
+_session_lock = threading.Lock()
+
+def create_scraper_session():
+    """
+    Build a requests session with a bounded connection pool per host.
+
+    Returns:
+        requests.Session: A session configured from Config (pool sizes, retries, user agent)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.SCRAPER_POOL_CONNECTIONS,
+        pool_maxsize=config.SCRAPER_POOL_MAXSIZE,
+        max_retries=config.SCRAPER_MAX_RETRIES,
+        pool_block=False
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": config.SCRAPER_USER_AGENT,
+        "Connection": "keep-alive"
+    })
+    return session
+
+def get_scraper_session():
+    """
+    Get the shared scraper session, creating it on first use.
+
+    Returns:
+        requests.Session: The process-wide scraper session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_scraper_session()
+    return _session
+
+def close_scraper_session():
+    """Close the shared scraper session and release its pooled connections"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+def get_scraper_timeout():
+    """
+    Get the (connect, read) timeout tuple used for every scraper request.
+
+    Returns:
+        tuple: (connect_timeout, read_timeout) in seconds
+    """
+    return (config.SCRAPER_CONNECT_TIMEOUT, config.SCRAPER_READ_TIMEOUT)
+
+def get_extraction_engine():
+    """
+    Get the HTML extraction engine actually in use.
+
+    Returns:
+        str: "lxml" if selected in Config and lxml is installed, otherwise "bs4"
+    """
+    if config.SCRAPER_ENGINE == "lxml":
+        if LXML_AVAILABLE:
+            return "lxml"
+        logger.warning("SCRAPER_ENGINE=lxml but lxml is not installed, falling back to bs4")
+    return "bs4"
+
+def get_extraction_mode():
+    """
+    Get the text extraction mode.
+
+    Returns:
+        str: "main" to keep only the article body, "full" for all the visible text
+    """
+    return "main" if config.SCRAPER_EXTRACTION_MODE == "main" else "full"
+
+def get_extraction_signature():
+    """
+    Identify the engine and mode producing the scraped text, for the scrape cache.
+
+    Returns:
+        str: e.g. "lxml" (full text) or "lxml:main"
+    """
+    engine = get_extraction_engine()
+    return f"{engine}:main" if get_extraction_mode() == "main" else engine
+
+def extract_text_with_bs4(content):
+    """
+    Extrait le texte visible d'un document HTML avec un arbre BeautifulSoup complet.
+
+    Args:
+        content (bytes | str): Le contenu HTML de la page
+
+    Returns:
+        str: Le texte extrait, espaces normalisés
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    for script_or_style in soup(['script', 'style']):
+        script_or_style.decompose()
+    text = soup.get_text()
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    return text
+
+def extract_text_from_html(content, engine=None, mode=None):
+    """
+    Extrait le texte visible d'un document HTML avec le moteur configuré.
+
+    En mode "main", seul le corps de l'article est conservé (menus, pieds de
+    page, bannières et listes de liens sont retirés), ce qui réduit la taille
+    du texte envoyé au LLM.
+
+    Args:
+        content (bytes | str): Le contenu HTML de la page
+        engine (str, optional): "bs4" ou "lxml". Par défaut, Config.SCRAPER_ENGINE
+        mode (str, optional): "full" ou "main". Par défaut, Config.SCRAPER_EXTRACTION_MODE
+
+    Returns:
+        str: Le texte extrait, espaces normalisés
+    """
+    mode = mode or get_extraction_mode()
+    if mode == "main":
+        return extract_main_content(content)
+    engine = engine or get_extraction_engine()
+    if engine == "lxml":
+        return extract_text_streaming(content)
+    return extract_text_with_bs4(content)
+
+def scrape_text_from_url(url, session=None, use_cache=True):
     """
     Extrait le texte d'une page web à partir de son URL.
-    
+
+    Si la page est dans le cache, elle est revalidée avec une requête
+    conditionnelle (If-None-Match / If-Modified-Since) et le texte en cache
+    est renvoyé directement sur une réponse 304.
+
     Args:
         url (str): L'URL de la page web à scraper
-        
+        session (requests.Session, optional): Session à utiliser. Par défaut, la session partagée
+        use_cache (bool): Utiliser le cache de scraping
+
     Returns:
         str: Le texte extrait de la page web
     """
-    response = requests.get(url)
+    session = session or get_scraper_session()
+    cache = get_scrape_cache() if use_cache else None
+    signature = get_extraction_signature()
+    entry = cache.lookup(url, signature) if cache else None
+
+    response = session.get(
+        url,
+        headers=cache.conditional_headers(entry) if cache else None,
+        timeout=get_scraper_timeout()
+    )
+    if response.status_code == 304 and entry:
+        cache.record_hit()
+        return entry["text"]
     if response.status_code != 200:
         raise Exception(f"Failed to fetch the URL: {url}")
-    soup = BeautifulSoup(response.content, 'html.parser')
-    for script_or_style in soup(['script', 'style']):
-        script_or_style.decompose()
-    text = soup.get_text()
-    text = re.sub(r'\s+', ' ', text).strip()
 
-    return text 
\ No newline at end of file
+    text = extract_text_from_html(response.content)
+    if cache:
+        cache.store_page(url, response.headers, text, signature, had_entry=entry is not None)
+
+    return text
+
+def create_async_scraper_session():
+    """
+    Build an aiohttp session for concurrent batch ingestion.
+
+    The connector caps the total number of open connections and the number of
+    concurrent connections per host, so a batch of URLs from the same news
+    domain does not hammer it.
+
+    Returns:
+        aiohttp.ClientSession: A session configured from Config. Must be closed by the caller.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=config.SCRAPER_ASYNC_MAX_CONNECTIONS,
+        limit_per_host=config.SCRAPER_ASYNC_PER_HOST_LIMIT
+    )
+    timeout = aiohttp.ClientTimeout(
+        sock_connect=config.SCRAPER_CONNECT_TIMEOUT,
+        sock_read=config.SCRAPER_READ_TIMEOUT
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={"User-Agent": config.SCRAPER_USER_AGENT}
+    )
+
+def lookup_scraped_page(url, use_cache=True):
+    """
+    Cherche une page dans le cache de scraping (lecture disque bloquante).
+
+    Args:
+        url (str): L'URL de la page web
+        use_cache (bool): Utiliser le cache de scraping
+
+    Returns:
+        tuple: (cache ou None, entrée en cache ou None)
+    """
+    cache = get_scrape_cache() if use_cache else None
+    entry = cache.lookup(url, get_extraction_signature()) if cache else None
+    return cache, entry
+
+async def fetch_html_async(session, url, use_cache=True):
+    """
+    Télécharge une page web de manière asynchrone, avec revalidation du cache.
+
+    Args:
+        session (aiohttp.ClientSession): Session créée par create_async_scraper_session()
+        url (str): L'URL de la page web
+        use_cache (bool): Utiliser le cache de scraping
+
+    Returns:
+        dict: {"cached_text": texte en cache si la page n'a pas changé (304), sinon None,
+               "content": contenu brut de la page (None sur 304),
+               "headers": en-têtes de la réponse,
+               "had_entry": une entrée de cache existait pour cette URL}
+    """
+    # The lookup stats and reads a file: keep it off the event loop, like the cache writes
+    cache, entry = await asyncio.to_thread(lookup_scraped_page, url, use_cache)
+
+    async with session.get(url, headers=cache.conditional_headers(entry) if cache else None) as response:
+        if response.status == 304 and entry:
+            cache.record_hit()
+            return {"cached_text": entry["text"], "content": None, "headers": response.headers, "had_entry": True}
+        if response.status != 200:
+            raise Exception(f"Failed to fetch the URL: {url}")
+        return {
+            "cached_text": None,
+            "content": await response.read(),
+            "headers": response.headers,
+            "had_entry": entry is not None
+        }
+
+def store_scraped_text(url, response_headers, text, had_entry=False):
+    """
+    Enregistre le texte extrait d'une page téléchargée par fetch_html_async dans le cache.
+
+    Args:
+        url (str): L'URL de la page
+        response_headers (Mapping): En-têtes de la réponse
+        text (str): Le texte extrait
+        had_entry (bool): Une entrée de cache (périmée) existait pour cette URL
+    """
+    cache = get_scrape_cache()
+    if cache:
+        cache.store_page(url, response_headers, text, get_extraction_signature(), had_entry=had_entry)
@@ -0,0 +1,330 @@
+"""
+Behavior of the article store backends in services.article_store.
+"""
+
+import os
+import json
+import threading
+
+import pytest
+
+from services.article_store import (
+    HEAVY_ARTICLE_FIELDS, JournalArticleStore, LazyArticleStore, SQLiteArticleStore
+)
+
+BACKENDS = {
+    "sqlite": lambda directory: SQLiteArticleStore(os.path.join(directory, "articles.sqlite3")),
+    "journal": lambda directory: JournalArticleStore(os.path.join(directory, "articles.json")),
+    "lazy": lambda directory: LazyArticleStore(os.path.join(directory, "articles.jsonl"))
+}
+
+def make_article(article_id, title=None, created_at=None):
+    return {
+        "id": article_id,
+        "title": title or f"Article {article_id}",
+        "summary": f"Résumé {article_id}",
+        "bullet_points": [{"id": 1, "text": f"Point {article_id}", "order": 1, "image_path": None, "audio_path": None}],
+        "full_text": f"Texte complet de l'article {article_id}. " * 5,
+        "full_summary": f"Résumé complet {article_id}.",
+        "tone": "Neutral",
+        "created_at": created_at or f"2025-01-{article_id % 28 + 1:02d}T00:00:00"
+    }
+
+@pytest.fixture(params=list(BACKENDS))
+def open_store(request, tmp_path):
+    """Open (or reopen) a store of the parametrized backend in tmp_path. Stores left open are closed at teardown"""
+    opened = []
+
+    def open_():
+        store = BACKENDS[request.param](str(tmp_path))
+        opened.append(store)
+        return store
+
+    yield open_
+    for store in opened:
+        try:
+            store.close()
+        except ValueError:
+            pass  # Already closed by the test
+
+@pytest.fixture
+def store(open_store):
+    return open_store()
+
+def test_keys_are_normalized(store):
+    store[1] = make_article(1)
+    assert store["1"] == store[" 1 "] == make_article(1)
+    assert 1 in store and "1" in store and 2 not in store and True not in store
+    assert list(store) == ["1"] and len(store) == 1
+    del store["1"]
+    assert 1 not in store
+    with pytest.raises(KeyError):
+        store[1]
+    with pytest.raises(KeyError):
+        del store[1]
+
+def test_reads_return_copies(store):
+    store[1] = make_article(1)
+    article = store[1]
+    article["title"] = "Modifié"
+    article["bullet_points"].append({"id": 2})
+    assert store[1] == make_article(1)
+
+def test_writes_survive_reopen(open_store):
+    store = open_store()
+    for article_id in range(1, 6):
+        store[article_id] = make_article(article_id)
+    store[2] = make_article(2, title="Nouveau titre")
+    del store[4]
+    store.close()
+
+    store = open_store()
+    assert sorted(store, key=int) == ["1", "2", "3", "5"]
+    assert store[2]["title"] == "Nouveau titre"
+    assert dict(store.items()) == {key: make_article(int(key), "Nouveau titre" if key == "2" else None) for key in store}
+
+def test_insert_allocates_the_next_id(store):
+    assert store.insert(make_article)["id"] == 1
+    assert store.insert(make_article)["id"] == 2
+    store[10] = make_article(10)
+    assert store.insert(make_article)["id"] == 11
+    assert store[11] == make_article(11)
+
+def test_concurrent_inserts_get_distinct_ids(store):
+    ids = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(20):
+            article = store.insert(make_article)
+            with lock:
+                ids.append(article["id"])
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(ids) == list(range(1, 81))
+    assert len(store) == 80
+
+def test_sqlite_inserts_from_two_connections_get_distinct_ids(tmp_path):
+    path = str(tmp_path / "articles.sqlite3")
+    first, second = SQLiteArticleStore(path), SQLiteArticleStore(path)
+    ids = [store.insert(make_article)["id"] for _ in range(10) for store in (first, second)]
+    assert ids == list(range(1, 21))
+    first.close()
+    second.close()
+
+def test_mutate_writes_back(store):
+    store[1] = make_article(1)
+    assert store.mutate(1, lambda article: article.update(title="Nouveau titre") or "done") == "done"
+    assert store[1]["title"] == "Nouveau titre"
+    with pytest.raises(KeyError):
+        store.mutate(2, lambda article: None)
+
+def test_mutate_rolls_back_when_the_callback_raises(store):
+    store[1] = make_article(1)
+    version = store.version(1)
+
+    def fail(article):
+        article["title"] = "Jamais enregistré"
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        store.mutate(1, fail)
+    assert store[1] == make_article(1)
+    assert store.version(1) == version
+    store[2] = make_article(2)  # The store is still writable
+    assert store[2] == make_article(2)
+
+def test_versions_change_on_writes(store):
+    assert store.version(1) is None
+    empty = store.version()
+    store[1] = make_article(1)
+    store[2] = make_article(2)
+    first, second, whole = store.version(1), store.version(2), store.version()
+    assert whole != empty
+
+    store.mutate(1, lambda article: article.update(title="Nouveau titre"))
+    assert store.version(1) != first
+    assert store.version(2) == second
+    assert store.version() != whole
+
+    whole = store.version()
+    del store[2]
+    assert store.version(2) is None
+    assert store.version() != whole
+
+    store[2] = make_article(2)
+    assert store.version(2) not in (None, second)  # Never reused
+
+def test_page_walks_the_keyset_order(store):
+    # Same created_at for 2 and 10: ordered by numeric id, not by string
+    created_ats = {1: "2025-01-03", 2: "2025-01-01", 3: "2025-01-02", 10: "2025-01-01", 11: "2025-01-05"}
+    for article_id, created_at in created_ats.items():
+        store[article_id] = make_article(article_id, created_at=created_at)
+    expected = sorted(created_ats, key=lambda article_id: (created_ats[article_id], article_id))
+
+    for descending in (False, True):
+        seen, after = [], None
+        while True:
+            page = store.page(after=after, limit=2, descending=descending)
+            if not page:
+                break
+            seen.extend(article["id"] for _, article in page)
+            after = page[-1][0]
+        assert seen == (expected[::-1] if descending else expected)
+
+def test_page_follows_writes(store):
+    for article_id in (1, 2, 3):
+        store[article_id] = make_article(article_id)
+    assert [article["id"] for _, article in store.page()] == [1, 2, 3]
+    store[4] = make_article(4, created_at="2024-12-31T00:00:00")
+    del store[2]
+    store[3] = make_article(3, created_at="2026-01-01T00:00:00")
+    assert [article["id"] for _, article in store.page()] == [4, 1, 3]
+
+def test_light_reads_drop_heavy_fields(store):
+    store[1] = make_article(1)
+    light = {field: value for field, value in make_article(1).items() if field not in HEAVY_ARTICLE_FIELDS}
+    assert store.get_light(1) == light
+    assert store.get_light(2) is None
+    assert store.page(heavy=False) == [(store.page()[0][0], light)]
+
+def test_import_json_is_idempotent(open_store, tmp_path):
+    json_path = tmp_path / "articles_db.json"
+    json_path.write_text(json.dumps({str(i): make_article(i) for i in (1, 2, 3)}), encoding="utf-8")
+    store = open_store()
+    store[1] = make_article(1, title="Déjà dans le store")
+
+    assert store.import_json(str(json_path)) == 2
+    assert store[1]["title"] == "Déjà dans le store"
+    store.mutate(2, lambda article: article.update(title="Modifié après import"))
+    assert store.import_json(str(json_path)) == 0
+    store.close()
+
+    store = open_store()
+    assert store.import_json(str(json_path)) == 0
+    assert store[2]["title"] == "Modifié après import"
+    assert len(store) == 3
+    assert store.import_json(str(tmp_path / "missing.json")) == 0
+
+def test_journal_replays_after_a_torn_write(tmp_path):
+    path = str(tmp_path / "articles.json")
+    store = JournalArticleStore(path)
+    for article_id in (1, 2, 3):
+        store[article_id] = make_article(article_id)
+    del store[2]
+    store.close()
+    with open(f"{path}.journal", "ab") as f:
+        f.write(b'{"op":"put","id":"4","article":{"tit')  # Crash in the middle of an append
+
+    store = JournalArticleStore(path)
+    assert sorted(store, key=int) == ["1", "3"]
+    assert store.replayed == 4
+    store[4] = make_article(4)  # Appended on a new line
+    store.close()
+    store = JournalArticleStore(path)
+    assert sorted(store, key=int) == ["1", "3", "4"]
+    store.close()
+
+def test_journal_recovers_an_interrupted_compaction(tmp_path):
+    path = str(tmp_path / "articles.json")
+    store = JournalArticleStore(path)
+    store[1] = make_article(1)
+    store.compact()
+    store[2] = make_article(2)
+    store[1] = make_article(1, title="Nouveau titre")
+    store.close()
+    os.replace(f"{path}.journal", f"{path}.journal.old")  # Journal rotated, new snapshot never written
+    with open(f"{path}.journal", "wb") as f:
+        f.write(json.dumps({"op": "put", "id": "3", "article": make_article(3)}).encode("utf-8") + b"\n")
+
+    store = JournalArticleStore(path)
+    assert store[1]["title"] == "Nouveau titre"
+    assert sorted(store, key=int) == ["1", "2", "3"]
+    assert not os.path.exists(f"{path}.journal.old")
+    with open(path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    assert snapshot["1"]["title"] == "Nouveau titre" and "2" in snapshot
+    store.close()
+    store = JournalArticleStore(path)  # Replaying the journal over the new snapshot changes nothing
+    assert sorted(store, key=int) == ["1", "2", "3"]
+    store.close()
+
+def lazy_store_with_articles(path):
+    store = LazyArticleStore(path)
+    for article_id in (1, 2, 3):
+        store[article_id] = make_article(article_id)
+    store[1] = make_article(1, title="Nouveau titre")
+    del store[2]
+    store.close()
+
+@pytest.mark.parametrize("damage", ["missing", "other generation", "truncated"])
+def test_lazy_rebuilds_a_stale_index(tmp_path, damage):
+    path = str(tmp_path / "articles.jsonl")
+    lazy_store_with_articles(path)
+    index_path = f"{path}.index"
+    if damage == "missing":
+        os.remove(index_path)
+    elif damage == "other generation":
+        with open(index_path, "r+b") as f:
+            lines = f.readlines()
+            f.seek(0)
+            f.truncate()
+            f.writelines([b'{"generation": "other"}\n'] + lines[1:])
+    else:
+        with open(index_path, "rb") as f:
+            lines = f.readlines()
+        with open(index_path, "wb") as f:
+            f.writelines(lines[:2])  # Crash between the data and the index writes
+
+    store = LazyArticleStore(path)
+    assert sorted(store, key=int) == ["1", "3"]  # The tombstone keeps 2 deleted
+    assert store[1]["title"] == "Nouveau titre"
+    assert store.get_light(3)["title"] == "Article 3"
+    store.close()
+
+def test_lazy_compaction_keeps_the_current_articles(tmp_path):
+    path = str(tmp_path / "articles.jsonl")
+    lazy_store_with_articles(path)
+    store = LazyArticleStore(path)
+    size = os.path.getsize(path)
+    assert store.compact() > 0 and os.path.getsize(path) < size
+    store[4] = make_article(4)
+    store.close()
+    store = LazyArticleStore(path)
+    assert sorted(store, key=int) == ["1", "3", "4"]
+    assert store[1]["title"] == "Nouveau titre"
+    store.close()
+
+def test_lazy_damaged_header_keeps_articles(tmp_path):
+    path = str(tmp_path / "articles.jsonl")
+    store = LazyArticleStore(path)
+    for article_id in (1, 2, 3):
+        store[article_id] = make_article(article_id)
+    store.close()
+    with open(path, "r+b") as f:
+        f.write(b"#garbage#")  # Damage only the generation line
+
+    store = LazyArticleStore(path)
+    assert sorted(store, key=int) == ["1", "2", "3"]
+    assert store[2] == make_article(2)
+    store.close()
+
+    # Rewritten under a new, readable generation
+    assert LazyArticleStore._generation(path) is not None
+    store = LazyArticleStore(path)
+    assert len(store) == 3 and store.compactions == 0
+    store.close()
+
+def test_lazy_new_store_in_empty_file(tmp_path):
+    path = tmp_path / "articles.jsonl"
+    path.write_bytes(b"")
+    store = LazyArticleStore(str(path))
+    store[1] = make_article(1)
+    store.close()
+    store = LazyArticleStore(str(path))
+    assert store[1] == make_article(1)
+    store.close()
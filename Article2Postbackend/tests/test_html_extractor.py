@@ -0,0 +1,40 @@
+"""
+Main-content extraction in services.html_extractor.
+"""
+
+import pytest
+
+from services import html_extractor
+from services.html_extractor import extract_main_content
+
+PARAGRAPH = ("Le gouvernement a présenté mardi, après des mois de concertation, une réforme "
+             "qui modifie le calcul des pensions, l'âge de départ et la durée de cotisation. ")
+
+PAGE = f"""<html><body>
+<header><div class="site">Le Quotidien, édition du soir, tous les titres du jour</div></header>
+<{{root}}>
+  <header><h1>La réforme des retraites adoptée en commission parlementaire</h1>
+  <p class="chapo">Un texte qui change le calcul des pensions pour des millions de salariés.</p></header>
+  <p>{PARAGRAPH * 2}</p>
+  <p>{PARAGRAPH * 2}</p>
+</{{root}}>
+</body></html>"""
+
+@pytest.fixture(params=[True, False], ids=["lxml", "stdlib"])
+def parser_backend(request, monkeypatch):
+    if request.param and not html_extractor.LXML_AVAILABLE:
+        pytest.skip("lxml is not installed")
+    monkeypatch.setattr(html_extractor, "LXML_AVAILABLE", request.param)
+
+@pytest.mark.parametrize("root", ["article", "main"])
+def test_header_inside_content_root_is_kept(parser_backend, root):
+    text = extract_main_content(PAGE.format(root=root))
+    assert "La réforme des retraites adoptée en commission parlementaire" in text
+    assert "Un texte qui change le calcul des pensions" in text
+    assert "Le Quotidien" not in text
+
+def test_page_header_is_dropped(parser_backend):
+    text = extract_main_content(PAGE.format(root="div"))
+    assert "Le Quotidien" not in text
+    assert "La réforme des retraites adoptée" not in text
+    assert PARAGRAPH.strip() in text
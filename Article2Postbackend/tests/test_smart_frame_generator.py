@@ -0,0 +1,72 @@
+"""
+Pixel equivalence of the NumPy gradients in core.smart_frame_generator with
+the former per-pixel and per-row drawing loops.
+"""
+
+import random
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from core.smart_frame_generator import SmartFrameGenerator
+
+def legacy_gradient_background(width, height, color1, color2):
+    """Reference: the former create_gradient_background"""
+    image = Image.new('RGB', (width, height))
+    for y in range(height):
+        ratio = y / height
+        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
+        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
+        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+        for x in range(width):
+            image.putpixel((x, y), (r, g, b))
+    return image
+
+def legacy_text_zone(width, height, color):
+    """Reference: the text zone of the former _generate_new_frame (background, border, per-row alpha)"""
+    frame = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(frame)
+    text_zone_height = int(height * 0.35)
+    text_zone_y = height - text_zone_height
+    draw.rectangle([0, text_zone_y, width, height], fill=(*color, 240))
+    draw.rectangle([0, text_zone_y, width, text_zone_y + 4], fill=(76, 175, 80))
+    for i in range(text_zone_height):
+        alpha = int(240 - (i * 20 / text_zone_height))
+        alpha = max(200, min(240, alpha))
+        y_pos = text_zone_y + i
+        if y_pos < height:
+            draw.line([(0, y_pos), (width, y_pos)], fill=(*color, alpha))
+    return frame
+
+def text_zone(generator, width, height, color):
+    """The text zone as drawn by _generate_new_frame now (background, border, gradient paste)"""
+    frame = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(frame)
+    text_zone_height = int(height * 0.35)
+    text_zone_y = height - text_zone_height
+    draw.rectangle([0, text_zone_y, width, height], fill=(*color, 240))
+    draw.rectangle([0, text_zone_y, width, text_zone_y + 4], fill=(76, 175, 80))
+    if text_zone_height > 0:
+        frame.paste(generator.create_text_zone_gradient(width, text_zone_height), (0, text_zone_y))
+    return frame
+
+@pytest.fixture(scope="module")
+def generator():
+    return SmartFrameGenerator()
+
+def test_gradient_background_matches_legacy(generator):
+    rng = random.Random(11)
+    colors = list(generator.categories.values()) + [(0, 0, 0), (255, 255, 255), (1, 254, 127)]
+    for _ in range(12):
+        width, height = rng.randint(1, 120), rng.randint(1, 400)
+        color1, color2 = rng.choice(colors), rng.choice(colors)
+        assert np.array_equal(np.asarray(generator.create_gradient_background(width, height, color1, color2)),
+                              np.asarray(legacy_gradient_background(width, height, color1, color2))), \
+            (width, height, color1, color2)
+
+@pytest.mark.parametrize("height", list(range(1, 400, 7)) + [1080, 1350, 1920])
+def test_text_zone_matches_legacy(generator, height):
+    color = generator.colors["black_text_bg"]
+    assert np.array_equal(np.asarray(text_zone(generator, 64, height, color)),
+                          np.asarray(legacy_text_zone(64, height, color)))
@@ -0,0 +1,77 @@
+"""
+Equivalence of core.text_processor.fix_unicode with the former chained
+str.replace implementation, for every escape its table covered.
+"""
+
+import random
+
+import pytest
+
+from core.text_processor import fix_unicode
+
+# Code points of the former replacement table, in its order
+LEGACY_CODEPOINTS = [
+    0x00e9, 0x00e8, 0x00ea, 0x00e0, 0x00e2, 0x00f9, 0x00fb, 0x00ee, 0x00ef, 0x00e7, 0x0153, 0x00e6,
+    0x20ac, 0x00ab, 0x00bb, 0x2013, 0x2014, 0x2018, 0x201a, 0x201c, 0x201d, 0x201e, 0x2026, 0x2030,
+    0x0152, 0x00a0, 0x00b0, 0x00a3, 0x00a7, 0x00b7, 0x00bf, 0x00a9, 0x00ae, 0x2122, 0x00bc, 0x00bd,
+    0x00be, 0x00b1, 0x00d7, 0x00f7, 0x00a2, 0x00a5, 0x00ac, 0x00b6, 0x2022, 0x00f1, 0x00ed, 0x00f3,
+    0x00fa, 0x00fc, 0x00a1, 0x00e1, 0x00df, 0x00e4, 0x00f6, 0x00ec, 0x00f2, 0x0410, 0x0411, 0x0412,
+    0x0413, 0x0414, 0x0415, 0x0416, 0x0417, 0x0418, 0x0419, 0x041a, 0x041b, 0x041c, 0x041d, 0x041e,
+    0x041f, 0x0420, 0x0421, 0x0422, 0x0423, 0x0424, 0x0425, 0x0426, 0x0427, 0x0428, 0x0429, 0x042a,
+    0x042b, 0x042c, 0x042d, 0x042e, 0x042f, 0x0430, 0x0431, 0x0432, 0x0433, 0x0434, 0x0435, 0x0436,
+    0x0437, 0x0438, 0x0439, 0x043a, 0x043b, 0x043c, 0x043d, 0x043e, 0x043f, 0x0440, 0x0441, 0x0442,
+    0x0443, 0x0444, 0x0445, 0x0446, 0x0447, 0x0448, 0x0449, 0x044a, 0x044b, 0x044c, 0x044d, 0x044e,
+    0x044f, 0x0627, 0x064a, 0x0644, 0x062a, 0x0646, 0x0633, 0x0645, 0x0631, 0x0648, 0x0639, 0x062f,
+    0x0628, 0x0649, 0x0629, 0x062c, 0x0642, 0x0641, 0x062d, 0x0635, 0x0637, 0x0632, 0x0634, 0x063a,
+    0x062e, 0x0623, 0x0621, 0x0624, 0x0626, 0x0625, 0x0651, 0x0652, 0x064b, 0x064c, 0x064d, 0x064f,
+    0x0650, 0x064e, 0x0653, 0x0654, 0x0670, 0x0671, 0x0672, 0x0673, 0x0675, 0x0676, 0x0677, 0x0678,
+    0x0679, 0x067a, 0x067b, 0x067c, 0x067d, 0x067e, 0x067f, 0x0680, 0x0681, 0x0682, 0x0683, 0x0684,
+    0x0685, 0x0686, 0x0687, 0x0688, 0x0689, 0x068a, 0x068b, 0x068c, 0x068d, 0x068e, 0x068f, 0x0690,
+    0x0691, 0x0692, 0x0693, 0x0694, 0x0695, 0x0696, 0x0697, 0x0698, 0x0699, 0x069a, 0x069b, 0x069c,
+    0x069d, 0x069e, 0x069f, 0x06a0, 0x06a1, 0x06a2, 0x06a3, 0x06a4, 0x06a5, 0x06a6, 0x06a7, 0x06a8,
+    0x06a9, 0x06aa, 0x06ab, 0x06ac, 0x06ad, 0x06ae, 0x06af, 0x06b0, 0x06b1, 0x06b2, 0x06b3, 0x06b4,
+    0x06b5, 0x06b6, 0x06b7, 0x06b8, 0x06b9, 0x06ba, 0x06bb
+]
+
+# The former table mapped these to something else than chr(codepoint)
+LEGACY_OVERRIDES = {0x00a0: ' ', 0x201c: '"', 0x201d: '"'}
+
+# Quoting bug in the former table: '\\u2018' was replaced by a chunk of source
+# code (a triple-quoted string swallowed the next line) and '\\u2019' was never
+# replaced. The new decoder maps both to their characters, so they are excluded
+# from the equivalence check.
+LEGACY_BROKEN = {0x2018, 0x2019}
+
+LEGACY_REPLACEMENTS = [
+    ('\\u%04x' % codepoint, LEGACY_OVERRIDES.get(codepoint, chr(codepoint)))
+    for codepoint in LEGACY_CODEPOINTS
+    if codepoint not in LEGACY_BROKEN
+]
+
+def legacy_fix_unicode(text):
+    """Reference: one str.replace per table entry, like the former implementation"""
+    for escape, char in LEGACY_REPLACEMENTS:
+        text = text.replace(escape, char)
+    return text
+
+CODEPOINTS = [c for c in LEGACY_CODEPOINTS if c not in LEGACY_BROKEN]
+
+@pytest.mark.parametrize("codepoint", CODEPOINTS, ids=hex)
+def test_matches_legacy_for_each_escape(codepoint):
+    for sample in ('\\u%04x' % codepoint, 'a\\u%04xb' % codepoint, '\\\\u%04x' % codepoint):
+        assert fix_unicode(sample) == legacy_fix_unicode(sample)
+
+def test_matches_legacy_on_random_strings():
+    rng = random.Random(42)
+    pieces = ["x", " ", "\\", "u", "é", "00e9"]
+    for _ in range(5000):
+        sample = "".join(
+            rng.choice(pieces) if rng.random() < 0.6 else '\\u%04x' % rng.choice(CODEPOINTS)
+            for _ in range(30)
+        )
+        assert fix_unicode(sample) == legacy_fix_unicode(sample), sample
+
+def test_quotes_and_surrogate_pairs():
+    assert fix_unicode('\\u2018cit\\u00e9\\u2019') == '\u2018cité\u2019'
+    assert fix_unicode('\\ud83d\\ude00') == '\U0001f600'
+    assert fix_unicode('\\ud83d seul') == '\\ud83d seul'
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+
+class DiskCache:
+    """
+    Size-bounded LRU cache of JSON entries, stored one file per key.
+
+    The LRU order lives in memory and is rebuilt from the file modification
+    times on startup, so it survives restarts. Keys must be filesystem-safe
+    (e.g. hex digests). Values are dicts; with a TTL, the write time is
+    stored in them under STORED_AT_FIELD.
+    """
+
+    STORED_AT_FIELD = "_cache_stored_at"
+
+    def __init__(self, directory, max_bytes, max_entries=None, ttl=None):
+        """
+        Args:
+            directory (str): Directory holding the cache entries
+            max_bytes (int): Total size above which least recently used entries are evicted
+            max_entries (int, optional): Entry count above which least recently used entries are evicted
+            ttl (float, optional): Seconds after which an entry expires. None or 0: never
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries or None
+        self.ttl = ttl or None
+        self._lock = threading.Lock()
+        self._index = OrderedDict()  # key -> entry size in bytes, least recently used first
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load_index(self):
+        """Rebuild the LRU index from the entries already on disk"""
+        entries = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, filename))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, filename[:-len(".json")], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def get(self, key):
+        """
+        Get an entry and mark it as most recently used.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            dict or None: The cached value, or None on miss
+        """
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    value = json.load(f)
+                os.utime(path)  # Persist the LRU position
+            except (OSError, ValueError):
+                self._forget(key)
+                self.misses += 1
+                return None
+
+            stored_at = value.pop(self.STORED_AT_FIELD, None)
+            if self.ttl and stored_at is not None and time.time() - stored_at > self.ttl:
+                self._forget(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._index.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Store an entry, evicting least recently used entries if the cache grows too big.
+
+        Args:
+            key (str): Cache key
+            value (dict): JSON-serializable value
+        """
+        if self.ttl:
+            value = {**value, self.STORED_AT_FIELD: time.time()}
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self._lock:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)  # Atomic: readers never see a partial entry
+
+            self._total_bytes -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def delete(self, key):
+        """Remove an entry if present"""
+        with self._lock:
+            if key in self._index:
+                self._forget(key)
+
+    def _forget(self, key):
+        self._total_bytes -= self._index.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        # Never evict the entry that was just written, even if it alone exceeds the budget
+        while len(self._index) > 1 and (
+            self._total_bytes > self.max_bytes
+            or (self.max_entries and len(self._index) > self.max_entries)
+        ):
+            oldest_key = next(iter(self._index))
+            self._forget(oldest_key)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Entry count, size and hit/miss/eviction/expiration counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,171 @@
+"""
+HTTP revalidation and compression helpers.
+
+Strong ETags built from resource versions, If-None-Match handling (304
+Not Modified), and an ASGI middleware that compresses complete JSON bodies
+with brotli (when installed) or gzip. Streamed responses (NDJSON, files)
+are passed through untouched, chunk by chunk.
+"""
+
+import gzip
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# Content-Encoding values, in order of preference
+ENCODINGS = ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+
+# Media types worth compressing
+COMPRESSIBLE_TYPES = {"application/json"}
+
+def make_etag(*parts):
+    """
+    Build a strong ETag from the parts identifying a representation.
+
+    Args:
+        *parts: Resource name, id, version... (no double quotes)
+
+    Returns:
+        str: Quoted ETag, e.g. "article-12-57"
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+def match_etag(if_none_match, etag, accept_encoding=""):
+    """
+    Check an If-None-Match header against the current ETag of a resource.
+
+    The compression middleware suffixes the ETags of the bodies it encodes
+    ("x" becomes "x-gzip"). Such a variant only matches when it is the
+    encoding this request would get, so a cache never revalidates a
+    representation the client did not ask for.
+
+    Args:
+        if_none_match (str or None): Request header value
+        etag (str): Current ETag, as built by make_etag
+        accept_encoding (str): Request Accept-Encoding header value
+
+    Returns:
+        str or None: The client's matching tag, or None if nothing matches
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+    variants = {etag}
+    encoding = choose_encoding(accept_encoding)
+    if encoding is not None:
+        variants.add(f'{etag[:-1]}-{encoding}"')
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]  # If-None-Match uses the weak comparison
+        if tag in variants:
+            return tag
+    return None
+
+def not_modified(request, etag):
+    """
+    Build the 304 response for a conditional request whose ETag still matches.
+
+    Args:
+        request: Incoming request
+        etag (str): Current ETag of the requested resource
+
+    Returns:
+        Response or None: 304 Not Modified, or None if the body must be sent
+    """
+    tag = match_etag(request.headers.get("if-none-match"), etag, request.headers.get("accept-encoding", ""))
+    if tag is None:
+        return None
+    return Response(status_code=304, headers={"ETag": tag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"})
+
+def choose_encoding(accept_encoding):
+    """
+    Pick the preferred supported encoding of an Accept-Encoding header.
+
+    Returns:
+        str or None: "br", "gzip", or None for identity
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in ENCODINGS:
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+def compress(body, encoding, gzip_level=6, brotli_quality=5):
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+class CompressionMiddleware:
+    """
+    Compress JSON response bodies above a minimum size.
+
+    Only single-message bodies are compressed: a response sending its body
+    in several messages (StreamingResponse, FileResponse) is forwarded as it
+    comes, so NDJSON lines still reach the client one at a time.
+    """
+
+    def __init__(self, app, minimum_size=1024, gzip_level=6, brotli_quality=5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+
+        async def send_compressed(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message  # Held until the first body message tells if it is complete
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            media_type = headers.get("content-type", "").split(";")[0].strip()
+            if (message.get("more_body", False) or len(body) < self.minimum_size
+                    or media_type not in COMPRESSIBLE_TYPES or "content-encoding" in headers):
+                await send(start)
+                await send(message)
+                return
+
+            body = compress(body, encoding, self.gzip_level, self.brotli_quality)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and etag.startswith('"'):
+                headers["ETag"] = f'{etag[:-1]}-{encoding}"'  # Strong ETags are per encoded representation
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
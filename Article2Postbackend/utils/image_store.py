@@ -0,0 +1,241 @@
+import os
+import json
+import uuid
+import hashlib
+import threading
+from PIL import Image
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+class ImageStore:
+    """
+    Content-addressed store of generated images.
+
+    Every image is written to a private work file first, then moved to a
+    blob named after the SHA-256 of its bytes, so concurrent jobs (threads or
+    uvicorn workers) never write to the same path and identical images are
+    stored once. Which blob an article uses for a given role (a bullet point,
+    a platform post) is recorded in a small per-article JSON manifest.
+
+    Blobs are never modified in place: an overlay or a new upload produces a
+    new blob and the manifest is pointed at it.
+    """
+
+    def __init__(self, directory, manifest_dir, work_dir):
+        """
+        Args:
+            directory (str): Directory holding the blobs (served as /static/img)
+            manifest_dir (str): Directory holding one manifest per article
+            work_dir (str): Directory for in-progress files
+        """
+        self.directory = directory
+        self.manifest_dir = manifest_dir
+        self.work_dir = work_dir
+        self._lock = threading.Lock()
+        self._manifest_locks = {}  # article id -> lock, so manifest updates don't interleave
+        self.stored = 0
+        self.deduplicated = 0
+
+    @staticmethod
+    def hash_file(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def blob_path(self, digest, extension=".jpg"):
+        return os.path.join(self.directory, f"{digest}{extension}")
+
+    def work_path(self, extension=".jpg"):
+        """
+        Get a unique path to write an image to before ingesting it.
+
+        The name never ends with digits before the extension, so the
+        image generator does not rename it to the point_XX.jpg convention.
+
+        Returns:
+            str: A path no other job uses
+        """
+        os.makedirs(self.work_dir, exist_ok=True)
+        return os.path.join(self.work_dir, f"{uuid.uuid4().hex}.work{extension}")
+
+    def ingest(self, path):
+        """
+        Move a finished image into the store.
+
+        Args:
+            path (str): The image file, which is consumed
+
+        Returns:
+            str: Path of the blob holding the image
+        """
+        extension = os.path.splitext(path)[1].lower() or ".jpg"
+        blob_path = self.blob_path(self.hash_file(path), extension)
+        os.makedirs(self.directory, exist_ok=True)
+
+        if os.path.exists(blob_path):
+            os.remove(path)
+            with self._lock:
+                self.deduplicated += 1
+        else:
+            # Same content, same name: a concurrent replace is harmless
+            os.replace(path, blob_path)
+            with self._lock:
+                self.stored += 1
+        return blob_path
+
+    def save_image(self, image, quality=95):
+        """
+        Encode a PIL image as JPEG and store it.
+
+        Args:
+            image (Image.Image): The image to store
+            quality (int): JPEG quality
+
+        Returns:
+            str: Path of the blob holding the image
+        """
+        work_path = self.work_path()
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        image.save(work_path, "JPEG", quality=quality)
+        return self.ingest(work_path)
+
+    def save_bytes(self, data, extension=".jpg"):
+        """
+        Store already-encoded image bytes.
+
+        Returns:
+            str: Path of the blob holding the image
+        """
+        work_path = self.work_path(extension)
+        with open(work_path, 'wb') as f:
+            f.write(data)
+        return self.ingest(work_path)
+
+    def resolve(self, image_path):
+        """
+        Get the file of an image path as stored in the articles.
+
+        Bullet points store either a full path or a bare file name
+        relative to the blob directory.
+
+        Returns:
+            str or None: An existing file path, or None
+        """
+        if not image_path:
+            return None
+        if os.path.exists(image_path):
+            return image_path
+        candidate = os.path.join(self.directory, os.path.basename(image_path))
+        return candidate if os.path.exists(candidate) else None
+
+    def _manifest_path(self, article_id):
+        return os.path.join(self.manifest_dir, f"{article_id}.json")
+
+    def _manifest_lock(self, article_id):
+        with self._lock:
+            return self._manifest_locks.setdefault(str(article_id), threading.Lock())
+
+    def load_manifest(self, article_id):
+        """
+        Get the images of an article.
+
+        Args:
+            article_id: The article id
+
+        Returns:
+            dict: Role (e.g. "point_01", "post_instagram") -> blob path
+        """
+        try:
+            with open(self._manifest_path(article_id), 'r', encoding='utf-8') as f:
+                return json.load(f).get("images", {})
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, article_id, images):
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        manifest_path = self._manifest_path(article_id)
+        tmp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"article_id": article_id, "images": images}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, manifest_path)
+
+    def record(self, article_id, role, blob_path):
+        """
+        Point a role of an article's manifest at a blob.
+
+        Args:
+            article_id: The article id
+            role (str): e.g. "point_01" or "post_instagram"
+            blob_path (str): A path returned by ingest() or save_image()
+        """
+        with self._manifest_lock(article_id):
+            images = self.load_manifest(article_id)
+            images[role] = blob_path
+            self._write_manifest(article_id, images)
+
+    def forget(self, article_id, role=None):
+        """
+        Remove a role (or, without role, every image) from an article's manifest.
+
+        Blobs are left in place, since other articles may share them.
+        """
+        with self._manifest_lock(article_id):
+            if role is None:
+                try:
+                    os.remove(self._manifest_path(article_id))
+                except OSError:
+                    pass
+                return
+            images = self.load_manifest(article_id)
+            if images.pop(role, None) is not None:
+                self._write_manifest(article_id, images)
+
+    def lookup(self, article_id, role):
+        """
+        Get the blob an article uses for a role.
+
+        Returns:
+            str or None: The blob path, or None if unset or missing on disk
+        """
+        blob_path = self.load_manifest(article_id).get(role)
+        return blob_path if blob_path and os.path.exists(blob_path) else None
+
+    def get_stats(self):
+        with self._lock:
+            return {"stored": self.stored, "deduplicated": self.deduplicated}
+
+def bullet_point_role(bullet_point_id):
+    return f"point_{int(bullet_point_id):02d}"
+
+def post_role(platform):
+    return f"post_{platform}"
+
+# Global image store instance
+image_store = ImageStore("cache/img", "cache/manifests", "cache/tmp")
+
+def store_image(image: Image.Image, article_id=None, role=None, quality=95):
+    """
+    Convenience function to store a PIL image, optionally recording it in an article's manifest
+
+    Returns:
+        str: Blob path
+    """
+    blob_path = image_store.save_image(image, quality)
+    if article_id is not None and role:
+        image_store.record(article_id, role, blob_path)
+    return blob_path
+
+def store_file(path, article_id=None, role=None):
+    """
+    Convenience function to ingest a finished image file, optionally recording it in an article's manifest
+
+    Returns:
+        str: Blob path
+    """
+    blob_path = image_store.ingest(path)
+    if article_id is not None and role:
+        image_store.record(article_id, role, blob_path)
+    return blob_path
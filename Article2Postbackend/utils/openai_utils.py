@@ -1,6 +1,6 @@
 import json
 import os
-import openai
+from services import openai_client
 from dotenv import load_dotenv
 # Function get_image_generation_prompt removed - using direct prompts now
 from prompts.openai_summarization_prompt import get_openai_summarization_prompt
@@ -8,15 +8,14 @@ from prompts.openai_summarization_prompt import get_openai_summarization_prompt
 # Load environment variables
 load_dotenv()
 
-# We'll initialize the client in each function to ensure we get the latest API key
 def get_openai_client():
     """
-    Get an OpenAI client with the API key from environment
+    Get the shared OpenAI client (see services.openai_client.get_openai_client)
     
     Returns:
-        OpenAI: Initialized OpenAI client
+        OpenAI: Process-wide OpenAI client
     """
-    return openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return openai_client.get_openai_client()
 
 def generate_image_prompt(bullet_point, article_text):
     """
@@ -0,0 +1,95 @@
+"""
+Chunked text-cleaning pipeline.
+
+Fixes the encoding issues of article text (replacement characters, NFKD
+normalization, control characters) chunk by chunk, so that multi-megabyte
+inputs never go through several whole-string copies.
+"""
+
+import re
+import unicodedata
+
+# Size of the chunks processed at once
+CLEAN_CHUNK_SIZE = 64 * 1024
+
+# C0/C1 control characters, removed after normalization
+CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x1F\x7F-\x9F]')
+
+def iter_text_chunks(text, chunk_size=CLEAN_CHUNK_SIZE):
+    """
+    Split a string into chunks of at most chunk_size characters.
+
+    Args:
+        text (str): The text to split
+        chunk_size (int): Maximum chunk length
+
+    Yields:
+        str: Consecutive slices of the text
+    """
+    for start in range(0, len(text), chunk_size):
+        yield text[start:start + chunk_size]
+
+def _is_safe_boundary(char):
+    """Whether NFKD never reorders or combines across a split made just before this character"""
+    if unicodedata.combining(char):
+        return False
+    decomposed = unicodedata.normalize('NFKD', char)
+    return not unicodedata.combining(decomposed[0])
+
+def _split_at_safe_boundary(chunk):
+    """
+    Split a chunk into a part that can be normalized now and a tail to carry over.
+
+    The tail starts at the last starter character, so that combining marks at
+    the start of the next chunk stay with their base character.
+    """
+    for index in range(len(chunk) - 1, max(len(chunk) - 64, 0) - 1, -1):
+        if _is_safe_boundary(chunk[index]):
+            return chunk[:index], chunk[index:]
+    # Long run of combining marks: no safe boundary nearby, keep it whole
+    return "", chunk
+
+def _clean_piece(piece):
+    if not piece.isascii():
+        piece = unicodedata.normalize('NFKD', piece.replace('\ufffd', ' '))
+    return CONTROL_CHARS_PATTERN.sub('', piece)
+
+def iter_clean_chunks(chunks):
+    """
+    Clean a stream of text chunks.
+
+    Each chunk is NFKD-normalized, its replacement characters turned into
+    spaces and its control characters removed. Characters near the end of a
+    chunk are held back until the next one, so the result does not depend
+    on where the chunks were cut.
+
+    Args:
+        chunks (Iterable[str]): The text, in chunks
+
+    Yields:
+        str: Cleaned chunks
+    """
+    carry = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        ready, carry = _split_at_safe_boundary(carry + chunk)
+        if ready:
+            yield _clean_piece(ready)
+    if carry:
+        yield _clean_piece(carry)
+
+def clean_text(text, chunk_size=CLEAN_CHUNK_SIZE):
+    """
+    Clean text with encoding issues like replacement characters.
+
+    Args:
+        text (str): The text with potential encoding issues
+        chunk_size (int): Chunk length used by the pipeline
+
+    Returns:
+        str: Cleaned text
+    """
+    if not text:
+        return ""
+    return "".join(iter_clean_chunks(iter_text_chunks(text, chunk_size)))
@@ -88,15 +88,23 @@ export const articleApi = {
     return response.data;
   },
   
-  // Get all articles
-  getArticles: async () => {
+  // Get all articles, following the pages of the listing (cursor in the X-Next-Cursor header)
+  getArticles: async (fields?: string[]) => {
     if (!ENABLE_BACKEND_API) {
       await new Promise(resolve => setTimeout(resolve, 500));
       return [mockArticleResponse];
     }
     
-    const response = await api.get('/articles/');
-    return response.data;
+    const articles = [];
+    let cursor: string | undefined;
+    do {
+      const response = await api.get('/articles/', {
+        params: { limit: 200, cursor, fields: fields?.join(',') },
+      });
+      articles.push(...response.data);
+      cursor = response.headers['x-next-cursor'];
+    } while (cursor);
+    return articles;
   }
 };
 